@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Candidate Ingestion Benchmark Entry Point
+
+Writes a synthetic corpus of candidate JSON files (variations of the samples in
+data/input) and times turning them into Candidate objects:
+
+- legacy:  the former path, two json.load calls per file, a deepcopy of the
+           dict and a jsonschema.validate call (schema re-checked every time)
+- fast:    CandidateFactory.from_json_file_to_candidate, one read, the
+           json_codec decoder, copy-on-write normalization and the compiled
+           validator (validation cache disabled)
+- cached:  the fast path with a warm ValidationCache, as on a reindex of
+           unchanged files
+
+A decode-only comparison of json and orjson (when installed) is reported too.
+Run from the repository root so config/common.yaml resolves.
+
+Usage:
+    python benchmarks/run_ingest_benchmark.py --files 5000
+"""
+
+import argparse
+import copy
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src" / "python"))
+
+import jsonschema
+
+from core.application.services.candidate_factory import CandidateFactory
+from core.application.services.schema_validation_service import SchemaValidationService, ValidationCache
+from core.domain.entities.candidate import Candidate
+from core.infrastructure.shared import json_codec
+from core.infrastructure.shared.config_loader import get_config
+
+
+DEFAULT_FILES = 5000
+DEFAULT_REPEATS = 3
+DEFAULT_SEED = 42
+JSON_FILE_PATTERN = "*.json"
+CACHE_FILE = "schema_validation.json"
+SEPARATOR_WIDTH = 70
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark candidate JSON ingestion")
+    parser.add_argument("--files", type=int, default=DEFAULT_FILES, help="Number of synthetic candidate files")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="Timed passes per mode (best is reported)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--work-dir", default=None, help="Directory for the corpus (default: temporary)")
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    return parser.parse_args()
+
+
+def _write_corpus(target: Path, count: int, seed: int) -> list[Path]:
+    rng = random.Random(seed)
+    samples = [json.loads(path.read_bytes()) for path in sorted(get_config().get_input_dir().glob(JSON_FILE_PATTERN))]
+    if not samples:
+        raise SystemExit("No sample candidates found in the input directory")
+
+    paths = []
+    for index in range(count):
+        data = copy.deepcopy(samples[index % len(samples)])
+        general_info = data.get("GeneralInfo") or {}
+        general_info["CandidateId"] = f"synthetic-{index:06d}"
+        if general_info.get("Fullname"):
+            general_info["Fullname"] = f"{general_info['Fullname']} {index}"
+        if isinstance(general_info.get("YearsExperience"), (int, float)):
+            general_info["YearsExperience"] = rng.randint(0, 25)
+        if isinstance(data.get("SkillMatrix"), list):
+            rng.shuffle(data["SkillMatrix"])
+
+        path = target / f"candidate_{index:06d}.json"
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _legacy_load(factory: CandidateFactory, schema: dict, path: Path) -> Candidate:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    filtered = factory._filter_comment_fields(copy.deepcopy(data))
+    jsonschema.validate(filtered, schema)
+    record = factory.from_json(data)
+    with open(path, "r", encoding="utf-8") as f:
+        raw_data = json.load(f)
+    return factory.create_candidate(record, path.stem, raw_data)
+
+
+def _time_pass(paths: list[Path], load) -> float:
+    started = time.perf_counter()
+    for path in paths:
+        load(path)
+    return time.perf_counter() - started
+
+
+def _best_of(repeats: int, paths: list[Path], load) -> float:
+    return min(_time_pass(paths, load) for _ in range(repeats))
+
+
+def main():
+    args = _parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(args.work_dir or tmp)
+        corpus_dir = work_dir / "corpus"
+        corpus_dir.mkdir(parents=True, exist_ok=True)
+        paths = _write_corpus(corpus_dir, args.files, args.seed)
+        total_bytes = sum(path.stat().st_size for path in paths)
+
+        print("=" * SEPARATOR_WIDTH)
+        print("Candidate Ingestion Benchmark")
+        print("=" * SEPARATOR_WIDTH)
+        print(f"Files:   {len(paths):,} ({total_bytes / 1e6:.1f} MB)")
+        print(f"Decoder: {json_codec.decoder_name()}")
+        print("=" * SEPARATOR_WIDTH)
+
+        validator = SchemaValidationService()
+        unvalidated = CandidateFactory(validate_schema=False)
+        fast = CandidateFactory()
+        cache = ValidationCache(work_dir / CACHE_FILE, validator.fingerprint)
+        cached = CandidateFactory(validation_cache=cache)
+        # Warm the cache once so the timed passes only see hits
+        for path in paths:
+            cached.from_json_file(path)
+
+        modes = {
+            "legacy": lambda path: _legacy_load(unvalidated, validator._schema, path),
+            "fast": lambda path: fast.from_json_file_to_candidate(path, path.stem),
+            "cached": lambda path: cached.from_json_file_to_candidate(path, path.stem),
+        }
+        seconds = {name: _best_of(args.repeats, paths, load) for name, load in modes.items()}
+
+        payloads = [path.read_bytes() for path in paths]
+        decoders = {"json": json.loads}
+        if json_codec.orjson is not None:
+            decoders["orjson"] = json_codec.orjson.loads
+        decode_seconds = {
+            name: min(_time_pass(payloads, decode) for _ in range(args.repeats)) for name, decode in decoders.items()
+        }
+
+    baseline = seconds["legacy"]
+    print(f"{'Mode':<12}{'Total (s)':>12}{'Files/s':>12}{'MB/s':>10}{'Speedup':>10}")
+    for name, elapsed in seconds.items():
+        print(
+            f"{name:<12}{elapsed:>12.3f}{len(paths) / elapsed:>12,.0f}"
+            f"{total_bytes / 1e6 / elapsed:>10.1f}{baseline / elapsed:>9.1f}x"
+        )
+    print()
+    print(f"{'Decoder':<12}{'Total (s)':>12}{'MB/s':>10}")
+    for name, elapsed in decode_seconds.items():
+        print(f"{name:<12}{elapsed:>12.3f}{total_bytes / 1e6 / elapsed:>10.1f}")
+
+    if args.output:
+        result = {
+            "files": len(paths),
+            "bytes": total_bytes,
+            "decoder": json_codec.decoder_name(),
+            "seconds": seconds,
+            "decode_seconds": decode_seconds,
+            "median_file_bytes": statistics.median(len(payload) for payload in payloads),
+        }
+        Path(args.output).write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"\nSaved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
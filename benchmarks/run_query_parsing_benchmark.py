@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Query Parsing Microbenchmark Entry Point
+
+Times QueryParser.parse per query on a synthetic set of recruiter questions:
+
+- legacy:  the former path, one fresh \\b<token>\\b regex per technology synonym,
+           substring scans for seniority tokens and intent keywords, and the
+           five experience patterns tried in turn
+- engine:  QueryParsingEngine, compiled once from QueryParsingConfig, one
+           regex pass over the lowercased query
+
+Both parsers are run on every query first and any difference in the parsed
+result fails the run, so the numbers always compare equivalent work.
+
+Usage:
+    python benchmarks/run_query_parsing_benchmark.py --queries 2000
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src" / "python"))
+sys.path.insert(0, str(REPO_ROOT / "tests" / "python" / "parsing"))
+
+from core.application.services.query_parser import QueryParser
+from core.domain.configuration.query_parsing_config import DEFAULT_QUERY_PARSING_CONFIG
+from legacy_query_parser import LegacyParser, synthetic_queries
+
+
+DEFAULT_QUERIES = 2000
+DEFAULT_REPEATS = 5
+DEFAULT_SEED = 42
+SEPARATOR_WIDTH = 70
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark query parsing")
+    parser.add_argument("--queries", type=int, default=DEFAULT_QUERIES, help="Number of synthetic queries")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="Timed passes per parser (best is reported)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    return parser.parse_args()
+
+
+def _check_equivalent(legacy: LegacyParser, engine: QueryParser, queries: list[str]) -> None:
+    for query in queries:
+        expected, actual = legacy.parse(query), engine.parse(query)
+        if expected != actual:
+            raise SystemExit(f"Parsers disagree on {query!r}:\n  legacy: {expected}\n  engine: {actual}")
+
+
+def _time(parser, queries: list[str], repeats: int) -> float:
+    passes = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for query in queries:
+            parser.parse(query)
+        passes.append(time.perf_counter() - started)
+    return min(passes) / len(queries)
+
+
+def main() -> int:
+    args = _parse_args()
+    queries = synthetic_queries(args.queries, args.seed)
+
+    started = time.perf_counter()
+    engine = QueryParser()
+    compile_seconds = time.perf_counter() - started
+    legacy = LegacyParser(DEFAULT_QUERY_PARSING_CONFIG)
+
+    _check_equivalent(legacy, engine, queries)
+
+    legacy_seconds = _time(legacy, queries, args.repeats)
+    engine_seconds = _time(engine, queries, args.repeats)
+
+    print("=" * SEPARATOR_WIDTH)
+    print(f"Queries: {len(queries)} (mean {statistics.mean(len(q) for q in queries):.0f} chars), best of {args.repeats}")
+    print(f"Engine compile: {compile_seconds * 1e3:.2f} ms (once per QueryParser)")
+    print("-" * SEPARATOR_WIDTH)
+    print(f"{'parser':<10} {'us/query':>12} {'queries/s':>14}")
+    for name, seconds in (("legacy", legacy_seconds), ("engine", engine_seconds)):
+        print(f"{name:<10} {seconds * 1e6:>12.1f} {1 / seconds:>14,.0f}")
+    print("-" * SEPARATOR_WIDTH)
+    print(f"Speedup: {legacy_seconds / engine_seconds:.1f}x, results identical on all queries")
+    print("=" * SEPARATOR_WIDTH)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({
+            "queries": len(queries),
+            "compile_ms": compile_seconds * 1e3,
+            "legacy_us_per_query": legacy_seconds * 1e6,
+            "engine_us_per_query": engine_seconds * 1e6,
+        }, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Vector Provider Benchmark Entry Point
+
+Generates a synthetic candidate corpus, ingests it into every provider
+registered in VectorProviderFactory and measures build time, search latency
+percentiles (unfiltered and with MetadataFilterBuilder-style filters),
+recall@k against exact search and peak RSS.
+
+Qdrant runs against an in-process stand-in unless --qdrant-url is given.
+Run from the repository root so config/common.yaml resolves.
+
+Usage:
+    python benchmarks/run_vector_benchmark.py --sizes 1000,10000 --providers faiss,numpy
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src" / "python"))
+
+from core.infrastructure.shared.vector_provider_factory import VectorProviderFactory
+from vector_bench.report import save_report
+from vector_bench.runner import BenchmarkSettings, run_benchmarks, DEFAULT_QUERIES, DEFAULT_K, DEFAULT_BATCH_SIZE
+
+
+DEFAULT_SIZES = "1000,10000,100000,1000000"
+LIST_SEPARATOR = ","
+SEPARATOR_WIDTH = 70
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark vector storage providers")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated corpus sizes in chunks")
+    parser.add_argument("--providers", default=None, help="Comma-separated provider names (default: all registered)")
+    parser.add_argument("--queries", type=int, default=DEFAULT_QUERIES, help="Number of timed queries per run")
+    parser.add_argument("--k", type=int, default=DEFAULT_K, help="Results per query and recall cut-off")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Chunks per add_documents call")
+    parser.add_argument("--qdrant-url", default=None, help="Benchmark a real Qdrant server instead of the stand-in")
+    parser.add_argument("--work-dir", default=None, help="Directory for provider files (default: temporary)")
+    parser.add_argument("--output-dir", default=str(Path(__file__).parent / "results"))
+    return parser.parse_args()
+
+
+def _resolve_providers(value: str) -> list[str]:
+    available = VectorProviderFactory.get_available_providers()
+    if not value:
+        return available
+
+    providers = [name.strip().upper() for name in value.split(LIST_SEPARATOR) if name.strip()]
+    unknown = [name for name in providers if name not in available]
+    if unknown:
+        raise SystemExit(f"Unknown providers: {unknown}. Available: {available}")
+    return providers
+
+
+def main():
+    args = _parse_args()
+    settings = BenchmarkSettings(
+        sizes=[int(size) for size in args.sizes.split(LIST_SEPARATOR)],
+        providers=_resolve_providers(args.providers),
+        queries=args.queries,
+        k=args.k,
+        batch_size=args.batch_size,
+        qdrant_url=args.qdrant_url,
+        work_dir=args.work_dir,
+    )
+
+    print("=" * SEPARATOR_WIDTH)
+    print("Vector Provider Benchmark")
+    print("=" * SEPARATOR_WIDTH)
+    print(f"Providers: {', '.join(settings.providers)}")
+    print(f"Sizes:     {', '.join(f'{size:,}' for size in settings.sizes)}")
+    print(f"Queries:   {settings.queries} (k={settings.k})")
+    print("=" * SEPARATOR_WIDTH)
+
+    results = run_benchmarks(settings)
+    save_report(results, settings, Path(args.output_dir))
+
+
+if __name__ == "__main__":
+    main()
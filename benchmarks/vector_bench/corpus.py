@@ -0,0 +1,181 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from core.application.services.metadata_filter_builder import MetadataFilterBuilder
+from core.domain.configuration.vector_metadata_config import DEFAULT_VECTOR_METADATA_CONFIG
+from core.domain.entities.parsed_query import ParsedQuery
+from core.domain.enums.query_intent import QueryIntent
+from core.domain.enums.seniority_level import SeniorityLevel
+
+METADATA_CONFIG = DEFAULT_VECTOR_METADATA_CONFIG
+
+DEFAULT_DIMENSION = 384
+DEFAULT_SEED = 42
+DEFAULT_CLUSTERS = 64
+CHUNKS_PER_CANDIDATE = 20
+CLUSTER_NOISE = 0.35
+QUERY_NOISE = 0.25
+ZIPF_EXPONENT = 1.1
+QUERY_STREAM = 1_000_003
+MAX_YEARS_EXPERIENCE = 25
+MAX_TECHNOLOGIES_PER_QUERY = 2
+
+FIELD_CHUNK_ID = "chunk_id"
+CHUNK_ID_FORMAT = "chunk-{:08d}"
+CANDIDATE_ID_FORMAT = "cand-{:07d}"
+
+MODE_UNFILTERED = "unfiltered"
+MODE_TECHNOLOGY = "technology"
+MODE_SENIORITY = "seniority"
+QUERY_MODES = (MODE_UNFILTERED, MODE_TECHNOLOGY, MODE_SENIORITY)
+
+SKILLS = [
+    "Python", "JavaScript", "TypeScript", "Java", "C#", ".NET", "React", "Angular", "Vue",
+    "Node.js", "SQL", "PostgreSQL", "MongoDB", "Redis", "Docker", "Kubernetes", "AWS", "Azure",
+    "GCP", "Terraform", "Go", "Rust", "Kotlin", "Swift", "Scala", "Spark", "Kafka", "Django",
+    "FastAPI", "Flask", "Spring", "GraphQL", "Elasticsearch", "Pandas", "PyTorch", "TensorFlow",
+    "Linux", "Git", "CI/CD", "Selenium",
+]
+SKILL_LEVELS = ["Low", "Medium", "High", "Very High"]
+SKILL_LEVEL_WEIGHTS = [0.15, 0.35, 0.35, 0.15]
+INDUSTRIES = ["Finance", "Healthcare", "Retail", "Telecom", "Gaming", "Logistics", "Education", "Energy"]
+ENGLISH_LEVELS = ["A2", "B1", "B2", "C1", "C2"]
+ENGLISH_LEVEL_WEIGHTS = [0.05, 0.25, 0.4, 0.25, 0.05]
+SENIORITY_LEVELS = [level.value for level in SeniorityLevel]
+SENIORITY_WEIGHTS = [0.03, 0.2, 0.32, 0.28, 0.1, 0.04, 0.03]
+SENIORITY_MIN_YEARS = [0, 0, 2, 5, 7, 9, 9]
+
+
+def chunk_id_for(row: int) -> str:
+    return CHUNK_ID_FORMAT.format(row)
+
+
+class SyntheticCorpus:
+    def __init__(
+        self,
+        size: int,
+        dimension: int = DEFAULT_DIMENSION,
+        seed: int = DEFAULT_SEED,
+        clusters: int = DEFAULT_CLUSTERS
+    ):
+        self.size = size
+        self.dimension = dimension
+        self.seed = seed
+
+        rng = np.random.default_rng(seed)
+        self._centroids = self._normalize(rng.standard_normal((clusters, dimension)).astype(np.float32))
+
+        candidates = (size + CHUNKS_PER_CANDIDATE - 1) // CHUNKS_PER_CANDIDATE
+        self._seniority = rng.choice(len(SENIORITY_LEVELS), size=candidates, p=SENIORITY_WEIGHTS)
+        min_years = np.asarray(SENIORITY_MIN_YEARS)[self._seniority]
+        self._years = np.minimum(min_years + rng.integers(0, 6, size=candidates), MAX_YEARS_EXPERIENCE)
+        self._english = rng.choice(len(ENGLISH_LEVELS), size=candidates, p=ENGLISH_LEVEL_WEIGHTS)
+        self._industry = rng.integers(0, len(INDUSTRIES), size=candidates)
+
+        ranks = np.arange(1, len(SKILLS) + 1, dtype=np.float64)
+        popularity = ranks ** -ZIPF_EXPONENT
+        self._skill_popularity = popularity / popularity.sum()
+
+    def batches(self, batch_size: int) -> Iterator[Tuple[List[str], List[str], np.ndarray, List[Dict[str, Any]]]]:
+        for start in range(0, self.size, batch_size):
+            yield self.batch(start, min(start + batch_size, self.size))
+
+    def batch(self, start: int, end: int) -> Tuple[List[str], List[str], np.ndarray, List[Dict[str, Any]]]:
+        rng = np.random.default_rng([self.seed, start])
+        rows = np.arange(start, end)
+        candidate_rows = rows // CHUNKS_PER_CANDIDATE
+        is_profile = rows % CHUNKS_PER_CANDIDATE == 0
+
+        skills = rng.choice(len(SKILLS), size=len(rows), p=self._skill_popularity)
+        levels = rng.choice(len(SKILL_LEVELS), size=len(rows), p=SKILL_LEVEL_WEIGHTS)
+        clusters = np.where(is_profile, self._industry[candidate_rows], len(INDUSTRIES) + skills) % len(self._centroids)
+
+        noise = rng.standard_normal((len(rows), self.dimension)).astype(np.float32)
+        vectors = self._normalize(self._centroids[clusters] + CLUSTER_NOISE * noise)
+
+        ids, texts, metadata = [], [], []
+        for offset, row in enumerate(rows):
+            candidate = candidate_rows[offset]
+            meta = self._candidate_metadata(candidate)
+            meta[FIELD_CHUNK_ID] = chunk_id_for(int(row))
+
+            if is_profile[offset]:
+                meta[METADATA_CONFIG.FIELD_TYPE] = METADATA_CONFIG.TYPE_CANDIDATE
+                text = (
+                    f"{meta[METADATA_CONFIG.FIELD_FULLNAME]} is a {meta[METADATA_CONFIG.FIELD_SENIORITY_LEVEL]} engineer "
+                    f"with {meta[METADATA_CONFIG.FIELD_YEARS_EXPERIENCE]} years in {meta[METADATA_CONFIG.FIELD_MAIN_INDUSTRY]}."
+                )
+            else:
+                skill_name = SKILLS[skills[offset]]
+                skill_level = SKILL_LEVELS[levels[offset]]
+                meta[METADATA_CONFIG.FIELD_TYPE] = METADATA_CONFIG.TYPE_SKILL
+                meta[METADATA_CONFIG.FIELD_SKILL_NAME] = skill_name
+                meta[METADATA_CONFIG.FIELD_SKILL_LEVEL] = skill_level
+                text = f"{skill_name} ({skill_level})"
+
+            ids.append(meta[FIELD_CHUNK_ID])
+            texts.append(text)
+            metadata.append(meta)
+
+        return ids, texts, vectors, metadata
+
+    def queries(self, count: int) -> List[Tuple[str, np.ndarray, Optional[Dict[str, Any]]]]:
+        rng = np.random.default_rng([self.seed, QUERY_STREAM])
+        filter_builder = MetadataFilterBuilder(
+            candidate_id_field=METADATA_CONFIG.FIELD_CANDIDATE_ID,
+            seniority_field=METADATA_CONFIG.FIELD_SENIORITY_LEVEL,
+            years_experience_field=METADATA_CONFIG.FIELD_YEARS_EXPERIENCE,
+            skill_name_field=METADATA_CONFIG.FIELD_SKILL_NAME,
+            type_field=METADATA_CONFIG.FIELD_TYPE,
+            type_skill=METADATA_CONFIG.TYPE_SKILL
+        )
+
+        queries = []
+        for index in range(count):
+            mode = QUERY_MODES[index % len(QUERY_MODES)]
+            cluster = rng.integers(0, len(self._centroids))
+            noise = rng.standard_normal(self.dimension).astype(np.float32)
+            vector = self._normalize((self._centroids[cluster] + QUERY_NOISE * noise)[None, :])[0]
+            queries.append((mode, vector, self._query_filter(mode, rng, filter_builder)))
+        return queries
+
+    def _query_filter(self, mode: str, rng: np.random.Generator, filter_builder: MetadataFilterBuilder) -> Optional[Dict[str, Any]]:
+        if mode == MODE_TECHNOLOGY:
+            count = int(rng.integers(1, MAX_TECHNOLOGIES_PER_QUERY + 1))
+            picked = rng.choice(len(SKILLS), size=count, replace=False, p=self._skill_popularity)
+            parsed = self._parsed_query([SKILLS[i] for i in picked], None, None)
+            return filter_builder.build_technology_filters(parsed)
+
+        if mode == MODE_SENIORITY:
+            seniority = SeniorityLevel(SENIORITY_LEVELS[int(rng.integers(2, 5))])
+            parsed = self._parsed_query([], seniority, int(rng.integers(2, 8)))
+            conditions = filter_builder.build_candidate_filters(parsed)
+            return conditions[0] if len(conditions) == 1 else {"$and": conditions}
+
+        return None
+
+    def _parsed_query(self, technologies: List[str], seniority: Optional[SeniorityLevel], years: Optional[int]) -> ParsedQuery:
+        return ParsedQuery(
+            query_text="",
+            query_intent=QueryIntent.FIND_BEST,
+            required_technologies=technologies,
+            min_seniority_level=seniority,
+            min_years_experience=years
+        )
+
+    def _candidate_metadata(self, candidate: int) -> Dict[str, Any]:
+        candidate_id = CANDIDATE_ID_FORMAT.format(candidate)
+        return {
+            METADATA_CONFIG.FIELD_CANDIDATE_ID: candidate_id,
+            METADATA_CONFIG.FIELD_FULLNAME: f"Candidate {candidate}",
+            METADATA_CONFIG.FIELD_SENIORITY_LEVEL: SENIORITY_LEVELS[self._seniority[candidate]],
+            METADATA_CONFIG.FIELD_YEARS_EXPERIENCE: int(self._years[candidate]),
+            METADATA_CONFIG.FIELD_ENGLISH_LEVEL: ENGLISH_LEVELS[self._english[candidate]],
+            METADATA_CONFIG.FIELD_MAIN_INDUSTRY: INDUSTRIES[self._industry[candidate]],
+        }
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return (vectors / np.maximum(norms, 1e-12)).astype(np.float32)
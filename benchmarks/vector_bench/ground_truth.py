@@ -0,0 +1,50 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.infrastructure.vectorstores.metadata_filter import matches_filter
+from .corpus import SyntheticCorpus, chunk_id_for
+
+
+def exact_top_k(
+    corpus: SyntheticCorpus,
+    queries: List[Tuple[str, np.ndarray, Optional[Dict[str, Any]]]],
+    k: int,
+    batch_size: int
+) -> List[List[str]]:
+    """Brute-force filtered top-k over the whole corpus, streamed batch by batch."""
+    query_matrix = np.stack([vector for _, vector, _ in queries])
+    filter_keys = [_filter_key(qfilter) for _, _, qfilter in queries]
+    filters = {key: qfilter for key, (_, _, qfilter) in zip(filter_keys, queries)}
+
+    best_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+    best_rows = np.full((len(queries), k), -1, dtype=np.int64)
+
+    for start in range(0, corpus.size, batch_size):
+        end = min(start + batch_size, corpus.size)
+        _, _, vectors, metadata = corpus.batch(start, end)
+        scores = query_matrix @ vectors.T
+
+        masks = {
+            key: np.fromiter((matches_filter(meta, qfilter) for meta in metadata), dtype=bool, count=len(metadata))
+            for key, qfilter in filters.items()
+        }
+        for index, key in enumerate(filter_keys):
+            scores[index, ~masks[key]] = -np.inf
+
+        rows = np.broadcast_to(np.arange(start, end), scores.shape)
+        merged_scores = np.concatenate([best_scores, scores], axis=1)
+        merged_rows = np.concatenate([best_rows, rows], axis=1)
+        top = np.argpartition(-merged_scores, k - 1, axis=1)[:, :k]
+        best_scores = np.take_along_axis(merged_scores, top, axis=1)
+        best_rows = np.take_along_axis(merged_rows, top, axis=1)
+
+    truth = []
+    for scores, rows in zip(best_scores, best_rows):
+        truth.append([chunk_id_for(int(row)) for score, row in zip(scores, rows) if row >= 0 and np.isfinite(score)])
+    return truth
+
+
+def _filter_key(qfilter: Optional[Dict[str, Any]]) -> str:
+    return json.dumps(qfilter, sort_keys=True)
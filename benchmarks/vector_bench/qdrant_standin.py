@@ -0,0 +1,119 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from core.infrastructure.vectorstores.numpy_store.numpy_vector_store import NumpyVectorStore
+from core.infrastructure.vectorstores.qdrant.qdrant_rest import QdrantREST
+
+STANDIN_BASE_URL = "http://qdrant-standin"
+COLLECTIONS_PREFIX = "/collections/"
+POINTS_SUFFIX = "/points"
+SEARCH_SUFFIX = "/points/search"
+DELETE_SUFFIX = "/points/delete"
+DOCUMENT_KEY = "document"
+
+
+class QdrantStandIn:
+    """In-process replacement for the Qdrant REST API.
+
+    Answers the handful of endpoints QdrantREST calls through an httpx mock
+    transport, so the real Qdrant provider code path (request building, filter
+    conversion, payload mapping) is exercised without a running server. Points
+    are held in a NumpyVectorStore, so latencies describe the client overhead
+    plus exact search, not Qdrant's HNSW.
+    """
+
+    def __init__(self, base_dir: Path):
+        self._base_dir = Path(base_dir)
+        self._collections: Dict[str, NumpyVectorStore] = {}
+
+    def client(self) -> QdrantREST:
+        http = httpx.Client(base_url=STANDIN_BASE_URL, transport=httpx.MockTransport(self._handle))
+        return QdrantREST(base_url=STANDIN_BASE_URL, client=http)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if not path.startswith(COLLECTIONS_PREFIX):
+            return httpx.Response(404, json={"status": "not found"})
+
+        name = path[len(COLLECTIONS_PREFIX):].split("/", 1)[0]
+
+        if path.endswith(SEARCH_SUFFIX) and request.method == "POST":
+            return self._search(name, json.loads(request.content))
+        if path.endswith(DELETE_SUFFIX) and request.method == "POST":
+            return self._delete(name, json.loads(request.content))
+        if path.endswith(POINTS_SUFFIX) and request.method == "PUT":
+            return self._upsert(name, json.loads(request.content))
+        if request.method == "PUT":
+            self._collection(name)
+            return httpx.Response(200, json={"result": True})
+        if request.method == "DELETE":
+            store = self._collections.pop(name, None)
+            if store is None:
+                return httpx.Response(404, json={"status": "not found"})
+            store.drop_collection()
+            return httpx.Response(200, json={"result": True})
+        if request.method == "GET":
+            if name not in self._collections:
+                return httpx.Response(404, json={"status": "not found"})
+            return httpx.Response(200, json={"result": {"points_count": self._collections[name].count()}})
+
+        return httpx.Response(405, json={"status": "method not allowed"})
+
+    def _collection(self, name: str) -> NumpyVectorStore:
+        if name not in self._collections:
+            self._collections[name] = NumpyVectorStore(base_dir=self._base_dir, collection=name)
+        return self._collections[name]
+
+    def _upsert(self, name: str, body: Dict[str, Any]) -> httpx.Response:
+        store = self._collection(name)
+        points = body.get("points", [])
+        ids, vectors, documents, metadata = [], [], [], []
+        for point in points:
+            payload = dict(point.get("payload") or {})
+            ids.append(str(point.get("id")))
+            vectors.append(point["vector"])
+            documents.append(payload.pop(DOCUMENT_KEY, ""))
+            metadata.append(payload)
+        store.add_documents(documents, vectors, metadata, ids)
+        return httpx.Response(200, json={"result": {"status": "completed"}})
+
+    def _delete(self, name: str, body: Dict[str, Any]) -> httpx.Response:
+        if name not in self._collections:
+            return httpx.Response(404, json={"status": "not found"})
+
+        self._collections[name].delete_documents([str(pid) for pid in body.get("points", [])])
+        return httpx.Response(200, json={"result": {"status": "completed"}})
+
+    def _search(self, name: str, body: Dict[str, Any]) -> httpx.Response:
+        if name not in self._collections:
+            return httpx.Response(404, json={"status": "not found"})
+
+        results = self._collections[name].search(
+            body["vector"],
+            limit=body.get("limit", 10),
+            filter_metadata=self._to_metadata_filter(body.get("filter"))
+        )
+        hits = [
+            {"score": score, "payload": {DOCUMENT_KEY: text, **metadata}}
+            for text, metadata, score in results
+        ]
+        return httpx.Response(200, json={"result": hits})
+
+    def _to_metadata_filter(self, qfilter: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if not qfilter:
+            return None
+
+        conditions: List[Dict[str, Any]] = []
+        for condition in qfilter.get("must", []):
+            key = condition.get("key")
+            if "range" in condition:
+                conditions.append({key: {"$gte": condition["range"]["gte"]}})
+            elif "any" in condition.get("match", {}):
+                conditions.append({key: {"$in": condition["match"]["any"]}})
+            else:
+                conditions.append({key: condition["match"]["value"]})
+
+        return {"$and": conditions} if conditions else None
@@ -0,0 +1,72 @@
+import json
+import platform
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from .runner import BenchmarkSettings, ProviderResult, STATUS_OK
+
+JSON_FILENAME = "vector_benchmark_results.json"
+MARKDOWN_FILENAME = "vector_benchmark_report.md"
+FILE_ENCODING = "utf-8"
+MISSING_VALUE = "-"
+
+TABLE_HEADER = (
+    "| Provider | Chunks | Build (s) | Chunks/s | Peak RSS (MB) | Query set | p50 (ms) | p95 (ms) | p99 (ms) | Recall@k |\n"
+    "|----------|-------:|----------:|---------:|--------------:|-----------|---------:|---------:|---------:|---------:|\n"
+)
+
+
+def save_report(results: List[ProviderResult], settings: BenchmarkSettings, output_dir: Path) -> None:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    generated_at = datetime.now().isoformat(timespec="seconds")
+
+    data = {
+        "generated_at": generated_at,
+        "environment": {"python": platform.python_version(), "machine": platform.machine(), "system": platform.system()},
+        "settings": settings.__dict__,
+        "results": [result.to_dict() for result in results],
+    }
+    json_path = output_dir / JSON_FILENAME
+    with open(json_path, "w", encoding=FILE_ENCODING) as file:
+        json.dump(data, file, indent=2)
+
+    markdown_path = output_dir / MARKDOWN_FILENAME
+    with open(markdown_path, "w", encoding=FILE_ENCODING) as file:
+        file.write(generate_markdown(results, settings, generated_at))
+
+    print(f"\nResults saved to {output_dir}")
+    print(f"Report: {markdown_path}")
+    print(f"JSON: {json_path}")
+
+
+def generate_markdown(results: List[ProviderResult], settings: BenchmarkSettings, generated_at: str) -> str:
+    lines = [
+        "# Vector Provider Benchmark\n\n",
+        f"Generated: {generated_at}  \n",
+        f"Queries: {settings.queries}, k={settings.k}, dimension={settings.dimension}, ingest batch={settings.batch_size}, seed={settings.seed}\n\n",
+        "Recall@k is measured against brute-force search over the same filtered corpus. "
+        "Peak RSS is the high-water mark of the worker process that built and queried the index.\n\n",
+        TABLE_HEADER,
+    ]
+
+    failures = []
+    for result in results:
+        if result.status != STATUS_OK:
+            failures.append(result)
+            continue
+
+        for mode, summary in result.search.items():
+            recall = summary.get("recall_at_k")
+            lines.append(
+                f"| {result.provider} | {result.size:,} | {result.build_seconds:.2f} | {result.chunks_per_second:,.0f} "
+                f"| {result.peak_rss_mb:,.0f} | {mode} | {summary['p50_ms']:.2f} | {summary['p95_ms']:.2f} "
+                f"| {summary['p99_ms']:.2f} | {MISSING_VALUE if recall is None else f'{recall:.3f}'} |\n"
+            )
+
+    if failures:
+        lines.append("\n## Failed runs\n\n")
+        for result in failures:
+            lines.append(f"- {result.provider} @ {result.size:,} chunks: {result.error}\n")
+
+    return "".join(lines)
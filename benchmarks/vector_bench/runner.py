@@ -0,0 +1,228 @@
+import multiprocessing
+import queue
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import traceback
+import uuid
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from core.domain.enums.vector_provider_type import VectorProviderType
+from core.infrastructure.shared.vector_provider_factory import VectorProviderFactory
+from .corpus import SyntheticCorpus, FIELD_CHUNK_ID, QUERY_MODES
+from .ground_truth import exact_top_k
+
+DEFAULT_QUERIES = 300
+DEFAULT_K = 10
+DEFAULT_BATCH_SIZE = 10_000
+WARMUP_QUERIES = 5
+RESULT_POLL_SECONDS = 5.0
+PERCENTILES = (50, 95, 99)
+MS_PER_SECOND = 1000.0
+KB_PER_MB = 1024.0
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STANDIN_SUFFIX = " (stand-in)"
+BENCH_COLLECTION_PREFIX = "vector_bench"
+RUN_ID_LENGTH = 8
+
+
+@dataclass
+class BenchmarkSettings:
+    sizes: List[int]
+    providers: List[str]
+    queries: int = DEFAULT_QUERIES
+    k: int = DEFAULT_K
+    batch_size: int = DEFAULT_BATCH_SIZE
+    dimension: int = 384
+    seed: int = 42
+    qdrant_url: Optional[str] = None
+    work_dir: Optional[str] = None
+
+
+@dataclass
+class ProviderResult:
+    provider: str
+    size: int
+    status: str = STATUS_OK
+    error: Optional[str] = None
+    build_seconds: float = 0.0
+    chunks_per_second: float = 0.0
+    points: int = 0
+    baseline_rss_mb: float = 0.0
+    peak_rss_mb: float = 0.0
+    search: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def run_benchmarks(settings: BenchmarkSettings) -> List[ProviderResult]:
+    root = Path(settings.work_dir) if settings.work_dir else Path(tempfile.mkdtemp(prefix="vector_bench_"))
+    results = []
+    context = multiprocessing.get_context("spawn")
+
+    try:
+        for size in settings.sizes:
+            corpus = SyntheticCorpus(size, dimension=settings.dimension, seed=settings.seed)
+            queries = corpus.queries(settings.queries)
+
+            print(f"[BENCH] size={size}: computing exact top-{settings.k} for {len(queries)} queries")
+            truth = exact_top_k(corpus, queries, settings.k, settings.batch_size)
+
+            for provider in settings.providers:
+                print(f"[BENCH] size={size}: running {provider}")
+                run_dir = root / f"{provider.lower()}_{size}"
+                result = _run_isolated(context, provider, size, settings, truth, run_dir)
+                _print_result(result)
+                results.append(result)
+                shutil.rmtree(run_dir, ignore_errors=True)
+    finally:
+        if not settings.work_dir:
+            shutil.rmtree(root, ignore_errors=True)
+
+    return results
+
+
+def _run_isolated(context, provider: str, size: int, settings: BenchmarkSettings, truth, run_dir: Path) -> ProviderResult:
+    # One process per run so ru_maxrss is a per-provider peak, not the max over the whole suite
+    results_queue = context.Queue()
+    process = context.Process(target=_child_main, args=(provider, size, settings, truth, str(run_dir), results_queue))
+    process.start()
+
+    while True:
+        try:
+            result = results_queue.get(timeout=RESULT_POLL_SECONDS)
+            break
+        except queue.Empty:
+            if not process.is_alive():
+                result = ProviderResult(provider, size, STATUS_ERROR, f"worker exited with code {process.exitcode}")
+                break
+
+    process.join()
+    return result
+
+
+def _child_main(provider: str, size: int, settings: BenchmarkSettings, truth, run_dir: str, results_queue) -> None:
+    try:
+        result = _run_provider(provider, size, settings, truth, Path(run_dir))
+    except Exception as e:
+        traceback.print_exc()
+        result = ProviderResult(provider, size, STATUS_ERROR, f"{type(e).__name__}: {e}")
+    results_queue.put(result)
+
+
+def _run_provider(provider: str, size: int, settings: BenchmarkSettings, truth, run_dir: Path) -> ProviderResult:
+    run_dir.mkdir(parents=True, exist_ok=True)
+    # Never the configured collection: against a real server that would be the live index
+    collection = f"{BENCH_COLLECTION_PREFIX}_{size}_{uuid.uuid4().hex[:RUN_ID_LENGTH]}"
+    store, label = _create_store(provider, settings, run_dir, collection)
+    try:
+        return _measure(store, label, size, settings, truth)
+    finally:
+        store.drop_collection()
+
+
+def _measure(store, label: str, size: int, settings: BenchmarkSettings, truth) -> ProviderResult:
+    result = ProviderResult(label, size)
+
+    corpus = SyntheticCorpus(size, dimension=settings.dimension, seed=settings.seed)
+    queries = corpus.queries(settings.queries)
+    result.baseline_rss_mb = _peak_rss_mb()
+
+    build_seconds = 0.0
+    for ids, texts, vectors, metadata in corpus.batches(settings.batch_size):
+        embeddings = vectors.tolist()
+        started = time.perf_counter()
+        store.add_documents(texts, embeddings, metadata, ids)
+        build_seconds += time.perf_counter() - started
+
+    started = time.perf_counter()
+    store.flush()
+    build_seconds += time.perf_counter() - started
+
+    result.build_seconds = round(build_seconds, 3)
+    result.chunks_per_second = round(size / build_seconds, 1) if build_seconds else 0.0
+    result.points = store.count()
+
+    for _, vector, qfilter in queries[:WARMUP_QUERIES]:
+        store.search(vector.tolist(), settings.k, qfilter)
+
+    latencies = {mode: [] for mode in QUERY_MODES}
+    recalls = {mode: [] for mode in QUERY_MODES}
+    for (mode, vector, qfilter), expected in zip(queries, truth):
+        query_embedding = vector.tolist()
+        started = time.perf_counter()
+        hits = store.search(query_embedding, settings.k, qfilter)
+        latencies[mode].append((time.perf_counter() - started) * MS_PER_SECOND)
+
+        if expected:
+            found = {metadata.get(FIELD_CHUNK_ID) for _, metadata, _ in hits}
+            recalls[mode].append(len(found.intersection(expected)) / len(expected))
+
+    result.search = {mode: _summarize(latencies[mode], recalls[mode]) for mode in QUERY_MODES if latencies[mode]}
+    result.peak_rss_mb = _peak_rss_mb()
+    return result
+
+
+def _create_store(provider: str, settings: BenchmarkSettings, run_dir: Path, collection: str):
+    provider_type = VectorProviderType[provider]
+    provider_class = VectorProviderFactory.get_provider_class(provider_type)
+
+    if provider_type == VectorProviderType.QDRANT:
+        if settings.qdrant_url:
+            from core.infrastructure.vectorstores.qdrant.qdrant_rest import QdrantREST
+            return provider_class(qdrant=QdrantREST(base_url=settings.qdrant_url), collection=collection), provider
+
+        from .qdrant_standin import QdrantStandIn
+        return provider_class(qdrant=QdrantStandIn(run_dir).client(), collection=collection), provider + STANDIN_SUFFIX
+
+    if provider_type == VectorProviderType.NATIVE:
+        return provider_class(persist_directory=str(run_dir), collection=collection), provider
+
+    if provider_type in (VectorProviderType.FAISS, VectorProviderType.NUMPY):
+        return provider_class(base_dir=run_dir, collection=collection), provider
+
+    return provider_class(collection=collection), provider
+
+
+def _summarize(latencies: List[float], recalls: List[float]) -> Dict[str, float]:
+    summary = {f"p{p}_ms": round(float(np.percentile(latencies, p)), 3) for p in PERCENTILES}
+    summary["mean_ms"] = round(statistics.fmean(latencies), 3)
+    summary["recall_at_k"] = round(statistics.fmean(recalls), 4) if recalls else None
+    summary["queries"] = len(latencies)
+    return summary
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        import psutil
+        return round(psutil.Process().memory_info().peak_wset / KB_PER_MB / KB_PER_MB, 1)
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == "darwin":
+        peak /= KB_PER_MB
+    return round(peak / KB_PER_MB, 1)
+
+
+def _print_result(result: ProviderResult) -> None:
+    if result.status != STATUS_OK:
+        print(f"[BENCH]   {result.provider}: {result.error}")
+        return
+
+    print(f"[BENCH]   {result.provider}: build {result.build_seconds}s, peak RSS {result.peak_rss_mb} MB")
+    for mode, summary in result.search.items():
+        print(f"[BENCH]     {mode}: p50 {summary['p50_ms']} ms, p99 {summary['p99_ms']} ms, recall@k {summary['recall_at_k']}")
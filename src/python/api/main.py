@@ -1,60 +1,100 @@
-from pathlib import Path
+import asyncio
+import json
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from core.application.dtos.chat_request_dto import ChatRequestDto
 from core.application.dtos.chat_result import ChatResult
 from core.application.dtos.index_info import IndexInfo
+from core.application.dtos.index_job_status import IndexJobStatus
 from core.application.use_cases.ask_question_use_case import AskQuestionUseCase
 from core.application.use_cases.build_index_use_case import BuildIndexUseCase
-from core.application.services.candidate_service import CandidateService
+from core.application.services.index_job_runner import IndexJobRunner, STATUS_FAILED
+from core.application.services.index_progress import IndexProgress
 from core.infrastructure.embeddings.http_embeddings_client import HttpEmbeddingsClient
 from core.infrastructure.shared.vector_provider_factory import VectorProviderFactory
 from core.infrastructure.llm.llm_factory import create_llm_client
 from core.infrastructure.llm.adapters.structured_chat_adapter import StructuredChatAdapter
+from core.infrastructure.llm.cache.llm_response_cache import create_llm_response_cache
 from core.domain.entities.llm_justification_schema import LlmJustificationSchema
 from core.infrastructure.shared.config_loader import get_config
 
 APP_TITLE = "Candidate RAG (LangChain)"
 ROUTE_HEALTH = "/health"
 ROUTE_INDEX = "/index"
+ROUTE_INDEX_JOB = "/index/{job_id}"
 ROUTE_CHAT = "/chat"
+ROUTE_CHAT_STREAM = "/chat/stream"
+ROUTE_METRICS = "/metrics"
 STATUS_OK = "ok"
 ERROR_PREFIX = "LLM/Index error: "
+SSE_MEDIA_TYPE = "text/event-stream"
+SSE_EVENT_ERROR = "error"
 INPUT_SUBDIR = "input"
 
 cfg = get_config()
 
-app = FastAPI(title=APP_TITLE)
-
 embeddings_client = HttpEmbeddingsClient(base_url=cfg.get_embeddings_base_url())
 vector_store = VectorProviderFactory.create_provider()
 llm_client = create_llm_client()
-structured_llm_client = StructuredChatAdapter(llm_client, LlmJustificationSchema)
-candidate_service = CandidateService()
+structured_llm_client = StructuredChatAdapter(llm_client, LlmJustificationSchema, cache=create_llm_response_cache())
 
 ask_question_use_case = AskQuestionUseCase(embeddings_client, vector_store, structured_llm_client)
 build_index_use_case = BuildIndexUseCase(embeddings_client, vector_store)
 
 
+def _run_index_job(force: bool, progress: IndexProgress) -> IndexInfo:
+    # Runs on the job runner's thread with its own event loop, so /chat keeps the server loop
+    input_dir = cfg.get_data_root() / INPUT_SUBDIR
+    try:
+        return asyncio.run(build_index_use_case.execute_incremental(input_dir, force=force, progress=progress))
+    finally:
+        # Even a failed incremental build may have changed some chunks
+        ask_question_use_case.on_index_changed()
+
+
+index_job_runner = IndexJobRunner(_run_index_job)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    index_job_runner.shutdown()
+
+
+app = FastAPI(title=APP_TITLE, lifespan=lifespan)
+
+
 @app.get(ROUTE_HEALTH)
 def health():
     return {"status": STATUS_OK}
 
 
-@app.post(ROUTE_INDEX)
-async def index():
-    try:
-        data_dir = cfg.get_data_root()
-        input_dir = data_dir / INPUT_SUBDIR
-        
-        candidates = candidate_service.load_candidates_from_directory(input_dir)
-        info = await build_index_use_case.execute(candidates)
-        
-        result = {"indexed": info.dict()}
-        return result
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"{ERROR_PREFIX}{e}")
+@app.get(ROUTE_METRICS)
+def metrics():
+    return {**ask_question_use_case.metrics(), "llm_cache": structured_llm_client.cache_stats()}
+
+
+@app.post(ROUTE_INDEX, response_model=IndexJobStatus, status_code=202)
+def index(full: bool = False, wait: bool = False):
+    # 202 + job status to poll on /index/{job_id}; wait=true blocks and answers {"indexed": IndexInfo} as before
+    job = index_job_runner.submit(force=full)
+    if not wait:
+        return job.to_status()
+
+    job.done.wait()
+    if job.status == STATUS_FAILED:
+        raise HTTPException(status_code=500, detail=f"{ERROR_PREFIX}{job.error}")
+    return JSONResponse(content={"indexed": jsonable_encoder(job.result)})
+
+
+@app.get(ROUTE_INDEX_JOB, response_model=IndexJobStatus)
+def index_job(job_id: str):
+    job = index_job_runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown index job: {job_id}")
+    return job.to_status()
 
 
 @app.post(ROUTE_CHAT, response_model=ChatResult)
@@ -64,3 +104,25 @@ async def chat(req: ChatRequestDto):
         return result
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"{ERROR_PREFIX}{e}")
+
+
+@app.post(ROUTE_CHAT_STREAM)
+async def chat_stream(req: ChatRequestDto):
+    return StreamingResponse(
+        _chat_events(req),
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _chat_events(req: ChatRequestDto):
+    # Errors after the first byte can't change the status code, so they are reported as an event
+    try:
+        async for event, payload in ask_question_use_case.stream(req):
+            yield _sse(event, payload)
+    except Exception as e:
+        yield _sse(SSE_EVENT_ERROR, {"detail": f"{ERROR_PREFIX}{e}"})
+
+
+def _sse(event: str, payload) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
@@ -2,8 +2,10 @@ from pydantic import BaseModel
 from typing import Optional
 
 from .chat_filters import ChatFilters
+from ...domain.enums.chat_mode import ChatMode
 
 
 class ChatRequestDto(BaseModel):
     question: str
-    filters: Optional[ChatFilters] = None
\ No newline at end of file
+    filters: Optional[ChatFilters] = None
+    mode: ChatMode = ChatMode.AUTO
\ No newline at end of file
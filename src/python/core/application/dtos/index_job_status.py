@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from typing import Optional, Dict, Any
+
+from .index_info import IndexInfo
+
+
+class IndexJobStatus(BaseModel):
+    job_id: str
+    status: str
+    force: bool = False
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    progress: Dict[str, Any] = {}
+    result: Optional[IndexInfo] = None
+    error: Optional[str] = None
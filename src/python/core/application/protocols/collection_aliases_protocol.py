@@ -0,0 +1,33 @@
+from typing import Protocol, List, Optional
+
+
+class CollectionAliases(Protocol):
+    """Maps a logical collection name to versioned physical collections.
+
+    Blue/green rebuilds allocate the next version, fill it, then switch() the
+    alias to it in one step.
+    """
+
+    alias: str
+
+    def current(self) -> Optional[str]:
+        ...
+
+    def versions(self) -> List[str]:
+        ...
+
+    def allocate(self) -> str:
+        ...
+
+    def switch(self, collection: str) -> None:
+        ...
+
+    def forget(self, collection: str) -> None:
+        ...
+
+    def resolve(self) -> str:
+        ...
+
+    def version_token(self) -> Optional[int]:
+        # Changes whenever another process may have switched the alias; None when the backend resolves it itself
+        ...
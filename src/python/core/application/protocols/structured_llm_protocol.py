@@ -1,6 +1,6 @@
 """Protocol for structured LLM clients that return typed objects."""
 
-from typing import Protocol, TypeVar, Generic
+from typing import AsyncIterator, Protocol, TypeVar, Generic, Union
 from dataclasses import dataclass
 
 
@@ -15,6 +15,12 @@ class ChatContext:
     context: str | None = None
 
 
+@dataclass(frozen=True)
+class StreamReset:
+    """Streamed text so far is discarded; a corrective attempt replaces it."""
+    attempt: int
+
+
 class StructuredLlmClient(Protocol, Generic[T]):
     """
     Protocol for LLM clients that return structured, typed outputs.
@@ -40,3 +46,20 @@ class StructuredLlmClient(Protocol, Generic[T]):
             LlmOutputValidationError: If output cannot be parsed
         """
         ...
+    
+    def astream_structured(self, chat_context: ChatContext) -> AsyncIterator[Union[str, StreamReset, T]]:
+        """
+        Stream the raw LLM text while it is generated, then the structured result.
+        
+        Args:
+            chat_context: Prompt context
+            
+        Yields:
+            Text deltas (str), a StreamReset before any retry that discards
+            the deltas so far, then exactly one deserialized object of type T
+            as the last item
+            
+        Raises:
+            LlmOutputValidationError: If output cannot be parsed
+        """
+        ...
@@ -1,4 +1,4 @@
-from typing import Protocol, List, Dict, Any
+from typing import Protocol, List, Dict, Any, Iterator, Tuple
 from langchain_core.documents import Document
 
 
@@ -6,5 +6,21 @@ class VectorProvider(Protocol):
     def get_provider_name(self) -> str:
         ...
     
+    @property
+    def collection_name(self) -> str:
+        ...
+    
     def index_documents(self, documents: List[Document]) -> Dict[str, Any]:
         ...
+    
+    def delete_documents(self, ids: List[str]) -> int:
+        ...
+    
+    def flush(self) -> None:
+        ...
+    
+    def drop_collection(self) -> None:
+        ...
+    
+    def export_points(self, batch_size: int) -> Iterator[Tuple[List[str], Any, List[str], List[Dict[str, Any]]]]:
+        ...
@@ -0,0 +1,66 @@
+import time
+from typing import Any, Callable, Dict
+
+from ...infrastructure.shared.config_loader import get_config
+from ...infrastructure.vectorstores.aliased_vector_store import AliasedVectorStore
+
+CONFIG_VECTOR_STORAGE = "vector_storage"
+CONFIG_BLUE_GREEN = "blue_green"
+CONFIG_VERIFY_TIMEOUT = "verify_timeout_seconds"
+DEFAULT_VERIFY_TIMEOUT = 30.0
+VERIFY_POLL_SECONDS = 0.5
+CHUNKS_INDEXED_KEY = "chunks_indexed"
+COLLECTION_KEY = "collection"
+
+
+class BlueGreenRebuild:
+    """Runs a full rebuild into a new collection version and switches the alias once it checks out.
+
+    Queries keep hitting the current version for the whole build. The new
+    version is promoted only when it holds exactly the chunks its manifest
+    lists; otherwise it is dropped and the error propagates.
+    """
+
+    def __init__(self, store: AliasedVectorStore):
+        self._store = store
+        self._verify_timeout = configured_verify_timeout()
+
+    def run(self, index: Callable[[Any], Dict[str, Any]]) -> Dict[str, Any]:
+        staging = self._store.create_version()
+        print(f"[BLUE_GREEN] Rebuilding into {staging.collection_name}")
+        try:
+            result = index(staging)
+            self._verify(staging, result[CHUNKS_INDEXED_KEY])
+        except BaseException:
+            print(f"[BLUE_GREEN] Rebuild failed, dropping {staging.collection_name}")
+            self._store.discard(staging)
+            raise
+
+        self._store.promote(staging)
+        return {**result, COLLECTION_KEY: staging.collection_name}
+
+    def _verify(self, staging, expected: int) -> None:
+        verify_point_count(staging, expected, self._verify_timeout)
+
+
+def configured_verify_timeout() -> float:
+    blue_green = (get_config().raw.get(CONFIG_VECTOR_STORAGE, {}) or {}).get(CONFIG_BLUE_GREEN, {}) or {}
+    return float(blue_green.get(CONFIG_VERIFY_TIMEOUT, DEFAULT_VERIFY_TIMEOUT))
+
+
+def verify_point_count(store, expected: int, timeout: float = DEFAULT_VERIFY_TIMEOUT) -> None:
+    """Raises unless store holds exactly expected points (and at least one) within timeout seconds."""
+    if expected == 0:
+        raise RuntimeError(f"Refusing to switch to {store.collection_name}: nothing was indexed")
+
+    # Some backends apply writes asynchronously, so the count may trail the last upsert briefly
+    deadline = time.monotonic() + timeout
+    while True:
+        points = store.count()
+        if points == expected:
+            return
+        if time.monotonic() >= deadline:
+            raise RuntimeError(
+                f"{store.collection_name} holds {points} points, expected {expected}"
+            )
+        time.sleep(VERIFY_POLL_SECONDS)
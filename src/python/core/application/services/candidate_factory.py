@@ -1,9 +1,9 @@
-import copy
+import hashlib
 import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ...domain.entities.candidate import Candidate
 from ...domain.entities.candidate_record import (
@@ -13,7 +13,8 @@ from ...domain.entities.candidate_record import (
 from ...domain.enums.language_proficiency import LanguageProficiency as LanguageProficiencyEnum
 from ...domain.enums.overall_fit_level import OverallFitLevel as OverallFitLevelEnum
 from ...domain.enums.seniority_level import SeniorityLevel as SeniorityLevelEnum
-from .schema_validation_service import SchemaValidationService
+from ...infrastructure.shared import json_codec
+from .schema_validation_service import SchemaValidationService, ValidationCache
 
 
 DEFAULT_SCHEMA_VERSION = "1.0"
@@ -41,16 +42,16 @@ SENIORITY_PATTERNS = [
 
 class CandidateFactory:
 
-    def __init__(self, validate_schema: bool = True):
+    def __init__(self, validate_schema: bool = True, validation_cache: Optional[ValidationCache] = None):
         self.validate_schema = validate_schema
+        self.validation_cache = validation_cache if validate_schema else None
         if validate_schema:
             self.validator = SchemaValidationService()
     
-    def from_json(self, data: Dict[str, Any]) -> CandidateRecord:
+    def from_json(self, data: Dict[str, Any], content_hash: Optional[str] = None) -> CandidateRecord:
         if self.validate_schema:
-            filtered_data = self._filter_comment_fields(data)
-            if not self.validator.validate_json(filtered_data):
-                errors = self.validator.get_validation_errors(filtered_data)
+            errors = self._schema_errors(data, content_hash)
+            if errors:
                 raise ValueError(f"JSON data doesn't match schema: {errors}")
         
         return CandidateRecord(
@@ -72,14 +73,8 @@ class CandidateFactory:
         )
     
     def from_json_file(self, file_path: Union[str, Path]) -> CandidateRecord:
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"JSON file not found: {file_path}")
-
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        return self.from_json(data)
+        data, content_hash = self._read_json_file(file_path)
+        return self.from_json(data, content_hash)
     
     def create_candidate(self, candidate_record: CandidateRecord, candidate_id: str, raw_data: Optional[Dict[str, Any]] = None) -> Candidate:
         return Candidate.from_candidate_record(candidate_record, candidate_id, raw_data)
@@ -89,10 +84,10 @@ class CandidateFactory:
         return self.create_candidate(candidate_record, candidate_id, data)
     
     def from_json_file_to_candidate(self, file_path: Union[str, Path], candidate_id: str) -> Candidate:
-        candidate_record = self.from_json_file(file_path)
-        with open(file_path, 'r', encoding='utf-8') as f:
-            raw_data = json.load(f)
-        return self.create_candidate(candidate_record, candidate_id, raw_data)
+        # One read and one parse; the record and Candidate.raw share the parsed dict
+        data, content_hash = self._read_json_file(file_path)
+        candidate_record = self.from_json(data, content_hash)
+        return self.create_candidate(candidate_record, candidate_id, data)
     
     def to_json(self, resume_result: CandidateRecord) -> Dict[str, Any]:
         if self.validate_schema:
@@ -110,6 +105,28 @@ class CandidateFactory:
         with open(path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
     
+    def _read_json_file(self, file_path: Union[str, Path]) -> Tuple[Dict[str, Any], Optional[str]]:
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"JSON file not found: {file_path}")
+
+        raw = path.read_bytes()
+        content_hash = hashlib.sha256(raw).hexdigest() if self.validation_cache is not None else None
+        return json_codec.loads(raw), content_hash
+    
+    def _schema_errors(self, data: Dict[str, Any], content_hash: Optional[str]) -> List[str]:
+        # Files whose bytes were already validated against this schema are not validated again
+        if content_hash is not None and self.validation_cache is not None:
+            cached = self.validation_cache.get(content_hash)
+            if cached is not None:
+                return cached
+        
+        errors = self.validator.collect_errors(self._filter_comment_fields(data))
+        
+        if content_hash is not None and self.validation_cache is not None:
+            self.validation_cache.put(content_hash, errors)
+        return errors
+    
     def _parse_datetime(self, value: Optional[str]) -> Optional[datetime]:
         if not value:
             return None
@@ -247,25 +264,18 @@ class CandidateFactory:
             return None
     
     def _filter_comment_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        filtered_data = copy.deepcopy(data)
+        # Copy-on-write: only the containers that change are copied, the caller's dict stays untouched
+        filtered_data = dict(data)
         
-        if 'Scores' in filtered_data and isinstance(filtered_data['Scores'], dict):
-            scores = filtered_data['Scores']
-            comment_fields = [key for key in scores.keys() if key.endswith('Comment')]
-            for field in comment_fields:
-                del scores[field]
+        scores = filtered_data.get('Scores')
+        if isinstance(scores, dict) and any(key.endswith('Comment') for key in scores):
+            filtered_data['Scores'] = {key: value for key, value in scores.items() if not key.endswith('Comment')}
         
-        if 'Languages' in filtered_data and isinstance(filtered_data['Languages'], list):
-            for lang in filtered_data['Languages']:
-                if isinstance(lang, dict) and 'Proficiency' in lang:
-                    proficiency = lang['Proficiency']
-                    if isinstance(proficiency, str):
-                        normalized = self._normalize_proficiency(proficiency)
-                        if normalized:
-                            lang['Proficiency'] = normalized
+        if isinstance(filtered_data.get('Languages'), list):
+            filtered_data['Languages'] = self._normalize_language_list(filtered_data['Languages'])
         
-        if 'GeneralInfo' in filtered_data and isinstance(filtered_data['GeneralInfo'], dict):
-            general_info = filtered_data['GeneralInfo']
+        if isinstance(filtered_data.get('GeneralInfo'), dict):
+            general_info = dict(filtered_data['GeneralInfo'])
             
             if 'SeniorityLevel' in general_info and isinstance(general_info['SeniorityLevel'], str):
                 normalized = self._normalize_seniority_level(general_info['SeniorityLevel'])
@@ -273,16 +283,22 @@ class CandidateFactory:
                     general_info['SeniorityLevel'] = normalized
             
             if 'OtherLanguages' in general_info and isinstance(general_info['OtherLanguages'], list):
-                for lang in general_info['OtherLanguages']:
-                    if isinstance(lang, dict) and 'Proficiency' in lang:
-                        proficiency = lang['Proficiency']
-                        if isinstance(proficiency, str):
-                            normalized = self._normalize_proficiency(proficiency)
-                            if normalized:
-                                lang['Proficiency'] = normalized
+                general_info['OtherLanguages'] = self._normalize_language_list(general_info['OtherLanguages'])
+            
+            filtered_data['GeneralInfo'] = general_info
         
         return filtered_data
     
+    def _normalize_language_list(self, languages: List[Any]) -> List[Any]:
+        normalized_languages = []
+        for lang in languages:
+            if isinstance(lang, dict) and isinstance(lang.get('Proficiency'), str):
+                normalized = self._normalize_proficiency(lang['Proficiency'])
+                if normalized and normalized != lang['Proficiency']:
+                    lang = {**lang, 'Proficiency': normalized}
+            normalized_languages.append(lang)
+        return normalized_languages
+    
     def _normalize_proficiency(self, value: str) -> Optional[str]:
         if not value:
             return None
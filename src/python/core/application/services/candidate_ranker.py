@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from ...domain.entities.ranked_candidate import RankedCandidate
 from ...domain.entities.parsed_query import ParsedQuery
 from ...domain.configuration.ranking_weights import RankingWeights
@@ -77,7 +77,7 @@ class CandidateRanker:
     def _calculate_technical_score(
         self, 
         candidate: AggregatedCandidate, 
-        required_technologies: List[str]
+        required_technologies: Sequence[str]
     ) -> float:
         if not required_technologies:
             return self._MAX_NORMALIZED_SCORE
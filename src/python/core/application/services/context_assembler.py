@@ -0,0 +1,216 @@
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from ...domain.configuration.vector_metadata_config import DEFAULT_VECTOR_METADATA_CONFIG
+from ...infrastructure.shared.config_loader import get_config
+
+METADATA_CONFIG = DEFAULT_VECTOR_METADATA_CONFIG
+
+CONFIG_CONTEXT_BUDGET = "context_budget"
+CONFIG_MAX_TOKENS = "max_tokens"
+CONFIG_RANK_DECAY = "rank_decay"
+CONFIG_MIN_OVERLAP_CHARS = "min_overlap_chars"
+CONFIG_MAX_OVERLAP_CHARS = "max_overlap_chars"
+CONFIG_MIN_TRUNCATED_TOKENS = "min_truncated_tokens"
+
+DEFAULT_MAX_TOKENS = 2000
+DEFAULT_RANK_DECAY = 0.7
+DEFAULT_MIN_OVERLAP_CHARS = 20
+DEFAULT_MAX_OVERLAP_CHARS = 200
+DEFAULT_MIN_TRUNCATED_TOKENS = 16
+
+CONTEXT_SEPARATOR = "\n\n"
+TRUNCATION_SUFFIX = "..."
+# Words are counted in pieces of up to 4 characters; BPE tokenizers rarely split English finer, so budgets hold
+TOKEN_PATTERN = re.compile(r"\w{1,4}|[^\w\s]")
+
+
+class TokenEstimator:
+    """Local, dependency-free token counter that errs on the high side of BPE tokenizers."""
+
+    def count(self, text: str) -> int:
+        return len(TOKEN_PATTERN.findall(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest prefix of text that counts as at most max_tokens tokens."""
+        if max_tokens <= 0:
+            return ""
+        end = 0
+        for count, match in enumerate(TOKEN_PATTERN.finditer(text), 1):
+            end = match.end()
+            if count == max_tokens:
+                break
+        return text[:end]
+
+
+@dataclass(frozen=True)
+class AssembledContext:
+    text: str
+    tokens: int
+    budget: Optional[int]
+    candidates: int
+    documents: int
+    duplicates_removed: int
+    documents_dropped: int
+    truncated: bool
+
+    def stats(self) -> dict:
+        return {
+            "tokens": self.tokens,
+            "budget": self.budget,
+            "candidates": self.candidates,
+            "documents": self.documents,
+            "duplicates_removed": self.duplicates_removed,
+            "documents_dropped": self.documents_dropped,
+            "truncated": self.truncated,
+        }
+
+
+class ContextAssembler:
+    """Builds the LLM context from ranked candidates within a token budget.
+
+    Each candidate's documents are first deduplicated: chunks contained in an
+    earlier chunk are dropped and the text overlapping an earlier chunk (the
+    splitter's chunk_overlap) is cut. Candidate headers always come first in
+    the budget, so every ranked candidate stays visible; if even the headers do
+    not fit, the lowest ranked candidates are left out. The rest is shared
+    by rank with weights rank_decay ** (rank - 1), and budget a candidate does
+    not need flows to the others. Within a candidate, documents keep their
+    retrieval order and the first one that no longer fits is truncated.
+    max_tokens <= 0 disables the budget (deduplication still applies).
+    """
+
+    def __init__(
+        self,
+        max_tokens: Optional[int] = None,
+        rank_decay: Optional[float] = None,
+        estimator: Optional[TokenEstimator] = None
+    ):
+        budget_config = get_config().raw.get(CONFIG_CONTEXT_BUDGET, {}) or {}
+        self._max_tokens = max_tokens if max_tokens is not None else int(budget_config.get(CONFIG_MAX_TOKENS, DEFAULT_MAX_TOKENS))
+        self._rank_decay = rank_decay if rank_decay is not None else float(budget_config.get(CONFIG_RANK_DECAY, DEFAULT_RANK_DECAY))
+        self._min_overlap = int(budget_config.get(CONFIG_MIN_OVERLAP_CHARS, DEFAULT_MIN_OVERLAP_CHARS))
+        self._max_overlap = int(budget_config.get(CONFIG_MAX_OVERLAP_CHARS, DEFAULT_MAX_OVERLAP_CHARS))
+        self._min_truncated_tokens = int(budget_config.get(CONFIG_MIN_TRUNCATED_TOKENS, DEFAULT_MIN_TRUNCATED_TOKENS))
+        self.estimator = estimator or TokenEstimator()
+
+    def assemble(self, ranked_candidates: Sequence) -> AssembledContext:
+        budget = self._max_tokens if self._max_tokens > 0 else None
+        separator_tokens = self.estimator.count(CONTEXT_SEPARATOR)
+        suffix_tokens = self.estimator.count(TRUNCATION_SUFFIX)
+
+        headers = []
+        documents = []
+        duplicates_removed = 0
+        for rank, candidate in enumerate(ranked_candidates, 1):
+            fullname = candidate.metadata.get(METADATA_CONFIG.FIELD_FULLNAME, candidate.candidate_id)
+            headers.append(f"=== CANDIDATE #{rank}: {fullname} (ID: {candidate.candidate_id}) ===")
+            unique = self._deduplicate(candidate.documents)
+            duplicates_removed += len(candidate.documents) - len(unique)
+            documents.append(unique)
+
+        included = len(headers)
+        header_tokens = [self.estimator.count(header) + separator_tokens for header in headers]
+        if budget is not None:
+            while included and sum(header_tokens[:included]) > budget:
+                included -= 1
+
+        doc_tokens = [[self.estimator.count(doc) + separator_tokens for doc in docs] for docs in documents[:included]]
+        if budget is None:
+            allowances = [sum(tokens) for tokens in doc_tokens]
+        else:
+            allowances = self._allocate(budget - sum(header_tokens[:included]), [sum(tokens) for tokens in doc_tokens])
+
+        parts = []
+        kept_documents = 0
+        truncated = False
+        for index in range(included):
+            parts.append(headers[index])
+            remaining = allowances[index]
+            for doc, tokens in zip(documents[index], doc_tokens[index]):
+                if tokens <= remaining:
+                    parts.append(doc)
+                    remaining -= tokens
+                    kept_documents += 1
+                    continue
+                room = remaining - separator_tokens - suffix_tokens
+                if room >= self._min_truncated_tokens:
+                    parts.append(self.estimator.truncate(doc, room) + TRUNCATION_SUFFIX)
+                    kept_documents += 1
+                    truncated = True
+                break
+            parts.append("")
+
+        text = CONTEXT_SEPARATOR.join(parts)
+        total_documents = sum(len(docs) for docs in documents)
+        return AssembledContext(
+            text=text,
+            tokens=self.estimator.count(text),
+            budget=budget,
+            candidates=included,
+            documents=kept_documents,
+            duplicates_removed=duplicates_removed,
+            documents_dropped=total_documents - kept_documents,
+            truncated=truncated
+        )
+
+    def _allocate(self, budget: int, demands: List[int]) -> List[int]:
+        """Splits budget by rank weight, capping each share at its demand and redistributing the surplus."""
+        allowances = [0] * len(demands)
+        open_indexes = [i for i, demand in enumerate(demands) if demand > 0]
+        remaining = max(budget, 0)
+        while remaining > 0 and open_indexes:
+            weights = {i: self._rank_decay ** i for i in open_indexes}
+            total_weight = sum(weights.values())
+            shares = {i: int(remaining * weights[i] / total_weight) for i in open_indexes}
+            # Rounding leftovers go to the best ranked candidate so the loop always makes progress
+            shares[open_indexes[0]] += remaining - sum(shares.values())
+            remaining = 0
+            still_open = []
+            for i in open_indexes:
+                need = demands[i] - allowances[i]
+                granted = min(shares[i], need)
+                allowances[i] += granted
+                remaining += shares[i] - granted
+                if granted < need:
+                    still_open.append(i)
+            if len(still_open) == len(open_indexes):
+                break
+            open_indexes = still_open
+        return allowances
+
+    def _deduplicate(self, documents: Sequence[str]) -> List[str]:
+        # Overlaps are found against the untrimmed chunks; trimmed text is what goes into the context
+        seen: List[str] = []
+        kept: List[str] = []
+        for document in documents:
+            text = document.strip()
+            if not text or any(text in previous for previous in seen):
+                continue
+            trimmed = text[self._prefix_overlap(text, seen):]
+            trimmed = trimmed[:len(trimmed) - self._suffix_overlap(trimmed, seen)].strip()
+            seen.append(text)
+            if trimmed:
+                kept.append(trimmed)
+        return kept
+
+    def _prefix_overlap(self, text: str, kept: List[str]) -> int:
+        """Length of the longest start of text that ends one of the kept chunks."""
+        best = 0
+        for previous in kept:
+            for size in range(min(self._max_overlap, len(text) - 1, len(previous)), max(self._min_overlap, best + 1) - 1, -1):
+                if previous.endswith(text[:size]):
+                    best = size
+                    break
+        return best
+
+    def _suffix_overlap(self, text: str, kept: List[str]) -> int:
+        """Length of the longest end of text that starts one of the kept chunks."""
+        best = 0
+        for previous in kept:
+            for size in range(min(self._max_overlap, len(text) - 1, len(previous)), max(self._min_overlap, best + 1) - 1, -1):
+                if previous.startswith(text[-size:]):
+                    best = size
+                    break
+        return best
@@ -0,0 +1,78 @@
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Callable, List
+
+import numpy as np
+
+DEFAULT_CAPACITY = 20000
+TEXT_ENCODING = "utf-8"
+VECTOR_DTYPE = np.float32
+WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_chunk_text(text: str) -> str:
+    # Only differences the embedding tokenizer cannot see; case and punctuation still count
+    return WHITESPACE.sub(" ", unicodedata.normalize("NFC", text or "")).strip()
+
+
+def text_key(text: str) -> bytes:
+    return hashlib.blake2b(normalize_chunk_text(text).encode(TEXT_ENCODING), digest_size=16).digest()
+
+
+class EmbeddingDedup:
+    """Embeds each distinct normalized text once per build and reuses the vector for every copy.
+
+    Duplicates inside a batch share one request slot; duplicates in later batches
+    hit a bounded LRU of recent vectors (capacity vectors, float32).
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._capacity = capacity
+        self._vectors: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.chunks = 0
+        self.embedded = 0
+
+    def embed(self, texts: List[str], embed_documents: Callable[[List[str]], List[List[float]]]) -> List[List[float]]:
+        keys = [text_key(text) for text in texts]
+        vectors = {}
+        missing = {}
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in vectors or key in missing:
+                    continue
+                cached = self._vectors.get(key)
+                if cached is not None:
+                    self._vectors.move_to_end(key)
+                    vectors[key] = cached
+                else:
+                    missing[key] = text
+
+        if missing:
+            embedded = embed_documents(list(missing.values()))
+            for key, vector in zip(missing, embedded):
+                vectors[key] = np.asarray(vector, dtype=VECTOR_DTYPE)
+
+        with self._lock:
+            for key in missing:
+                self._remember(key, vectors[key])
+            self.chunks += len(texts)
+            self.embedded += len(missing)
+
+        return [vectors[key].tolist() for key in keys]
+
+    @property
+    def ratio(self) -> float:
+        # Share of chunks that did not need their own embedding
+        return 1.0 - self.embedded / self.chunks if self.chunks else 0.0
+
+    def _remember(self, key: bytes, vector: np.ndarray) -> None:
+        if self._capacity <= 0:
+            return
+        self._vectors[key] = vector
+        self._vectors.move_to_end(key)
+        while len(self._vectors) > self._capacity:
+            self._vectors.popitem(last=False)
@@ -0,0 +1,138 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from langchain_core.documents import Document
+
+from .index_pipeline import IndexPipeline, CONFIG_INDEX_PIPELINE
+from .index_progress import IndexProgress
+from ...infrastructure.shared.config_loader import get_config
+from ...infrastructure.shared.index_manifest import IndexManifest, ManifestPlan
+
+CONFIG_LOAD_BATCH_SIZE = "load_batch_size"
+DEFAULT_LOAD_BATCH_SIZE = 256
+
+LoadOutcome = Tuple[Optional[List[Tuple[Document, str]]], Optional[str]]
+
+
+class IncrementalIndexService:
+    def __init__(
+        self,
+        vector_store,
+        embeddings_client,
+        manifest: IndexManifest,
+        pipeline: Optional[IndexPipeline] = None
+    ):
+        pipeline_config = get_config().raw.get(CONFIG_INDEX_PIPELINE, {}) or {}
+        self._vector_store = vector_store
+        self._manifest = manifest
+        self._pipeline = pipeline or IndexPipeline(vector_store, embeddings_client)
+        self._load_batch_size = int(pipeline_config.get(CONFIG_LOAD_BATCH_SIZE, DEFAULT_LOAD_BATCH_SIZE))
+
+    def sync(
+        self,
+        source_hashes: Dict[str, str],
+        load_documents: Callable[[List[str]], Iterable[LoadOutcome]],
+        force: bool = False,
+        progress: Optional[IndexProgress] = None,
+        prune: bool = True
+    ) -> Dict[str, Any]:
+        # prune=False: source_hashes is only part of the corpus (one ingest batch), so absent sources are kept
+        progress = progress or IndexProgress()
+        if force or (not self._manifest.is_empty() and self._vector_store.count() == 0):
+            # The index was wiped (or a rebuild was requested): everything is new again
+            stale_ids = self._manifest.chunk_ids(self._manifest.sources())
+            self._manifest.reset()
+        else:
+            stale_ids = []
+
+        plan = self._manifest.plan(source_hashes)
+        if not prune:
+            plan.removed = []
+        stale_ids += self._manifest.chunk_ids(plan.changed + plan.removed)
+        # Chunk IDs are content-derived: a chunk already in the index under the same ID needs no new embedding
+        indexed_ids = set(self._manifest.chunk_ids(self._manifest.sources()))
+
+        failures: List[str] = []
+        kept: List[str] = []
+        progress.add(files_total=len(plan.changed))
+        stats = self._pipeline.run(
+            self._chunks(plan, source_hashes, load_documents, indexed_ids, failures, kept, progress), progress
+        )
+        failed = len(failures)
+        added = stats.chunks
+
+        for key in plan.removed:
+            self._manifest.forget(key)
+
+        # New chunks are written before old ones go, so a changed source is never missing from the index
+        current_ids = set(self._manifest.chunk_ids(source_hashes))
+        stale_ids = [chunk_id for chunk_id in stale_ids if chunk_id not in current_ids]
+        deleted = self._vector_store.delete_documents(stale_ids) if stale_ids else 0
+        progress.add(chunks_deleted=deleted)
+
+        # The manifest only ever describes what the store has persisted
+        self._vector_store.flush()
+        self._manifest.save()
+
+        print(
+            f"[INDEX] {len(plan.changed) - failed} changed, {len(plan.removed)} removed, "
+            f"{len(plan.unchanged)} unchanged sources; {added} chunks written, {len(kept)} kept, {deleted} deleted; "
+            f"{stats.texts_embedded} texts embedded (dedup {stats.dedup_ratio:.1%}) "
+            f"in {stats.elapsed_seconds:.1f}s (embed {stats.embed_seconds:.1f}s, upsert {stats.upsert_seconds:.1f}s)"
+        )
+        return {
+            "sources_changed": len(plan.changed) - failed,
+            "sources_removed": len(plan.removed),
+            "sources_unchanged": len(plan.unchanged),
+            "sources_failed": failed,
+            "chunks_written": added,
+            "texts_embedded": stats.texts_embedded,
+            "dedup_ratio": round(stats.dedup_ratio, 4),
+            "chunks_unchanged": len(kept),
+            "chunks_deleted": deleted,
+            "chunks_indexed": len(current_ids),
+            "points": self._vector_store.count(),
+        }
+
+    def remove_sources(self, keys: List[str], progress: Optional[IndexProgress] = None) -> int:
+        stale_ids = self._manifest.chunk_ids(keys)
+        for key in keys:
+            self._manifest.forget(key)
+        deleted = self._vector_store.delete_documents(stale_ids) if stale_ids else 0
+        if progress is not None:
+            progress.add(chunks_deleted=deleted)
+        self._vector_store.flush()
+        self._manifest.save()
+        print(f"[INDEX] {len(keys)} removed sources; {deleted} chunks deleted")
+        return deleted
+
+    def _chunks(
+        self,
+        plan: ManifestPlan,
+        source_hashes: Dict[str, str],
+        load_documents: Callable[[List[str]], Iterable[LoadOutcome]],
+        indexed_ids: Set[str],
+        failures: List[str],
+        kept: List[str],
+        progress: IndexProgress
+    ) -> Iterator[Tuple[Document, str]]:
+        for start in range(0, len(plan.changed), self._load_batch_size):
+            keys = plan.changed[start:start + self._load_batch_size]
+            for key, (chunks, error) in zip(keys, load_documents(keys)):
+                if error is not None:
+                    print(f"[INDEX] Skipping {key}: {error}")
+                    self._manifest.forget(key)
+                    failures.append(key)
+                    progress.add(files_processed=1, files_failed=1)
+                    continue
+
+                chunks = [(doc, self._manifest.qualify(chunk_id)) for doc, chunk_id in chunks]
+                self._manifest.record(key, source_hashes[key], [chunk_id for _, chunk_id in chunks])
+                progress.add(files_processed=1)
+                for doc, chunk_id in chunks:
+                    if chunk_id in indexed_ids:
+                        kept.append(chunk_id)
+                        progress.add(chunks_unchanged=1)
+                        continue
+                    # Also covers the same chunk coming from two sources in one run
+                    indexed_ids.add(chunk_id)
+                    yield doc, chunk_id
@@ -0,0 +1,111 @@
+import threading
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+from .index_progress import IndexProgress
+from ..dtos.index_job_status import IndexJobStatus
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+FINISHED_STATUSES = (STATUS_SUCCEEDED, STATUS_FAILED)
+
+DEFAULT_MAX_HISTORY = 20
+THREAD_NAME_PREFIX = "index-job"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class IndexJob:
+    job_id: str
+    force: bool
+    status: str = STATUS_QUEUED
+    created_at: str = field(default_factory=_now)
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    progress: IndexProgress = field(default_factory=IndexProgress)
+    result: Any = None
+    error: Optional[str] = None
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def to_status(self) -> IndexJobStatus:
+        return IndexJobStatus(
+            job_id=self.job_id,
+            status=self.status,
+            force=self.force,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            progress=self.progress.snapshot(),
+            result=self.result,
+            error=self.error
+        )
+
+
+class IndexJobRunner:
+    """Runs index builds one at a time on a background thread.
+
+    run_job(force, progress) does the actual build and returns its IndexInfo.
+    A submit while another job is still queued returns that job instead of
+    queueing a duplicate: it has not read the input directory yet, so it will
+    see the same files.
+    """
+
+    def __init__(self, run_job: Callable[[bool, IndexProgress], Any], max_history: int = DEFAULT_MAX_HISTORY):
+        self._run_job = run_job
+        self._max_history = max_history
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=THREAD_NAME_PREFIX)
+        self._jobs: "OrderedDict[str, IndexJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, force: bool = False) -> IndexJob:
+        with self._lock:
+            for job in self._jobs.values():
+                if job.status == STATUS_QUEUED and (job.force or not force):
+                    return job
+
+            job = IndexJob(job_id=uuid.uuid4().hex, force=force)
+            self._jobs[job.job_id] = job
+            self._trim()
+
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[IndexJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job: IndexJob) -> None:
+        job.progress = IndexProgress()
+        job.started_at = _now()
+        job.status = STATUS_RUNNING
+        try:
+            job.result = self._run_job(job.force, job.progress)
+            job.status = STATUS_SUCCEEDED
+        except Exception as e:
+            traceback.print_exc()
+            job.error = str(e)
+            job.status = STATUS_FAILED
+        finally:
+            job.progress.finish()
+            job.finished_at = _now()
+            job.done.set()
+            print(f"[INDEX_JOB] {job.job_id} {job.status}: {job.progress.snapshot()}")
+
+    def _trim(self) -> None:
+        # Oldest finished jobs are forgotten first; queued and running jobs are always kept
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in FINISHED_STATUSES]
+        while len(self._jobs) > self._max_history and finished:
+            del self._jobs[finished.pop(0)]
@@ -0,0 +1,241 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+from .embedding_dedup import EmbeddingDedup
+from .index_progress import IndexProgress
+from ...infrastructure.shared.config_loader import get_config
+
+CONFIG_INDEX_PIPELINE = "index_pipeline"
+CONFIG_EMBED_BATCH_SIZE = "embed_batch_size"
+CONFIG_UPSERT_BATCH_SIZE = "upsert_batch_size"
+CONFIG_QUEUE_SIZE = "queue_size"
+CONFIG_MAX_IN_FLIGHT_CHUNKS = "max_in_flight_chunks"
+CONFIG_DEDUP_CACHE_SIZE = "dedup_cache_size"
+
+DEFAULT_EMBED_BATCH_SIZE = 64
+DEFAULT_UPSERT_BATCH_SIZE = 512
+DEFAULT_QUEUE_SIZE = 4
+DEFAULT_MAX_IN_FLIGHT_CHUNKS = 4096
+DEFAULT_DEDUP_CACHE_SIZE = 20000
+POLL_SECONDS = 0.1
+
+_END = object()
+
+
+@dataclass
+class PipelineStats:
+    chunks: int = 0
+    texts_embedded: int = 0
+    embed_batches: int = 0
+    upsert_batches: int = 0
+    embed_seconds: float = 0.0
+    upsert_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def dedup_ratio(self) -> float:
+        return 1.0 - self.texts_embedded / self.chunks if self.chunks else 0.0
+
+
+class _ChunkBudget:
+    def __init__(self, capacity: int):
+        self._capacity = capacity
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, count: int, stop: threading.Event) -> bool:
+        with self._condition:
+            while self._in_flight + count > self._capacity:
+                if stop.is_set():
+                    return False
+                self._condition.wait(POLL_SECONDS)
+            self._in_flight += count
+            return True
+
+    def release(self, count: int) -> None:
+        with self._condition:
+            self._in_flight -= count
+            self._condition.notify_all()
+
+
+class IndexPipeline:
+    """Streams (document, chunk_id) pairs through embed and upsert stages.
+
+    The caller's iterable (load -> documents -> split) is drained on a producer
+    thread, embedding runs on its own thread and upserts run on the calling
+    thread, so file parsing, embedding requests and vector store writes overlap.
+    Stages are joined by bounded queues and the number of chunks between the
+    producer and a finished upsert is capped by max_in_flight_chunks, which
+    keeps peak memory independent of corpus size. Chunks whose normalized text
+    was already embedded in this run reuse that vector instead of a new request.
+    """
+
+    def __init__(
+        self,
+        vector_store,
+        embeddings_client,
+        embed_batch_size: Optional[int] = None,
+        upsert_batch_size: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        max_in_flight_chunks: Optional[int] = None,
+        dedup_cache_size: Optional[int] = None
+    ):
+        pipeline_config = get_config().raw.get(CONFIG_INDEX_PIPELINE, {}) or {}
+        self._vector_store = vector_store
+        self._embeddings_client = embeddings_client
+        self._embed_batch_size = embed_batch_size or int(pipeline_config.get(CONFIG_EMBED_BATCH_SIZE, DEFAULT_EMBED_BATCH_SIZE))
+        self._upsert_batch_size = upsert_batch_size or int(pipeline_config.get(CONFIG_UPSERT_BATCH_SIZE, DEFAULT_UPSERT_BATCH_SIZE))
+        self._queue_size = queue_size or int(pipeline_config.get(CONFIG_QUEUE_SIZE, DEFAULT_QUEUE_SIZE))
+        max_in_flight = max_in_flight_chunks or int(pipeline_config.get(CONFIG_MAX_IN_FLIGHT_CHUNKS, DEFAULT_MAX_IN_FLIGHT_CHUNKS))
+        # The upsert stage holds a partial batch while the producer refills it, so the budget must cover both
+        self._max_in_flight = max(max_in_flight, self._upsert_batch_size + self._embed_batch_size)
+        self._dedup_cache_size = dedup_cache_size if dedup_cache_size is not None else int(
+            pipeline_config.get(CONFIG_DEDUP_CACHE_SIZE, DEFAULT_DEDUP_CACHE_SIZE)
+        )
+
+    def run(self, chunks: Iterable[Tuple[Document, str]], progress: Optional[IndexProgress] = None) -> PipelineStats:
+        stats = PipelineStats()
+        started = time.perf_counter()
+        stop = threading.Event()
+        errors: List[BaseException] = []
+        budget = _ChunkBudget(self._max_in_flight)
+        dedup = EmbeddingDedup(self._dedup_cache_size)
+        embed_queue: queue.Queue = queue.Queue(maxsize=self._queue_size)
+        upsert_queue: queue.Queue = queue.Queue(maxsize=self._queue_size)
+
+        producer = threading.Thread(
+            target=self._guard, args=(self._produce, stop, errors, chunks, embed_queue, budget), daemon=True
+        )
+        embedder = threading.Thread(
+            target=self._guard, args=(self._embed, stop, errors, embed_queue, upsert_queue, dedup, stats, progress), daemon=True
+        )
+        producer.start()
+        embedder.start()
+
+        try:
+            self._upsert(upsert_queue, budget, stats, stop, progress)
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+        finally:
+            producer.join()
+            embedder.join()
+
+        if errors:
+            raise errors[0]
+
+        stats.texts_embedded = dedup.embedded
+        stats.elapsed_seconds = time.perf_counter() - started
+        return stats
+
+    def _guard(self, stage, stop: threading.Event, errors: List[BaseException], *args) -> None:
+        try:
+            stage(stop, *args)
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+
+    def _produce(self, stop: threading.Event, chunks, embed_queue: queue.Queue, budget: _ChunkBudget) -> None:
+        batch: List[Tuple[Document, str]] = []
+        for item in chunks:
+            if stop.is_set():
+                return
+            batch.append(item)
+            if len(batch) >= self._embed_batch_size:
+                if not budget.acquire(len(batch), stop) or not self._put(embed_queue, batch, stop):
+                    return
+                batch = []
+
+        if batch and (not budget.acquire(len(batch), stop) or not self._put(embed_queue, batch, stop)):
+            return
+        self._put(embed_queue, _END, stop)
+
+    def _embed(
+        self,
+        stop: threading.Event,
+        embed_queue: queue.Queue,
+        upsert_queue: queue.Queue,
+        dedup: EmbeddingDedup,
+        stats: PipelineStats,
+        progress: Optional[IndexProgress]
+    ) -> None:
+        while True:
+            batch = self._get(embed_queue, stop)
+            if batch is None:
+                return
+            if batch is _END:
+                self._put(upsert_queue, _END, stop)
+                return
+
+            texts = [doc.page_content for doc, _ in batch]
+            started = time.perf_counter()
+            embedded_before = dedup.embedded
+            embeddings = dedup.embed(texts, self._embeddings_client.embed_documents)
+            stats.embed_seconds += time.perf_counter() - started
+            stats.embed_batches += 1
+            if progress is not None:
+                progress.add(chunks_embedded=len(batch), chunks_deduplicated=len(batch) - (dedup.embedded - embedded_before))
+
+            if not self._put(upsert_queue, (batch, embeddings), stop):
+                return
+
+    def _upsert(
+        self,
+        upsert_queue: queue.Queue,
+        budget: _ChunkBudget,
+        stats: PipelineStats,
+        stop: threading.Event,
+        progress: Optional[IndexProgress]
+    ) -> None:
+        pending: List[Tuple[Document, str]] = []
+        pending_embeddings: List[List[float]] = []
+
+        while True:
+            item = self._get(upsert_queue, stop)
+            if item is None:
+                return
+            if item is not _END:
+                batch, embeddings = item
+                pending.extend(batch)
+                pending_embeddings.extend(embeddings)
+
+            if pending and (item is _END or len(pending) >= self._upsert_batch_size):
+                started = time.perf_counter()
+                self._vector_store.add_documents(
+                    [doc.page_content for doc, _ in pending],
+                    pending_embeddings,
+                    [doc.metadata for doc, _ in pending],
+                    [chunk_id for _, chunk_id in pending]
+                )
+                stats.upsert_seconds += time.perf_counter() - started
+                stats.upsert_batches += 1
+                stats.chunks += len(pending)
+                if progress is not None:
+                    progress.add(chunks_written=len(pending))
+                budget.release(len(pending))
+                pending, pending_embeddings = [], []
+
+            if item is _END:
+                return
+
+    def _put(self, target: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue, stop: threading.Event) -> Any:
+        while not stop.is_set():
+            try:
+                return source.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return None
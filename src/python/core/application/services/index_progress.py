@@ -0,0 +1,50 @@
+import threading
+import time
+from typing import Any, Dict
+
+COUNTERS = (
+    "files_total",
+    "files_processed",
+    "files_failed",
+    "chunks_embedded",
+    "chunks_deduplicated",
+    "chunks_written",
+    "chunks_unchanged",
+    "chunks_deleted",
+)
+RATE_PRECISION = 1
+
+
+class IndexProgress:
+    """Thread-safe counters an index build updates while it runs.
+
+    The pipeline stages and the incremental indexer add to it from their own
+    threads; readers (e.g. GET /index/{id}) take consistent snapshots.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {name: 0 for name in COUNTERS}
+        self._started = time.perf_counter()
+        self._finished = None
+
+    def add(self, **counts: int) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                self._counts[name] += value
+
+    def finish(self) -> None:
+        with self._lock:
+            self._finished = time.perf_counter()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+            elapsed = (self._finished or time.perf_counter()) - self._started
+
+        rate = counts["chunks_written"] / elapsed if elapsed > 0 else 0.0
+        return {
+            **counts,
+            "elapsed_seconds": round(elapsed, RATE_PRECISION),
+            "chunks_per_second": round(rate, RATE_PRECISION),
+        }
@@ -51,7 +51,7 @@ class MetadataFilterBuilder:
         return {
             "$and": [
                 {self._type_field: self._type_skill},
-                {self._skill_name_field: {"$in": parsed_query.required_technologies}}
+                {self._skill_name_field: {"$in": list(parsed_query.required_technologies)}}
             ]
         }
     
@@ -0,0 +1,135 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+from .candidate_factory import CandidateFactory
+from .schema_validation_service import SchemaValidationService, ValidationCache
+from ...infrastructure.shared.config_loader import get_config
+
+CONFIG_CANDIDATE_LOADING = "candidate_loading"
+CONFIG_WORKERS = "workers"
+CONFIG_CHUNK_SIZE = "chunk_size"
+CONFIG_SERIAL_THRESHOLD = "serial_threshold"
+
+DEFAULT_WORKERS = 0
+DEFAULT_CHUNK_SIZE = 32
+DEFAULT_SERIAL_THRESHOLD = 64
+
+KIND_RECORD = "record"
+KIND_CANDIDATE = "candidate"
+
+_worker_factory: Optional[CandidateFactory] = None
+
+
+@dataclass
+class LoadResult:
+    path: Path
+    value: Any = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ParallelCandidateLoader:
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        serial_threshold: Optional[int] = None,
+        validate_schema: bool = True
+    ):
+        loading_config = get_config().raw.get(CONFIG_CANDIDATE_LOADING, {}) or {}
+        workers = workers if workers is not None else int(loading_config.get(CONFIG_WORKERS, DEFAULT_WORKERS))
+        self._workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self._chunk_size = max(1, chunk_size or int(loading_config.get(CONFIG_CHUNK_SIZE, DEFAULT_CHUNK_SIZE)))
+        self._serial_threshold = serial_threshold if serial_threshold is not None else int(
+            loading_config.get(CONFIG_SERIAL_THRESHOLD, DEFAULT_SERIAL_THRESHOLD)
+        )
+        self._validate_schema = validate_schema
+        # Owned here and saved on close; pool workers only report what they validated back to it
+        self._validation_cache: Optional[ValidationCache] = (
+            ValidationCache.default(SchemaValidationService()) if validate_schema else None
+        )
+        self._factory: Optional[CandidateFactory] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ParallelCandidateLoader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def load_records(self, paths: Sequence[Union[str, Path]], transform: Optional[Callable] = None) -> List[LoadResult]:
+        return self._load(KIND_RECORD, paths, transform)
+
+    def load_candidates(self, paths: Sequence[Union[str, Path]], transform: Optional[Callable] = None) -> List[LoadResult]:
+        return self._load(KIND_CANDIDATE, paths, transform)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._validation_cache is not None:
+            self._validation_cache.save()
+
+    def _load(self, kind: str, paths: Sequence[Union[str, Path]], transform: Optional[Callable]) -> List[LoadResult]:
+        # transform runs on the loaded value inside the worker (e.g. chunking) and must be a module-level function
+        paths = [Path(path) for path in paths]
+        tasks = [(kind, str(path), transform) for path in paths]
+
+        if self._workers <= 1 or len(paths) < self._serial_threshold:
+            if self._factory is None:
+                self._factory = CandidateFactory(self._validate_schema, self._validation_cache)
+            outcomes = [_load_file(self._factory, task) for task in tasks]
+        else:
+            # map() yields in submission order, so results stay aligned with the sorted input
+            outcomes = list(self._pool().map(_load_in_worker, tasks, chunksize=self._chunk_size))
+
+        results = []
+        for path, (value, error, validated) in zip(paths, outcomes):
+            if validated and self._validation_cache is not None:
+                self._validation_cache.merge(validated)
+            results.append(LoadResult(path, value, error))
+        return results
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn, not fork: the API forks from a process with live threads (job runner, HTTP clients)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._validate_schema, self._validation_cache)
+            )
+        return self._executor
+
+
+def _init_worker(validate_schema: bool, validation_cache: Optional[ValidationCache]) -> None:
+    global _worker_factory
+    _worker_factory = CandidateFactory(validate_schema, validation_cache)
+
+
+def _load_in_worker(task: tuple) -> tuple:
+    return _load_file(_worker_factory, task)
+
+
+def _load_file(factory: CandidateFactory, task: tuple) -> tuple:
+    kind, path, transform = task
+    try:
+        if kind == KIND_CANDIDATE:
+            # Filename without extension is the candidate_id, as in CandidateService
+            value, error = factory.from_json_file_to_candidate(path, Path(path).stem), None
+        else:
+            value, error = factory.from_json_file(path), None
+        if transform is not None:
+            value = transform(value)
+    except Exception as e:
+        value, error = None, str(e)
+    
+    cache = factory.validation_cache
+    return value, error, cache.drain_new() if cache is not None else None
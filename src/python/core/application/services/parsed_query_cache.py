@@ -0,0 +1,89 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from ...domain.entities.parsed_query import ParsedQuery
+from ...infrastructure.shared.config_loader import get_config
+
+CONFIG_QUERY_CACHE = "query_cache"
+CONFIG_MAX_ENTRIES = "max_entries"
+CONFIG_TTL_SECONDS = "ttl_seconds"
+
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_TTL_SECONDS = 3600
+WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    # Parsing lowercases anyway; collapsing whitespace lets "show  me" and "show me" share an entry
+    return WHITESPACE.sub(" ", question or "").strip().lower()
+
+
+@dataclass(frozen=True)
+class PreparedQuery:
+    """A parsed question plus the metadata filters derived from it; shared between requests, never mutated.
+
+    normalized_question is the cache key text the fields were parsed from;
+    parsed_query.query_text is the question as the caller asked it.
+    """
+    normalized_question: str
+    parsed_query: ParsedQuery
+    technology_filter: Optional[Dict[str, Any]]
+    candidate_filters: Tuple[Dict[str, Any], ...]
+
+
+class ParsedQueryCache:
+    """LRU of PreparedQuery entries with a time-to-live, keyed by (config version, normalized question).
+
+    Identical questions dominate /chat traffic; a hit skips parsing and
+    filter building. max_entries <= 0 disables the cache.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        cache_config = get_config().raw.get(CONFIG_QUERY_CACHE, {}) or {}
+        self._max_entries = max_entries if max_entries is not None else int(cache_config.get(CONFIG_MAX_ENTRIES, DEFAULT_MAX_ENTRIES))
+        self._ttl_seconds = ttl_seconds if ttl_seconds is not None else float(cache_config.get(CONFIG_TTL_SECONDS, DEFAULT_TTL_SECONDS))
+        self._entries: "OrderedDict[Hashable, Tuple[float, PreparedQuery]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], PreparedQuery]) -> PreparedQuery:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+
+        prepared = factory()
+        if self._max_entries <= 0:
+            return prepared
+
+        with self._lock:
+            self._entries[key] = (now + self._ttl_seconds, prepared)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return prepared
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "ttl_seconds": self._ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,203 @@
+import hashlib
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ...domain.entities.parsed_query import ParsedQuery
+from ...domain.enums.query_intent import QueryIntent
+from ...domain.enums.seniority_level import SeniorityLevel
+from ...domain.configuration.query_parsing_config import (
+    QueryParsingConfig,
+    DEFAULT_QUERY_PARSING_CONFIG
+)
+
+INTENT_GROUP = "intent"
+SENIORITY_GROUP = "seniority"
+TECHNOLOGY_GROUP_PREFIX = "tech"
+YEARS_GROUP = "years"
+YEARS_PATTERN = rf"(?P<{YEARS_GROUP}>\d+)\+?\s*(?:years?|yrs?)"
+TRIE_END = ""
+VERSION_DIGEST_SIZE = 8
+
+INTENT_BY_KEY = {
+    "find_best": QueryIntent.FIND_BEST,
+    "list_all": QueryIntent.LIST_ALL,
+    "compare": QueryIntent.COMPARE,
+    "explain": QueryIntent.EXPLAIN,
+}
+
+
+class QueryParsingEngine:
+    """Extracts intent, seniority, technologies and years in one regex pass.
+
+    Built once from a QueryParsingConfig. Every keyword list becomes a
+    character trie and all of them are alternatives of one lookahead, so
+    the lowercased query is scanned once and finditer only stops where some
+    rule hits. Results match the former per-rule scans:
+    - intent and seniority are plain substrings, the earliest config entry
+      found anywhere in the query wins
+    - technologies need a word boundary on both sides, all of them are kept
+    - years come from the leftmost "<n> years" / "<n>+ yrs"
+    """
+
+    def __init__(self, config: QueryParsingConfig = None):
+        config = config or DEFAULT_QUERY_PARSING_CONFIG
+        # The frozen config's repr lists every rule in order, so equal configs share a version
+        self.version = hashlib.blake2b(repr(config).encode(), digest_size=VERSION_DIGEST_SIZE).hexdigest()
+
+        self._intent_keys = list(config.intent_keywords)
+        intent_priority: Dict[str, int] = {}
+        for priority, keywords in enumerate(config.intent_keywords.values()):
+            for keyword in keywords:
+                intent_priority.setdefault(keyword.lower(), priority)
+
+        seniority_levels: Dict[str, SeniorityLevel] = {}
+        for level, tokens in config.seniority_tokens.items():
+            for token in tokens:
+                seniority_levels[token.lower()] = level
+        self._seniority_levels = list(seniority_levels.values())
+        seniority_priority = {token: priority for priority, token in enumerate(seniority_levels)}
+
+        # A trie reports the longest token at a position; any shorter token there is one of its prefixes
+        self._intent_priority = _best_over_prefixes(intent_priority)
+        self._seniority_priority = _best_over_prefixes(seniority_priority)
+        self._technology_synonyms = {token.lower(): normalized for token, normalized in config.technology_synonyms.items()}
+        technology_layers = _technology_layers(self._technology_synonyms)
+        self._technology_groups = [f"{TECHNOLOGY_GROUP_PREFIX}{index}" for index in range(len(technology_layers))]
+
+        branches: List[Tuple[str, Optional[List[str]], str]] = []
+        if intent_priority:
+            branches.append((INTENT_GROUP, list(intent_priority), f"(?P<{INTENT_GROUP}>{_trie_pattern(intent_priority)})"))
+        if seniority_priority:
+            branches.append((SENIORITY_GROUP, list(seniority_priority), f"(?P<{SENIORITY_GROUP}>{_trie_pattern(seniority_priority)})"))
+        for group, layer in zip(self._technology_groups, technology_layers):
+            branches.append((group, layer, rf"\b(?P<{group}>{_trie_pattern(layer)})\b"))
+        branches.append((YEARS_GROUP, None, YEARS_PATTERN))
+        self._pattern = re.compile(_combine(branches))
+
+    def parse(self, query_text: str) -> ParsedQuery:
+        intent_priority = None
+        seniority_priority = None
+        technologies = set()
+        years = None
+
+        for match in self._pattern.finditer(query_text.lower()):
+            groups = match.groupdict()
+            keyword = groups.get(INTENT_GROUP)
+            if keyword is not None:
+                priority = self._intent_priority[keyword]
+                if intent_priority is None or priority < intent_priority:
+                    intent_priority = priority
+            token = groups.get(SENIORITY_GROUP)
+            if token is not None:
+                priority = self._seniority_priority[token]
+                if seniority_priority is None or priority < seniority_priority:
+                    seniority_priority = priority
+            for group in self._technology_groups:
+                if groups[group] is not None:
+                    technologies.add(self._technology_synonyms[groups[group]])
+            if years is None and groups[YEARS_GROUP] is not None:
+                years = int(groups[YEARS_GROUP])
+
+        return ParsedQuery(
+            query_text=query_text,
+            query_intent=self._intent(intent_priority),
+            required_technologies=tuple(sorted(technologies)),
+            min_seniority_level=self._seniority_levels[seniority_priority] if seniority_priority is not None else None,
+            min_years_experience=years
+        )
+
+    def _intent(self, priority: Optional[int]) -> QueryIntent:
+        if priority is None:
+            return QueryIntent.GENERAL
+        return INTENT_BY_KEY.get(self._intent_keys[priority], QueryIntent.GENERAL)
+
+
+def _best_over_prefixes(priorities: Dict[str, int]) -> Dict[str, int]:
+    return {
+        token: min(priority for other, priority in priorities.items() if token.startswith(other))
+        for token in priorities
+    }
+
+
+def _trie_pattern(tokens: Iterable[str]) -> str:
+    """Regex for a set of literals, factored by common prefix and preferring the longest match."""
+    trie: Dict[str, dict] = {}
+    for token in tokens:
+        node = trie
+        for char in token:
+            node = node.setdefault(char, {})
+        node[TRIE_END] = {}
+    return _trie_node_pattern(trie)
+
+
+def _trie_node_pattern(node: Dict[str, dict]) -> str:
+    branches = [re.escape(char) + _trie_node_pattern(child) for char, child in node.items() if char != TRIE_END]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    if TRIE_END in node:
+        return f"(?:{body})?"
+    return body
+
+
+def _combine(branches: List[Tuple[str, Optional[List[str]], str]]) -> str:
+    """One pattern that stops at every position where some branch matches.
+
+    Branches that can never match at the same position share one lookahead
+    alternation. Others go to further optional lookaheads, with a final
+    condition that fails positions where none of them matched.
+    """
+    layers: List[List[Tuple[str, Optional[List[str]], str]]] = []
+    for branch in branches:
+        for layer in layers:
+            if not any(_can_overlap(branch, other) for other in layer):
+                layer.append(branch)
+                break
+        else:
+            layers.append([branch])
+
+    if len(layers) == 1:
+        return f"(?={'|'.join(pattern for _, _, pattern in layers[0])})"
+    condition = "(?!)"
+    for group, _, _ in reversed(branches):
+        condition = f"(?({group})|{condition})"
+    return "".join(f"(?=(?:{'|'.join(pattern for _, _, pattern in layer)}))?" for layer in layers) + condition
+
+
+def _can_overlap(branch, other) -> bool:
+    (group, tokens, _), (other_group, other_tokens, _) = branch, other
+    if group.startswith(TECHNOLOGY_GROUP_PREFIX) and other_group.startswith(TECHNOLOGY_GROUP_PREFIX):
+        return True
+    if tokens is None or other_tokens is None:
+        # The years branch starts with a digit
+        return any(token[:1].isdigit() for token in (tokens or other_tokens or []))
+    return any(token.startswith(other_token) or other_token.startswith(token) for token in tokens for other_token in other_tokens)
+
+
+def _technology_layers(synonyms: Dict[str, str]) -> List[List[str]]:
+    """Splits tokens so a longest match never hides a token with another normalized name.
+
+    "c" and "c#" can both match at one position with a word boundary after
+    each, so a token that is such a prefix of a differently normalized token
+    gets a layer of its own. "java" and "javascript" cannot ("\\bjava\\b" never
+    matches inside "javascript") and share one.
+    """
+    layers: List[List[Tuple[str, str]]] = []
+    for token, normalized in sorted(synonyms.items(), key=lambda item: -len(item[0])):
+        for layer in layers:
+            if not any(_boundary_prefix(token, other) and other_normalized != normalized for other, other_normalized in layer):
+                layer.append((token, normalized))
+                break
+        else:
+            layers.append([(token, normalized)])
+    return [[token for token, _ in layer] for layer in layers]
+
+
+def _boundary_prefix(token: str, other: str) -> bool:
+    if not token or not other.startswith(token) or len(other) == len(token):
+        return False
+    return _is_word_char(token[-1]) != _is_word_char(other[len(token)])
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
@@ -0,0 +1,133 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ...infrastructure.shared.config_loader import get_config
+
+CONFIG_RESPONSE_CACHE = "response_cache"
+CONFIG_ENABLED = "enabled"
+CONFIG_MAX_ENTRIES = "max_entries"
+CONFIG_SIMILARITY_THRESHOLD = "similarity_threshold"
+CONFIG_TTL_SECONDS = "ttl_seconds"
+
+DEFAULT_ENABLED = False
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+DEFAULT_TTL_SECONDS = 600
+VECTOR_DTYPE = np.float32
+
+
+@dataclass
+class _Entry:
+    key: Hashable
+    embedding: np.ndarray
+    value: Any
+    expires_at: float
+
+
+class ResponseCache:
+    """Answers keyed by meaning: a stored value is reused for a query embedding close enough to its own.
+
+    Entries live in buckets keyed by everything that must match exactly
+    (the index version and the parsed filters). Within a bucket the newest
+    query is compared with each stored embedding, and the most similar one
+    is returned if its cosine similarity reaches the threshold. The cache
+    is bounded by max_entries with LRU eviction. ttl_seconds bounds how long
+    an answer can outlive an index change made by another process;
+    invalidate() drops everything at once.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        similarity_threshold: Optional[float] = None,
+        ttl_seconds: Optional[float] = None,
+        enabled: Optional[bool] = None
+    ):
+        cache_config = get_config().raw.get(CONFIG_RESPONSE_CACHE, {}) or {}
+        self._enabled = enabled if enabled is not None else bool(cache_config.get(CONFIG_ENABLED, DEFAULT_ENABLED))
+        self._max_entries = max_entries if max_entries is not None else int(cache_config.get(CONFIG_MAX_ENTRIES, DEFAULT_MAX_ENTRIES))
+        self._threshold = similarity_threshold if similarity_threshold is not None else float(
+            cache_config.get(CONFIG_SIMILARITY_THRESHOLD, DEFAULT_SIMILARITY_THRESHOLD)
+        )
+        self._ttl_seconds = ttl_seconds if ttl_seconds is not None else float(cache_config.get(CONFIG_TTL_SECONDS, DEFAULT_TTL_SECONDS))
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._buckets: Dict[Hashable, List[int]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled and self._max_entries > 0
+
+    def get(self, key: Hashable, embedding: Sequence[float]) -> Optional[Tuple[Any, float]]:
+        """Returns (value, similarity) of the closest live entry in the key's bucket, or None."""
+        if not self.enabled:
+            return None
+        query = _unit(embedding)
+        now = time.monotonic()
+        with self._lock:
+            for entry_id in [entry_id for entry_id in self._buckets.get(key, []) if self._entries[entry_id].expires_at <= now]:
+                self._remove(entry_id)
+            ids = list(self._buckets.get(key, []))
+            if ids:
+                similarities = np.stack([self._entries[entry_id].embedding for entry_id in ids]) @ query
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self._threshold:
+                    self._entries.move_to_end(ids[best])
+                    self._hits += 1
+                    return self._entries[ids[best]].value, float(similarities[best])
+            self._misses += 1
+            return None
+
+    def put(self, key: Hashable, embedding: Sequence[float], value: Any) -> None:
+        if not self.enabled:
+            return
+        entry = _Entry(key=key, embedding=_unit(embedding), value=value, expires_at=time.monotonic() + self._ttl_seconds)
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = entry
+            self._buckets.setdefault(key, []).append(entry_id)
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+            self._invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "similarity_threshold": self._threshold,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self._invalidations,
+            }
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        bucket = self._buckets[entry.key]
+        bucket.remove(entry_id)
+        if not bucket:
+            del self._buckets[entry.key]
+
+
+def _unit(embedding: Sequence[float]) -> np.ndarray:
+    vector = np.asarray(embedding, dtype=VECTOR_DTYPE)
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
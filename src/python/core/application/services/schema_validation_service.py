@@ -1,43 +1,95 @@
+import hashlib
 import json
+import os
+import threading
 import jsonschema
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
 from ...domain.entities.candidate_record import CandidateRecord
 from ...infrastructure.shared.config_loader import get_config
 
 SCHEMA_FILE = "candidate_record.schema.json"
+FILE_ENCODING = "utf-8"
+
+CONFIG_SCHEMA_VALIDATION = "schema_validation"
+CONFIG_CHECK_FORMATS = "check_formats"
+CONFIG_CACHE_ENABLED = "cache_enabled"
+CONFIG_CACHE_MAX_ENTRIES = "cache_max_entries"
+DEFAULT_CHECK_FORMATS = False
+DEFAULT_CACHE_ENABLED = True
+DEFAULT_CACHE_MAX_ENTRIES = 50_000
+
+CACHE_SUBDIR = "cache"
+CACHE_FILE = "schema_validation.json"
+CACHE_SCHEMA_KEY = "schema"
+CACHE_RESULTS_KEY = "results"
+TMP_SUFFIX = ".tmp"
+PATH_SEPARATOR = " -> "
+
+_compiled_lock = threading.Lock()
+_compiled: Dict[Tuple[str, bool], Tuple[Dict[str, Any], Any, str]] = {}
+_format_checker: Optional[jsonschema.FormatChecker] = None
+
+
+def _shared_format_checker() -> jsonschema.FormatChecker:
+    global _format_checker
+    if _format_checker is None:
+        _format_checker = jsonschema.FormatChecker()
+    return _format_checker
+
+
+def _compile(schema_path: Path, check_formats: bool) -> Tuple[Dict[str, Any], Any, str]:
+    # One validator per schema file and process: the schema is read and meta-validated once
+    key = (str(schema_path.resolve()), check_formats)
+    with _compiled_lock:
+        if key in _compiled:
+            return _compiled[key]
+        
+        if not schema_path.exists():
+            raise FileNotFoundError(f"Schema file not found: {schema_path}")
+        
+        raw = schema_path.read_bytes()
+        schema = json.loads(raw)
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = validator_class(schema, format_checker=_shared_format_checker() if check_formats else None)
+        fingerprint = hashlib.sha256(raw + str(check_formats).encode(FILE_ENCODING)).hexdigest()
+        
+        _compiled[key] = (schema, validator, fingerprint)
+        return _compiled[key]
 
 
 class SchemaValidationService:
-    def __init__(self, schema_path: Optional[str] = None):
+    def __init__(self, schema_path: Optional[str] = None, check_formats: Optional[bool] = None):
+        cfg = get_config()
         if schema_path:
             self.schema_path = Path(schema_path)
         else:
-            cfg = get_config()
             schema_dir = cfg.raw["data"]["schema"]
             self.schema_path = cfg.get_data_root() / schema_dir / SCHEMA_FILE
         
-        self._schema = self._load_schema()
-
-    def _load_schema(self) -> Dict[str, Any]:
-        if not self.schema_path.exists():
-            raise FileNotFoundError(f"Schema file not found: {self.schema_path}")
+        if check_formats is None:
+            validation_config = cfg.raw.get(CONFIG_SCHEMA_VALIDATION, {}) or {}
+            check_formats = bool(validation_config.get(CONFIG_CHECK_FORMATS, DEFAULT_CHECK_FORMATS))
         
-        with open(self.schema_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        self._schema, self._validator, self.fingerprint = _compile(self.schema_path, check_formats)
 
     def validate_json(self, data: Dict[str, Any]) -> bool:
-        try:
-            jsonschema.validate(data, self._schema)
-            return True
-        except jsonschema.exceptions.ValidationError as e:
-            print(f"Schema validation error: {e}")
-            return False
-        except jsonschema.exceptions.SchemaError as e:
-            print(f"Schema definition error: {e}")
-            return False
+        errors = self.collect_errors(data)
+        for error in errors:
+            print(f"Schema validation error: {error}")
+        return not errors
+
+    def collect_errors(self, data: Dict[str, Any]) -> List[str]:
+        errors = []
+        for error in sorted(self._validator.iter_errors(data), key=jsonschema.exceptions.relevance):
+            errors.append(error.message)
+            if error.absolute_path:
+                path = PATH_SEPARATOR.join(str(p) for p in error.absolute_path)
+                errors.append(f"Error location: {path}")
+        return errors
 
     def validate_candidate_record(self, candidate_record: CandidateRecord) -> bool:
         try:
@@ -72,15 +124,80 @@ class SchemaValidationService:
             return obj
 
     def get_validation_errors(self, data: Dict[str, Any]) -> List[str]:
-        errors = []
+        return self.collect_errors(data)
+
+
+class ValidationCache:
+    """Validation outcomes keyed by the SHA-256 of a candidate file's bytes.
+
+    Entries are only trusted for the schema fingerprint they were recorded
+    under. Pool workers get a read-only copy and hand back what they validated
+    (see drain_new); only the owning process writes the file. At most
+    max_entries are kept, oldest first out, since every pool worker receives
+    a pickled copy.
+    """
+
+    def __init__(self, path: Path, schema_fingerprint: str, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        self._path = Path(path)
+        self._fingerprint = schema_fingerprint
+        self._max_entries = max(1, max_entries)
+        self._results: Dict[str, List[str]] = {}
+        self._new: Dict[str, List[str]] = {}
+        self._load()
+
+    @classmethod
+    def default(cls, validator: "SchemaValidationService") -> Optional["ValidationCache"]:
+        cfg = get_config()
+        validation_config = cfg.raw.get(CONFIG_SCHEMA_VALIDATION, {}) or {}
+        if not validation_config.get(CONFIG_CACHE_ENABLED, DEFAULT_CACHE_ENABLED):
+            return None
+        max_entries = int(validation_config.get(CONFIG_CACHE_MAX_ENTRIES, DEFAULT_CACHE_MAX_ENTRIES))
+        return cls(cfg.get_data_root() / CACHE_SUBDIR / CACHE_FILE, validator.fingerprint, max_entries)
+
+    def get(self, content_hash: str) -> Optional[List[str]]:
+        return self._results.get(content_hash)
+
+    def put(self, content_hash: str, errors: List[str]) -> None:
+        # Re-inserting moves the entry to the young end
+        self._results.pop(content_hash, None)
+        self._results[content_hash] = errors
+        self._new[content_hash] = errors
+        self._evict()
+
+    def drain_new(self) -> Dict[str, List[str]]:
+        new, self._new = self._new, {}
+        return new
+
+    def merge(self, results: Dict[str, List[str]]) -> None:
+        for content_hash, errors in results.items():
+            self.put(content_hash, errors)
+
+    def save(self) -> None:
+        if not self._new:
+            return
+        
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(self._path.suffix + TMP_SUFFIX)
+        with tmp_path.open("w", encoding=FILE_ENCODING) as fh:
+            json.dump({CACHE_SCHEMA_KEY: self._fingerprint, CACHE_RESULTS_KEY: self._results}, fh)
+        os.replace(tmp_path, self._path)
+        self._new = {}
+
+    def _load(self) -> None:
+        if not self._path.exists():
+            return
+        
         try:
-            jsonschema.validate(data, self._schema)
-        except jsonschema.exceptions.ValidationError as e:
-            errors.append(str(e))
-            if e.absolute_path:
-                path = " -> ".join(str(p) for p in e.absolute_path)
-                errors.append(f"Error location: {path}")
-        except jsonschema.exceptions.SchemaError as e:
-            errors.append(f"Schema definition error: {e}")
+            with self._path.open("r", encoding=FILE_ENCODING) as fh:
+                data = json.load(fh)
+        except (OSError, ValueError) as e:
+            print(f"[SCHEMA_CACHE] Ignoring unreadable cache {self._path}: {e}")
+            return
         
-        return errors
\ No newline at end of file
+        if data.get(CACHE_SCHEMA_KEY) == self._fingerprint:
+            self._results = data.get(CACHE_RESULTS_KEY, {})
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._results) > self._max_entries:
+            self._results.pop(next(iter(self._results)))
@@ -0,0 +1,75 @@
+from typing import List
+from ...domain.entities.ranked_candidate import RankedCandidate
+from ...domain.entities.parsed_query import ParsedQuery
+from ...domain.configuration.ranking_weights import RankingWeights
+from ...domain.configuration.vector_metadata_config import DEFAULT_VECTOR_METADATA_CONFIG
+
+METADATA_CONFIG = DEFAULT_VECTOR_METADATA_CONFIG
+SCORE_FORMAT = "{:.2f}"
+LINE_SEPARATOR = "\n"
+
+
+class ScoreJustifier:
+    """Explains a CandidateRanker ordering from its per-feature scores, without an LLM.
+
+    The text is a pure function of the ranked candidates and the parsed
+    query, so identical inputs always give identical justifications.
+    """
+
+    def __init__(self, weights: RankingWeights):
+        self._weights = weights
+
+    def justify(self, ranked_candidates: List[RankedCandidate], parsed_query: ParsedQuery) -> str:
+        lines = [self._header(parsed_query, len(ranked_candidates))]
+        for rank, candidate in enumerate(ranked_candidates, 1):
+            lines.append(self._candidate_line(rank, candidate))
+        return LINE_SEPARATOR.join(lines)
+
+    def _header(self, parsed_query: ParsedQuery, count: int) -> str:
+        criteria = []
+        if parsed_query.required_technologies:
+            criteria.append("technologies: " + ", ".join(parsed_query.required_technologies))
+        if parsed_query.min_seniority_level is not None:
+            criteria.append(f"seniority: {parsed_query.min_seniority_level.value} or above")
+        if parsed_query.min_years_experience is not None:
+            criteria.append(f"experience: {parsed_query.min_years_experience}+ years")
+        weights = (
+            f"technical {self._percent(self._weights.technical_match_weight)}, "
+            f"seniority {self._percent(self._weights.seniority_match_weight)}, "
+            f"leadership {self._percent(self._weights.leadership_signals_weight)}, "
+            f"experience {self._percent(self._weights.experience_match_weight)}"
+        )
+        requested = "; ".join(criteria) if criteria else "no explicit criteria"
+        return f"{count} candidate(s) ranked by weighted score ({weights}) for {requested}."
+
+    def _candidate_line(self, rank: int, candidate: RankedCandidate) -> str:
+        fullname = candidate.metadata.get(METADATA_CONFIG.FIELD_FULLNAME, candidate.candidate_id)
+        scores = (
+            f"technical {self._score(candidate.technical_score)}, "
+            f"seniority {self._score(candidate.seniority_score)}, "
+            f"leadership {self._score(candidate.leadership_score)}, "
+            f"experience {self._score(candidate.experience_score)}"
+        )
+        facts = []
+        seniority = candidate.metadata.get(METADATA_CONFIG.FIELD_SENIORITY_LEVEL)
+        if seniority:
+            facts.append(str(seniority))
+        years = candidate.metadata.get(METADATA_CONFIG.FIELD_YEARS_EXPERIENCE)
+        if years is not None:
+            facts.append(f"{years} years")
+        skills = candidate.metadata.get(METADATA_CONFIG.FIELD_PRIMARY_SKILLS)
+        if skills:
+            facts.append(f"primary skills: {skills}")
+        profile = f"; {', '.join(facts)}" if facts else ""
+        return (
+            f"{rank}. {fullname} (ID: {candidate.candidate_id}): score {self._score(candidate.total_score)} "
+            f"({scores}){profile}."
+        )
+
+    @staticmethod
+    def _score(value: float) -> str:
+        return SCORE_FORMAT.format(value)
+
+    @staticmethod
+    def _percent(weight: float) -> str:
+        return f"{round(weight * 100)}%"
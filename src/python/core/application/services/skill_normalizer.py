@@ -1,46 +1,87 @@
+import json
 import re
-from typing import Dict
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from ...infrastructure.shared.config_loader import get_config
+
+CONFIG_DATA = "data"
+CONFIG_DATA_NORMALIZATION = "normalization"
+DEFAULT_NORMALIZATION_DIR = "normalization"
+RULES_FILE = "skill_rules.json"
+RULES_KEY = "rules"
+RULE_PATTERN = "pattern"
+RULE_CANONICAL = "canonical"
+RULES_ENCODING = "utf-8"
+RULE_GROUP_PREFIX = "rule"
+CACHE_SIZE = 65536
 
 
 class SkillNormalizer:
-    _NORMALIZATION_RULES: Dict[str, str] = {
-        r'.*\bJava\b.*': 'Java',
-        r'.*\bSpring\b.*': 'Spring',
-        r'.*\bASP\.?\s*NET\b.*': '.NET',
-        r'.*\b\.?\s*NET\b.*': '.NET',
-        r'.*\bC#\b.*': 'C#',
-        r'.*\bCSharp\b.*': 'C#',
-        r'.*\bNode\.?js\b.*': 'Node.js',
-        r'.*\bNode\b.*': 'Node.js',
-        r'.*\bReact\b.*': 'React',
-        r'.*\bAngular.*': 'Angular',
-        r'.*\bVue\b.*': 'Vue',
-        r'.*\bJavaScript\b.*': 'JavaScript',
-        r'.*\bJS\b.*': 'JavaScript',
-        r'.*\bTypeScript\b.*': 'TypeScript',
-        r'.*\bTS\b.*': 'TypeScript',
-        r'.*\bPython\b.*': 'Python',
-        r'.*\bSQL\b.*': 'SQL',
-        r'.*MySQL.*': 'SQL',
-        r'.*PostgreSQL.*': 'SQL',
-        r'.*\bDocker\b.*': 'Docker',
-        r'.*\bKubernetes\b.*': 'Kubernetes',
-        r'.*\bK8s\b.*': 'Kubernetes',
-        r'.*\bGit\b.*': 'Git',
-        r'.*\bPHP\b.*': 'PHP',
-        r'.*\bC\+\+\b.*': 'C++',
-        r'.*\bKotlin\b.*': 'Kotlin',
-    }
-    
+    """Maps a skill name to its canonical technology with the first matching rule.
+
+    Rules come from data/normalization/skill_rules.json, in order, and are
+    matched case-insensitively from the start of the trimmed name (re.match).
+    They are compiled once into one anchored alternation whose branches are
+    tried in rule order, and results are memoized since skill names repeat
+    across candidates.
+    """
+
+    _matcher: Optional[Tuple[re.Pattern, List[str]]] = None
+    _lock = threading.Lock()
+
     @staticmethod
     def normalize(skill_name: str) -> str:
         if not skill_name:
             return skill_name
-        
-        skill_trimmed = skill_name.strip()
-        
-        for pattern, canonical in SkillNormalizer._NORMALIZATION_RULES.items():
-            if re.match(pattern, skill_trimmed, re.IGNORECASE):
-                return canonical
-        
-        return skill_trimmed
+        return _normalize_trimmed(skill_name.strip())
+
+    @classmethod
+    def load_rules(cls, path: Optional[Path] = None) -> None:
+        rules = _read_rules(path or _rules_path())
+        # Each rule is a lookahead followed by an empty named group, so lastgroup names the rule that matched
+        pattern = re.compile(
+            "|".join(f"(?={rule[RULE_PATTERN]})(?P<{RULE_GROUP_PREFIX}{index}>)" for index, rule in enumerate(rules)),
+            re.IGNORECASE
+        )
+        with cls._lock:
+            cls._matcher = (pattern, [rule[RULE_CANONICAL] for rule in rules])
+            _normalize_trimmed.cache_clear()
+
+    @classmethod
+    def _compiled(cls) -> Tuple[re.Pattern, List[str]]:
+        if cls._matcher is None:
+            cls.load_rules()
+        return cls._matcher
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _normalize_trimmed(skill: str) -> str:
+    pattern, canonicals = SkillNormalizer._compiled()
+    match = pattern.match(skill)
+    if match is None:
+        return skill
+    return canonicals[int(match.lastgroup[len(RULE_GROUP_PREFIX):])]
+
+
+def _rules_path() -> Path:
+    config = get_config()
+    data_config = config.raw.get(CONFIG_DATA, {}) or {}
+    return config.get_data_root() / data_config.get(CONFIG_DATA_NORMALIZATION, DEFAULT_NORMALIZATION_DIR) / RULES_FILE
+
+
+def _read_rules(path: Path) -> List[dict]:
+    if not path.exists():
+        raise FileNotFoundError(f"Skill normalization rules not found: {path}")
+    with path.open("r", encoding=RULES_ENCODING) as fh:
+        rules = json.load(fh)[RULES_KEY]
+    for index, rule in enumerate(rules):
+        if not rule.get(RULE_PATTERN) or not rule.get(RULE_CANONICAL):
+            raise ValueError(f"Skill normalization rule {index} in {path} needs '{RULE_PATTERN}' and '{RULE_CANONICAL}'")
+        try:
+            re.compile(rule[RULE_PATTERN])
+        except re.error as e:
+            raise ValueError(f"Invalid skill normalization pattern {rule[RULE_PATTERN]!r} in {path}: {e}") from e
+    return rules
@@ -0,0 +1,63 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+MS_PER_SECOND = 1000
+MS_DECIMALS = 3
+TOTAL_STAGE = "total"
+
+
+class StageTimer:
+    """Wall-clock duration of each named stage of one request, in milliseconds.
+
+    Stages may run concurrently, so their durations can add up to more than
+    the request's total.
+    """
+
+    def __init__(self):
+        self._started = time.perf_counter()
+        self.durations_ms: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations_ms[name] = _to_ms(time.perf_counter() - started)
+
+    def finish(self) -> Dict[str, float]:
+        """Stage durations plus the total since the timer was created."""
+        return {**self.durations_ms, TOTAL_STAGE: _to_ms(time.perf_counter() - self._started)}
+
+
+class StageTimingStats:
+    """Running count, mean and max per stage across requests."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, float]] = {}
+
+    def record(self, durations_ms: Dict[str, float]) -> None:
+        with self._lock:
+            for name, duration in durations_ms.items():
+                stage = self._stages.setdefault(name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+                stage["count"] += 1
+                stage["total_ms"] += duration
+                stage["max_ms"] = max(stage["max_ms"], duration)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                name: {
+                    "count": int(stage["count"]),
+                    "mean_ms": round(stage["total_ms"] / stage["count"], MS_DECIMALS),
+                    "max_ms": round(stage["max_ms"], MS_DECIMALS),
+                }
+                for name, stage in self._stages.items()
+            }
+
+
+def _to_ms(seconds: float) -> float:
+    return round(seconds * MS_PER_SECOND, MS_DECIMALS)
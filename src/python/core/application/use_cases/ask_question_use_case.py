@@ -1,17 +1,27 @@
-from typing import List
+import asyncio
+import json
+from dataclasses import dataclass, field, replace
+from typing import Any, AsyncIterator, Dict, Hashable, List, Optional, Sequence, Tuple
 from ..dtos.chat_request_dto import ChatRequestDto
 from ..dtos.chat_result import ChatResult, ChatSource
 from ..protocols.embeddings_protocol import EmbeddingsClient
 from ..protocols.vector_store_protocol import VectorStore
-from ..protocols.structured_llm_protocol import StructuredLlmClient, ChatContext
+from ..protocols.structured_llm_protocol import StructuredLlmClient, ChatContext, StreamReset
 from ...domain.configuration.vector_metadata_config import DEFAULT_VECTOR_METADATA_CONFIG
 from ...infrastructure.shared.config_loader import get_config
-from ...infrastructure.shared.prompt_loader import load_prompt
+from ...infrastructure.shared.prompt_registry import PromptTemplate, get_prompt_registry
 from ..services.query_parser import QueryParser
+from ..services.parsed_query_cache import ParsedQueryCache, PreparedQuery, normalize_question
+from ..services.response_cache import ResponseCache
 from ..services.candidate_aggregator import CandidateAggregator
 from ..services.metadata_filter_builder import MetadataFilterBuilder
 from ..services.candidate_ranker import CandidateRanker
+from ..services.score_justifier import ScoreJustifier
+from ..services.context_assembler import ContextAssembler
+from ..services.stage_timings import StageTimer, StageTimingStats
 from ...domain.configuration.ranking_weights import RankingWeights
+from ...domain.enums.chat_mode import ChatMode
+from ...domain.enums.query_intent import QueryIntent
 from ...domain.entities.llm_response_schema import LlmResponseSchema, SelectedCandidate
 from ...domain.entities.llm_justification_schema import LlmJustificationSchema
 
@@ -29,6 +39,40 @@ ENGLISH_LEVEL_MAP = {"A1": 1, "A2": 2, "B1": 3, "B2": 4, "C1": 5, "C2": 6}
 
 PREPARED_KEY = "prepared"
 ENGLISH_LEVEL_NUM_MIN_KEY = "english_level_num_min"
+NO_CANDIDATES_ANSWER = "No candidates found matching the specified criteria."
+
+STREAM_EVENT_CANDIDATES = "candidates"
+STREAM_EVENT_TOKEN = "token"
+STREAM_EVENT_RESET = "reset"
+STREAM_EVENT_RESULT = "result"
+SCORE_DECIMALS = 4
+
+STAGE_PARSE = "parse"
+STAGE_EMBED = "embed"
+STAGE_PROMPTS = "prompts"
+STAGE_CACHE = "response_cache"
+STAGE_SEARCH = "search"
+STAGE_RANK = "rank"
+STAGE_CONTEXT = "context"
+STAGE_LLM = "llm"
+
+CONFIG_FAST_PATH = "fast_path"
+CONFIG_FAST_PATH_INTENTS = "intents"
+DEFAULT_FAST_PATH_INTENTS = ()
+
+
+@dataclass
+class _Retrieval:
+    """Everything known before the LLM call; result is set when no LLM call is needed."""
+    response_key: Hashable
+    query_embedding: Sequence[float]
+    ranked_candidates: List = field(default_factory=list)
+    sources: List[ChatSource] = field(default_factory=list)
+    chat_context: Optional[ChatContext] = None
+    prompt_tokens: int = 0
+    context_stats: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[ChatResult] = None
+    timer: StageTimer = field(default_factory=StageTimer)
 
 
 class AskQuestionUseCase:
@@ -41,9 +85,22 @@ class AskQuestionUseCase:
         self.embeddings_client = embeddings_client
         self.vector_store = vector_store
         self.structured_llm_client = structured_llm_client
+        self.prompts = get_prompt_registry()
         self.query_parser = QueryParser()
+        self.query_cache = ParsedQueryCache()
+        self.response_cache = ResponseCache()
+        self._index_generation = 0
+        self._index_version = self._current_index_version()
         self.candidate_aggregator = CandidateAggregator(METADATA_CONFIG.FIELD_CANDIDATE_ID)
-        self.candidate_ranker = CandidateRanker(RankingWeights.default())
+        ranking_weights = RankingWeights.default()
+        self.candidate_ranker = CandidateRanker(ranking_weights)
+        self.score_justifier = ScoreJustifier(ranking_weights)
+        self.context_assembler = ContextAssembler()
+        self.stage_timings = StageTimingStats()
+        fast_path_config = get_config().raw.get(CONFIG_FAST_PATH, {}) or {}
+        self.fast_path_intents = frozenset(
+            QueryIntent(intent) for intent in fast_path_config.get(CONFIG_FAST_PATH_INTENTS, DEFAULT_FAST_PATH_INTENTS) or ()
+        )
         self.filter_builder = MetadataFilterBuilder(
             candidate_id_field=METADATA_CONFIG.FIELD_CANDIDATE_ID,
             seniority_field=METADATA_CONFIG.FIELD_SENIORITY_LEVEL,
@@ -54,22 +111,115 @@ class AskQuestionUseCase:
         )
     
     async def execute(self, request: ChatRequestDto) -> ChatResult:
-        parsed_query = self.query_parser.parse(request.question)
+        retrieval = await self._retrieve(request)
+        if retrieval.result is None:
+            with retrieval.timer.stage(STAGE_LLM):
+                llm_justification = await self.structured_llm_client.generate_structured(retrieval.chat_context)
+            retrieval.result = self._complete(retrieval, llm_justification)
+        return self._finish(retrieval)
+    
+    async def stream(self, request: ChatRequestDto) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Yields (event, payload) pairs: the ranked candidates and sources once ranking is done,
+        then each LLM text delta, then the same ChatResult that execute() would return.
+        A reset event means the deltas so far were unparseable and must be discarded. Cache hits, empty searches and fast-path answers yield only the result."""
+        retrieval = await self._retrieve(request)
+        if retrieval.result is not None:
+            yield STREAM_EVENT_RESULT, self._finish(retrieval).model_dump()
+            return
         
-        query_embedding = self.embeddings_client.embed_query(request.question)
-        metadata_filter = self._build_metadata_filter(request.filters, parsed_query)
+        yield STREAM_EVENT_CANDIDATES, self._build_candidates_payload(retrieval)
         
-        search_results = self.vector_store.search(
-            query_embedding=query_embedding,
-            limit=DEFAULT_LIMIT,
-            filter_metadata=metadata_filter
-        )
+        llm_justification = None
+        with retrieval.timer.stage(STAGE_LLM):
+            async for item in self.structured_llm_client.astream_structured(retrieval.chat_context):
+                if isinstance(item, str):
+                    yield STREAM_EVENT_TOKEN, {"text": item}
+                elif isinstance(item, StreamReset):
+                    yield STREAM_EVENT_RESET, {"attempt": item.attempt}
+                else:
+                    llm_justification = item
         
-        if not search_results:
-            return ChatResult(
-                answer="No candidates found matching the specified criteria.",
-                sources=[]
+        retrieval.result = self._complete(retrieval, llm_justification)
+        yield STREAM_EVENT_RESULT, self._finish(retrieval).model_dump()
+    
+    async def _retrieve(self, request: ChatRequestDto) -> _Retrieval:
+        """Runs the pre-LLM stages:
+        
+            embed ----+--> response cache --> search --> rank --> context --> prompts --> render
+            parse ----+
+        
+        Only the embedding request overlaps other work: it runs in a worker
+        thread while the query is parsed. The vector search also runs in a
+        thread so the event loop stays free; the prompts come from the
+        in-memory registry and are read inline.
+        """
+        timer = StageTimer()
+        embedding_task = asyncio.create_task(self._embed(request.question, timer))
+        try:
+            with timer.stage(STAGE_PARSE):
+                prepared_query = self._prepare_query(request.question)
+                metadata_filter = self._build_metadata_filter(request.filters, prepared_query)
+            parsed_query = prepared_query.parsed_query
+            query_embedding = await embedding_task
+            
+            response_key = self._response_cache_key(metadata_filter, parsed_query)
+            retrieval = _Retrieval(response_key=response_key, query_embedding=query_embedding, timer=timer)
+            fast_path = self._use_fast_path(request.mode, parsed_query)
+            # Fast answers are cheaper to recompute than to look up, and must not be replaced by a cached LLM answer
+            with timer.stage(STAGE_CACHE):
+                cached = None if fast_path else self.response_cache.get(response_key, query_embedding)
+            if cached is not None:
+                retrieval.result = self._cached_result(*cached)
+                return retrieval
+            
+            with timer.stage(STAGE_SEARCH):
+                search_results = await asyncio.to_thread(
+                    self.vector_store.search,
+                    query_embedding=query_embedding,
+                    limit=DEFAULT_LIMIT,
+                    filter_metadata=metadata_filter
+                )
+            
+            with timer.stage(STAGE_RANK):
+                ranked_candidates = self._rank(search_results, parsed_query)
+            if not ranked_candidates:
+                retrieval.result = ChatResult(answer=NO_CANDIDATES_ANSWER, sources=[])
+                return retrieval
+            
+            retrieval.ranked_candidates = ranked_candidates
+            retrieval.sources = self._extract_sources_from_candidates(ranked_candidates)
+            if fast_path:
+                retrieval.result = self._fast_result(retrieval, parsed_query)
+                return retrieval
+            
+            with timer.stage(STAGE_CONTEXT):
+                assembled_context = self.context_assembler.assemble(ranked_candidates)
+                context = assembled_context.text
+            with timer.stage(STAGE_PROMPTS):
+                system_prompt, human_template = self._load_prompts()
+                human_prompt = human_template.render(context=context, input=request.question)
+            
+            retrieval.chat_context = ChatContext(
+                system_prompt=system_prompt,
+                user_message=human_prompt,
+                context=context
             )
+            retrieval.prompt_tokens = self._count_prompt_tokens(retrieval.chat_context)
+            retrieval.context_stats = assembled_context.stats()
+            return retrieval
+        finally:
+            _discard(embedding_task)
+    
+    async def _embed(self, question: str, timer: StageTimer) -> Sequence[float]:
+        with timer.stage(STAGE_EMBED):
+            return await asyncio.to_thread(self.embeddings_client.embed_query, question)
+    
+    def _load_prompts(self) -> Tuple[str, PromptTemplate]:
+        return self.prompts.get(CHAT_SYSTEM_FILE).text, self.prompts.get(CHAT_HUMAN_FILE)
+    
+    def _rank(self, search_results: List, parsed_query) -> List:
+        if not search_results:
+            return []
         
         aggregated_candidates = self.candidate_aggregator.aggregate(search_results)
         filtered_candidates = self.filter_builder.filter_aggregated_candidates(
@@ -78,42 +228,133 @@ class AskQuestionUseCase:
         )
         
         if not filtered_candidates:
-            return ChatResult(
-                answer="No candidates found matching the specified criteria.",
-                sources=[]
-            )
-        
-        ranked_candidates = self.candidate_ranker.rank(filtered_candidates, parsed_query)
+            return []
         
-        context = self._build_context_from_candidates(ranked_candidates)
-        sources = self._extract_sources_from_candidates(ranked_candidates)
-        
-        human_prompt = self._get_human_prompt(context, request.question)
-        system_prompt = self._get_system_prompt()
-        
-        chat_context = ChatContext(
-            system_prompt=system_prompt,
-            user_message=human_prompt,
-            context=context
-        )
-        llm_justification = await self.structured_llm_client.generate_structured(chat_context)
-        
-        parsed_response = self._build_final_response(llm_justification, ranked_candidates)
+        return self.candidate_ranker.rank(filtered_candidates, parsed_query)
+    
+    def _finish(self, retrieval: _Retrieval) -> ChatResult:
+        # Timings describe this request only, so they are added to a copy rather than to the cached result
+        timings = retrieval.timer.finish()
+        self.stage_timings.record(timings)
+        metadata = dict(retrieval.result.metadata or {})
+        metadata["timings_ms"] = timings
+        return retrieval.result.model_copy(update={"metadata": metadata})
+    
+    def _complete(self, retrieval: _Retrieval, llm_justification: LlmJustificationSchema) -> ChatResult:
+        parsed_response = self._build_final_response(llm_justification, retrieval.ranked_candidates)
         
         answer = self._format_final_answer(parsed_response)
         
         metadata = self._build_response_metadata(parsed_response)
+        metadata["prompt_tokens"] = retrieval.prompt_tokens
+        metadata["context"] = retrieval.context_stats
         
-        return ChatResult(
+        result = ChatResult(
             answer=answer,
-            sources=sources,
+            sources=retrieval.sources,
+            metadata=metadata
+        )
+        self.response_cache.put(retrieval.response_key, retrieval.query_embedding, result)
+        return result
+    
+    def _count_prompt_tokens(self, chat_context: ChatContext) -> int:
+        # Estimated over every part the adapter sends: system prompt, context message and human prompt
+        count = self.context_assembler.estimator.count
+        return count(chat_context.system_prompt) + count(chat_context.context or "") + count(chat_context.user_message)
+    
+    def _use_fast_path(self, mode: ChatMode, parsed_query) -> bool:
+        if mode == ChatMode.AUTO:
+            return parsed_query.query_intent in self.fast_path_intents
+        return mode == ChatMode.FAST
+    
+    def _fast_result(self, retrieval: _Retrieval, parsed_query) -> ChatResult:
+        justification = LlmJustificationSchema(
+            justification=self.score_justifier.justify(retrieval.ranked_candidates, parsed_query)
+        )
+        parsed_response = self._build_final_response(justification, retrieval.ranked_candidates)
+        metadata = self._build_response_metadata(parsed_response)
+        metadata["mode"] = ChatMode.FAST.value
+        metadata["ranked_candidates"] = self._summarize_ranked_candidates(retrieval.ranked_candidates)
+        return ChatResult(
+            answer=self._format_final_answer(parsed_response),
+            sources=retrieval.sources,
             metadata=metadata
         )
     
-    def _build_metadata_filter(self, filters, parsed_query):
-        tech_filter = self.filter_builder.build_technology_filters(parsed_query)
-        if tech_filter:
-            return tech_filter
+    def _build_candidates_payload(self, retrieval: _Retrieval) -> Dict[str, Any]:
+        return {
+            "candidates": self._summarize_ranked_candidates(retrieval.ranked_candidates),
+            "sources": [source.model_dump() for source in retrieval.sources]
+        }
+    
+    def _summarize_ranked_candidates(self, ranked_candidates: List) -> List[Dict[str, Any]]:
+        candidates = []
+        for rank, candidate in enumerate(ranked_candidates, 1):
+            candidates.append({
+                "rank": rank,
+                "candidate_id": candidate.candidate_id,
+                "fullname": candidate.metadata.get(METADATA_CONFIG.FIELD_FULLNAME, candidate.candidate_id),
+                "total_score": round(candidate.total_score, SCORE_DECIMALS),
+                "technical_score": round(candidate.technical_score, SCORE_DECIMALS),
+                "seniority_score": round(candidate.seniority_score, SCORE_DECIMALS),
+                "leadership_score": round(candidate.leadership_score, SCORE_DECIMALS),
+                "experience_score": round(candidate.experience_score, SCORE_DECIMALS)
+            })
+        return candidates
+    
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "parsed_query_cache": self.query_cache.stats(),
+            "response_cache": self.response_cache.stats(),
+            "stage_timings": self.stage_timings.stats()
+        }
+    
+    def on_index_changed(self) -> None:
+        # Answers computed against the old index must not be served; in-flight requests store under the old version
+        self._index_generation += 1
+        self._index_version = self._current_index_version()
+        self.response_cache.invalidate()
+    
+    def _current_index_version(self) -> Hashable:
+        # The physical collection changes on every blue/green switch; the generation on every local reindex
+        return (getattr(self.vector_store, "collection_name", None), self._index_generation)
+    
+    def _response_cache_key(self, metadata_filter, parsed_query) -> Hashable:
+        return (
+            self._index_version,
+            json.dumps(metadata_filter, sort_keys=True, default=str),
+            parsed_query.query_intent,
+            parsed_query.required_technologies,
+            parsed_query.min_seniority_level,
+            parsed_query.min_years_experience
+        )
+    
+    def _cached_result(self, result: ChatResult, similarity: float) -> ChatResult:
+        metadata = dict(result.metadata or {})
+        metadata["cache"] = {"hit": True, "similarity": round(similarity, 4)}
+        return result.model_copy(update={"metadata": metadata})
+    
+    def _prepare_query(self, question: str) -> PreparedQuery:
+        normalized_question = normalize_question(question)
+        prepared_query = self.query_cache.get_or_create(
+            (self.query_parser.config_version, normalized_question),
+            lambda: self._build_prepared_query(normalized_question)
+        )
+        # Every spelling of the question shares the entry; downstream sees the words actually asked
+        return replace(prepared_query, parsed_query=replace(prepared_query.parsed_query, query_text=question))
+    
+    def _build_prepared_query(self, normalized_question: str) -> PreparedQuery:
+        parsed_query = self.query_parser.parse(normalized_question)
+        return PreparedQuery(
+            normalized_question=normalized_question,
+            parsed_query=parsed_query,
+            technology_filter=self.filter_builder.build_technology_filters(parsed_query),
+            candidate_filters=tuple(self.filter_builder.build_candidate_filters(parsed_query))
+        )
+    
+    def _build_metadata_filter(self, filters, prepared_query: PreparedQuery):
+        if prepared_query.technology_filter:
+            return prepared_query.technology_filter
         
         conditions = []
         
@@ -127,8 +368,7 @@ class AskQuestionUseCase:
             if filters.candidate_ids:
                 conditions.append({METADATA_CONFIG.FIELD_CANDIDATE_ID: {IN_OPERATOR: filters.candidate_ids}})
         
-        query_filters = self.filter_builder.build_candidate_filters(parsed_query)
-        conditions.extend(query_filters)
+        conditions.extend(prepared_query.candidate_filters)
         
         if not conditions:
             return None
@@ -138,20 +378,6 @@ class AskQuestionUseCase:
         
         return {"$and": conditions}
     
-    def _build_context_from_candidates(self, candidates: List) -> str:
-        context_parts = []
-        for rank, candidate in enumerate(candidates, 1):
-            fullname = candidate.metadata.get(METADATA_CONFIG.FIELD_FULLNAME, candidate.candidate_id)
-            header = f"=== CANDIDATE #{rank}: {fullname} (ID: {candidate.candidate_id}) ==="
-            context_parts.append(header)
-            
-            for document in candidate.documents:
-                context_parts.append(document)
-            
-            context_parts.append("")
-        
-        return CONTEXT_SEPARATOR.join(context_parts)
-    
     def _extract_sources_from_candidates(self, candidates: List) -> List[ChatSource]:
         sources = []
         for candidate in candidates:
@@ -181,13 +407,6 @@ class AskQuestionUseCase:
             ))
         return sources
     
-    def _get_system_prompt(self) -> str:
-        return load_prompt(CHAT_SYSTEM_FILE)
-    
-    def _get_human_prompt(self, context: str, question: str) -> str:
-        human_template = load_prompt(CHAT_HUMAN_FILE)
-        return human_template.format(context=context, input=question)
-    
     def _build_final_response(self, llm_justification: LlmJustificationSchema, ranked_candidates: List) -> LlmResponseSchema:
         if not ranked_candidates:
             return LlmResponseSchema(
@@ -234,3 +453,11 @@ class AskQuestionUseCase:
             metadata["selected_candidate"] = None
         
         return metadata
+
+
+def _discard(task: asyncio.Task) -> None:
+    # A stage left behind by an early return or an error must not outlive the request or log an unretrieved exception
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
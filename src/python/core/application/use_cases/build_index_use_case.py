@@ -1,8 +1,17 @@
-from typing import List
+from pathlib import Path
+from typing import List, Optional
+from langchain_core.documents import Document
 from ..dtos.index_info import IndexInfo
 from ..protocols.embeddings_protocol import EmbeddingsClient
 from ..protocols.vector_store_protocol import VectorStore
+from ..services.blue_green_rebuild import BlueGreenRebuild
+from ..services.incremental_index_service import IncrementalIndexService
+from ..services.index_progress import IndexProgress
+from ..services.parallel_candidate_loader import ParallelCandidateLoader
 from ...domain.entities.candidate import Candidate
+from ...infrastructure.shared.index_manifest import IndexManifest
+from ...infrastructure.shared.chunk_ids import assign_chunk_ids
+from ...infrastructure.vectorstores.aliased_vector_store import AliasedVectorStore
 
 TYPE_KEY = "type"
 TYPE_CANDIDATE = "candidate"
@@ -12,6 +21,9 @@ ENGLISH_LEVEL_KEY = "english_level"
 ENGLISH_LEVEL_NUM_KEY = "english_level_num"
 PROVIDER_LANGCHAIN = "LangChain"
 ENGLISH_LEVEL_MAP = {"A1": 1, "A2": 2, "B1": 3, "B2": 4, "C1": 5, "C2": 6}
+JSON_FILE_PATTERN = "*.json"
+MANIFEST_NAMESPACE = "candidate_blocks"
+SECTION_BLOCK = "block"
 
 
 class BuildIndexUseCase:
@@ -33,13 +45,7 @@ class BuildIndexUseCase:
                 
                 for block in text_blocks:
                     documents.append(block)
-                    metadata.append({
-                        TYPE_KEY: TYPE_CANDIDATE,
-                        CANDIDATE_ID_KEY: candidate.candidate_id,
-                        PREPARED_KEY: candidate.prepared,
-                        ENGLISH_LEVEL_KEY: candidate.english_level,
-                        ENGLISH_LEVEL_NUM_KEY: self._english_level_to_num(candidate.english_level),
-                    })
+                    metadata.append(self._candidate_metadata(candidate))
             except Exception as e:
                 raise
         
@@ -50,6 +56,7 @@ class BuildIndexUseCase:
         
         try:
             self.vector_store.add_documents(documents, embeddings, metadata)
+            self.vector_store.flush()
         except Exception as e:
             raise
         
@@ -67,5 +74,58 @@ class BuildIndexUseCase:
         
         return result
     
+    async def execute_incremental(
+        self,
+        input_dir: Path,
+        force: bool = False,
+        progress: Optional[IndexProgress] = None
+    ) -> IndexInfo:
+        input_dir = Path(input_dir)
+        files = {path.name: path for path in sorted(input_dir.glob(JSON_FILE_PATTERN))} if input_dir.exists() else {}
+        source_hashes = {name: IndexManifest.hash_file(path) for name, path in files.items()}
+        
+        with ParallelCandidateLoader() as loader:
+            def sync(store, force: bool):
+                manifest = IndexManifest.for_provider(store.get_provider_name(), MANIFEST_NAMESPACE, store.collection_name)
+                return IncrementalIndexService(store, self.embeddings_client, manifest).sync(
+                    source_hashes,
+                    lambda names: self._candidate_documents(loader, [files[name] for name in names]),
+                    force=force,
+                    progress=progress
+                )
+            
+            if force and isinstance(self.vector_store, AliasedVectorStore):
+                result = BlueGreenRebuild(self.vector_store).run(lambda staging: sync(staging, True))
+            else:
+                result = sync(self.vector_store, force)
+        
+        return IndexInfo(
+            candidates=len(files) - result["sources_failed"],
+            chunks=result["chunks_written"],
+            points=result["points"],
+            provider=PROVIDER_LANGCHAIN,
+            metadata=result
+        )
+    
+    def _candidate_documents(self, loader: ParallelCandidateLoader, json_files: List[Path]):
+        for result in loader.load_candidates(json_files):
+            if not result.ok:
+                yield None, result.error
+                continue
+            candidate = result.value
+            metadata = self._candidate_metadata(candidate)
+            yield assign_chunk_ids(candidate.candidate_id, [(SECTION_BLOCK, [
+                Document(page_content=block, metadata=metadata) for block in candidate.to_text_blocks()
+            ])]), None
+    
+    def _candidate_metadata(self, candidate: Candidate) -> dict:
+        return {
+            TYPE_KEY: TYPE_CANDIDATE,
+            CANDIDATE_ID_KEY: candidate.candidate_id,
+            PREPARED_KEY: candidate.prepared,
+            ENGLISH_LEVEL_KEY: candidate.english_level,
+            ENGLISH_LEVEL_NUM_KEY: self._english_level_to_num(candidate.english_level),
+        }
+    
     def _english_level_to_num(self, level: str) -> int:
         return ENGLISH_LEVEL_MAP.get(level.upper(), 0)
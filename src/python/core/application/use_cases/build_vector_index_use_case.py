@@ -1,6 +1,7 @@
 import json
+import time
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from langchain_core.documents import Document
 
 from ...domain.entities.candidate_record import CandidateRecord
@@ -13,15 +14,33 @@ from ...infrastructure.embeddings.http_embeddings_client import HttpEmbeddingsCl
 from ...infrastructure.llm.llm import load_llm_instruction_records
 from ...infrastructure.shared.vector_provider_factory import VectorProviderFactory
 from ...infrastructure.shared.config_loader import get_config
-from ..services.candidate_factory import CandidateFactory
+from ...infrastructure.shared.index_manifest import IndexManifest
+from ...infrastructure.shared.ingest_checkpoint import IngestCheckpoint
+from ...infrastructure.shared.chunk_ids import assign_chunk_ids, chunk_ids_for_documents
+from ...infrastructure.vectorstores.aliased_vector_store import AliasedVectorStore
+from ..services.blue_green_rebuild import BlueGreenRebuild
+from ..services.incremental_index_service import IncrementalIndexService
+from ..services.index_pipeline import IndexPipeline
+from ..services.index_progress import IndexProgress
+from ..services.parallel_candidate_loader import ParallelCandidateLoader
 from ..services.vector_metadata_builder import VectorMetadataBuilder
 from ..services.skill_document_builder import SkillDocumentBuilder
 
 INPUT_SUBDIR = "input"
+INSTRUCTIONS_SUBDIR = "instructions"
 EMBEDDING_INSTRUCTION_FILE = "embeddings.jsonl"
 LLM_INSTRUCTION_FILE = "llm.jsonl"
 JSON_FILE_PATTERN = "*.json"
 
+CONFIG_INGEST = "ingest"
+CONFIG_BATCH_SIZE = "batch_size"
+DEFAULT_INGEST_BATCH_SIZE = 1000
+CHECKPOINT_INPUT_DIR = "input_dir"
+CHECKPOINT_LAST_FILE = "last_file"
+CHECKPOINT_FILES_DONE = "files_done"
+CHECKPOINT_FILES_FAILED = "files_failed"
+CHECKPOINT_CHUNKS_WRITTEN = "chunks_written"
+
 CHUNK_SIZE = 600
 CHUNK_OVERLAP = 60
 
@@ -44,6 +63,13 @@ EVIDENCE_FORMAT = ": {}"
 SEMICOLON_SEPARATOR = "; "
 EMPTY_STRING = ""
 
+SECTION_SUMMARY = "summary"
+SECTION_RESUME = "resume"
+SECTION_STRENGTHS = "strengths"
+SECTION_AREAS_TO_IMPROVE = "areas_to_improve"
+SECTION_SKILLS = "skills"
+SECTION_SKILL_PREFIX = "skill/"
+
 cfg = get_config()
 DATA_DIR = cfg.get_data_root()
 INPUT_DIR = cfg.get_input_dir()
@@ -52,7 +78,7 @@ METADATA_CONFIG = DEFAULT_VECTOR_METADATA_CONFIG
 METADATA_BUILDER = VectorMetadataBuilder(METADATA_CONFIG)
 SKILL_DOCUMENT_BUILDER = SkillDocumentBuilder(METADATA_CONFIG)
 
-__all__ = ["to_documents", "load_candidate_records", "build_index", "build_index_from_records"]
+__all__ = ["to_documents", "to_chunks", "load_candidate_records", "build_index", "build_index_from_records", "ingest"]
 
 
 def _english_to_num(level: str) -> int:
@@ -65,15 +91,15 @@ def load_candidate_records() -> list:
 
 def _load_candidate_records_from_dir(input_dir: Path) -> list:
     candidate_records = []
-    factory = CandidateFactory(validate_schema=True)
     
-    for file_path in sorted(input_dir.glob(JSON_FILE_PATTERN)):
-        try:
-            candidate_record = factory.from_json_file(file_path)
-            candidate_records.append(candidate_record)
-        except Exception as e:
-            print(f"Error loading {file_path} (schema validation failed): {e}")
+    with ParallelCandidateLoader() as loader:
+        results = loader.load_records(sorted(input_dir.glob(JSON_FILE_PATTERN)))
+    
+    for result in results:
+        if not result.ok:
+            print(f"Error loading {result.path} (schema validation failed): {result.error}")
             continue
+        candidate_records.append(result.value)
             
     return candidate_records
 
@@ -85,8 +111,26 @@ def to_documents(records: list) -> list:
     return _split_documents(docs)
 
 
+def to_chunks(record: CandidateRecord) -> list:
+    # Split per section so each chunk gets a stable (candidate_id, section, ordinal, hash) ID
+    candidate_id = _candidate_id(record)
+    return assign_chunk_ids(candidate_id, [
+        (section, _split_documents([document])) for section, document in _candidate_sections(record)
+    ])
+
+
+def _candidate_id(candidate: CandidateRecord) -> str:
+    if candidate.GeneralInfo and candidate.GeneralInfo.CandidateId:
+        return candidate.GeneralInfo.CandidateId
+    return UNKNOWN_VALUE
+
+
 def _candidate_to_documents(candidate: CandidateRecord) -> list:
-    documents = []
+    return [document for _, document in _candidate_sections(candidate)]
+
+
+def _candidate_sections(candidate: CandidateRecord) -> list:
+    sections = []
     
     candidate_id = UNKNOWN_VALUE
     english_level = UNKNOWN_VALUE
@@ -94,7 +138,7 @@ def _candidate_to_documents(candidate: CandidateRecord) -> list:
     years_experience = 0
     
     if candidate.GeneralInfo:
-        candidate_id = candidate.GeneralInfo.CandidateId or UNKNOWN_VALUE
+        candidate_id = _candidate_id(candidate)
         english_level = candidate.GeneralInfo.EnglishLevel or UNKNOWN_VALUE
         seniority_level = candidate.GeneralInfo.SeniorityLevel.value if candidate.GeneralInfo.SeniorityLevel else UNKNOWN_VALUE
         years_experience = candidate.GeneralInfo.YearsExperience if candidate.GeneralInfo.YearsExperience is not None else 0
@@ -109,16 +153,16 @@ def _candidate_to_documents(candidate: CandidateRecord) -> list:
     text_blocks = []
     
     if candidate.Summary:
-        text_blocks.append(f"{SUMMARY_PREFIX}{candidate.Summary}")
+        text_blocks.append((SECTION_SUMMARY, f"{SUMMARY_PREFIX}{candidate.Summary}"))
     
     if candidate.CleanedResumeText:
-        text_blocks.append(candidate.CleanedResumeText)
+        text_blocks.append((SECTION_RESUME, candidate.CleanedResumeText))
     
     if candidate.Strengths:
-        text_blocks.append(f"{STRENGTHS_PREFIX}{SEMICOLON_SEPARATOR.join(candidate.Strengths)}")
+        text_blocks.append((SECTION_STRENGTHS, f"{STRENGTHS_PREFIX}{SEMICOLON_SEPARATOR.join(candidate.Strengths)}"))
     
     if candidate.AreasToImprove:
-        text_blocks.append(f"{AREAS_TO_IMPROVE_PREFIX}{SEMICOLON_SEPARATOR.join(candidate.AreasToImprove)}")
+        text_blocks.append((SECTION_AREAS_TO_IMPROVE, f"{AREAS_TO_IMPROVE_PREFIX}{SEMICOLON_SEPARATOR.join(candidate.AreasToImprove)}"))
     
     if candidate.SkillMatrix:
         skills_text = []
@@ -129,14 +173,14 @@ def _candidate_to_documents(candidate: CandidateRecord) -> list:
             if skill.Evidence:
                 skill_desc += EVIDENCE_FORMAT.format(skill.Evidence)
             skills_text.append(skill_desc)
-        text_blocks.append(f"{SKILLS_PREFIX}{SEMICOLON_SEPARATOR.join(skills_text)}")
+        text_blocks.append((SECTION_SKILLS, f"{SKILLS_PREFIX}{SEMICOLON_SEPARATOR.join(skills_text)}"))
     
-    for block in text_blocks:
+    for section, block in text_blocks:
         if block.strip():
-            documents.append(Document(
+            sections.append((section, Document(
                 page_content=block,
                 metadata=metadata
-            ))
+            )))
     
     skill_documents = SKILL_DOCUMENT_BUILDER.build_skill_documents(
         candidate=candidate,
@@ -145,45 +189,218 @@ def _candidate_to_documents(candidate: CandidateRecord) -> list:
         years_experience=years_experience
     )
     
-    documents.extend(skill_documents)
+    for document in skill_documents:
+        skill_name = document.metadata.get(METADATA_CONFIG.FIELD_SKILL_NAME, EMPTY_STRING)
+        sections.append((f"{SECTION_SKILL_PREFIX}{skill_name}", document))
     
-    return documents
+    return sections
 
 
 def _split_documents(documents: list) -> list:
-    try:
-        from langchain_text_splitters import RecursiveCharacterTextSplitter
-    except Exception:
-        from langchain.text_splitter import RecursiveCharacterTextSplitter
-    splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
-    return splitter.split_documents(documents)
+    return _get_splitter().split_documents(documents)
 
 
-def build_index() -> dict:
-    records = load_candidate_records()
-    docs = to_documents(records)
+_splitter = None
 
-    instr_path = DATA_DIR / "instructions" / EMBEDDING_INSTRUCTION_FILE
-    if instr_path.exists():
-        docs += _load_and_split_instruction_docs(instr_path)
 
-    llm_instr_path = DATA_DIR / "instructions" / LLM_INSTRUCTION_FILE
-    if llm_instr_path.exists():
-        docs += _load_and_split_llm_instruction_docs(llm_instr_path)
+def _get_splitter():
+    global _splitter
+    if _splitter is None:
+        try:
+            from langchain_text_splitters import RecursiveCharacterTextSplitter
+        except Exception:
+            from langchain.text_splitter import RecursiveCharacterTextSplitter
+        _splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+    return _splitter
 
+
+def build_index(force: bool = False) -> dict:
     provider = VectorProviderFactory.create_provider()
-    result = provider.index_documents(docs)
+    embeddings = load_embeddings()
+
+    candidate_files = {path.name: path for path in sorted(INPUT_DIR.glob(JSON_FILE_PATTERN))}
+    instruction_files = _instruction_files()
+
+    source_hashes = {key: IndexManifest.hash_file(path) for key, path in candidate_files.items()}
+    source_hashes.update({key: IndexManifest.hash_file(path) for key, (path, _) in instruction_files.items()})
+
+    loader = ParallelCandidateLoader()
+    load_documents = _document_loader(loader, candidate_files, instruction_files)
+
+    def sync(store, force: bool):
+        manifest = IndexManifest.for_provider(store.get_provider_name(), collection=store.collection_name)
+        return IncrementalIndexService(store, embeddings, manifest).sync(source_hashes, load_documents, force=force)
+
+    try:
+        if force and isinstance(provider, AliasedVectorStore):
+            result = BlueGreenRebuild(provider).run(lambda staging: sync(staging, True))
+        else:
+            result = sync(provider, force)
+    finally:
+        loader.close()
     
-    print(f"✅ Indexed {result.get('chunks', len(docs))} documents using {provider.get_provider_name()}")
+    print(
+        f"✅ Indexed {result['chunks_written']} new documents using {provider.get_provider_name()} ({result['points']} total), "
+        f"{result['texts_embedded']} embedded, dedup ratio {result['dedup_ratio']:.1%}"
+    )
     
     return {
-        "candidates": len(records), 
-        "chunks": len(docs), 
+        "candidates": len(candidate_files), 
+        "chunks": result["chunks_written"], 
         "provider": provider.get_provider_name(),
         **result
     }
 
 
+def ingest(
+    input_dir: Optional[Path] = None,
+    batch_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    fresh: bool = False
+) -> dict:
+    """Incremental build for very large corpora, committed and checkpointed batch by batch.
+
+    Each batch of source files is embedded, written and recorded in the manifest
+    before the checkpoint moves past it, so a crashed run resumes after the last
+    committed batch. Sources removed from the input and instruction files are
+    handled in a final sweep.
+    """
+    input_dir = Path(input_dir) if input_dir else INPUT_DIR
+    ingest_config = get_config().raw.get(CONFIG_INGEST, {}) or {}
+    batch_size = max(1, batch_size or int(ingest_config.get(CONFIG_BATCH_SIZE, DEFAULT_INGEST_BATCH_SIZE)))
+
+    provider = VectorProviderFactory.create_provider()
+    provider_name, collection = provider.get_provider_name(), provider.collection_name
+    manifest = IndexManifest.for_provider(provider_name, collection=collection)
+    indexer = IncrementalIndexService(provider, load_embeddings(), manifest)
+    checkpoint = IngestCheckpoint.for_collection(provider_name, collection)
+
+    state = {} if fresh else checkpoint.load()
+    if state and (state.get(CHECKPOINT_INPUT_DIR) != str(input_dir.resolve()) or provider.count() == 0):
+        print(f"[INGEST] Checkpoint {checkpoint.path} does not match this input or index, starting over")
+        state = {}
+    if state:
+        print(f"[INGEST] Resuming after {state[CHECKPOINT_LAST_FILE]} ({state[CHECKPOINT_FILES_DONE]} files already committed)")
+
+    candidate_files = {path.name: path for path in sorted(input_dir.glob(JSON_FILE_PATTERN))}
+    instruction_files = _instruction_files()
+    cursor = state.get(CHECKPOINT_LAST_FILE)
+    pending = [name for name in candidate_files if cursor is None or name > cursor]
+    state = {
+        CHECKPOINT_INPUT_DIR: str(input_dir.resolve()),
+        CHECKPOINT_LAST_FILE: cursor,
+        CHECKPOINT_FILES_DONE: state.get(CHECKPOINT_FILES_DONE, 0),
+        CHECKPOINT_FILES_FAILED: state.get(CHECKPOINT_FILES_FAILED, 0),
+        CHECKPOINT_CHUNKS_WRITTEN: state.get(CHECKPOINT_CHUNKS_WRITTEN, 0),
+    }
+
+    progress = IndexProgress()
+    started = time.perf_counter()
+    batches = (len(pending) + batch_size - 1) // batch_size
+    print(f"[INGEST] {len(pending)} of {len(candidate_files)} files to process in {batches} batches of {batch_size}")
+
+    with ParallelCandidateLoader(workers=workers) as loader:
+        load_documents = _document_loader(loader, candidate_files, instruction_files)
+        for number, start in enumerate(range(0, len(pending), batch_size), 1):
+            keys = pending[start:start + batch_size]
+            hashes = {key: IndexManifest.hash_file(candidate_files[key]) for key in keys}
+            result = indexer.sync(hashes, load_documents, progress=progress, prune=False)
+
+            state[CHECKPOINT_LAST_FILE] = keys[-1]
+            state[CHECKPOINT_FILES_DONE] += len(keys)
+            state[CHECKPOINT_FILES_FAILED] += result["sources_failed"]
+            state[CHECKPOINT_CHUNKS_WRITTEN] += result["chunks_written"]
+            checkpoint.save(state)
+            _print_ingest_progress(number, batches, start + len(keys), len(pending), time.perf_counter() - started, progress)
+
+        # Files that sort before a resumed cursor, instruction files and deleted sources
+        known = set(manifest.sources())
+        pending_names = set(pending)
+        sweep = {
+            name: IndexManifest.hash_file(path) for name, path in candidate_files.items()
+            if name not in known and name not in pending_names
+        }
+        sweep.update({key: IndexManifest.hash_file(path) for key, (path, _) in instruction_files.items()})
+        indexer.sync(sweep, load_documents, progress=progress, prune=False)
+        removed = [key for key in known if key not in candidate_files and key not in instruction_files]
+        if removed:
+            indexer.remove_sources(removed, progress)
+
+    checkpoint.clear()
+    snapshot = progress.snapshot()
+    print(
+        f"✅ Ingested {state[CHECKPOINT_FILES_DONE]} files ({state[CHECKPOINT_FILES_FAILED]} failed) into "
+        f"{provider_name}/{collection}: {snapshot['chunks_written']} chunks written this run in "
+        f"{snapshot['elapsed_seconds']}s, {provider.count()} points total"
+    )
+    return {
+        "candidates": len(candidate_files),
+        "provider": provider_name,
+        "collection": collection,
+        **state,
+        **snapshot,
+    }
+
+
+def _print_ingest_progress(
+    number: int,
+    batches: int,
+    done: int,
+    total_files: int,
+    elapsed: float,
+    progress: IndexProgress
+) -> None:
+    # done counts unchanged files too, they are what a resumed or repeated run mostly skips
+    snapshot = progress.snapshot()
+    files_per_second = done / elapsed if elapsed > 0 else 0.0
+    remaining = max(0, total_files - done)
+    eta = remaining / files_per_second if files_per_second > 0 else 0.0
+    print(
+        f"[INGEST] batch {number}/{batches}: {done}/{total_files} files "
+        f"({done / total_files:.1%}), {files_per_second:.1f} files/s, "
+        f"{snapshot['chunks_per_second']} chunks/s, dedup {snapshot['chunks_deduplicated']}, "
+        f"ETA {_format_duration(eta)}"
+    )
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{seconds:02d}s" if hours else f"{minutes}m{seconds:02d}s"
+
+
+def _instruction_files() -> dict:
+    # Instruction files are chunked as a whole; the source key stands in for a candidate_id
+    instruction_files = {}
+    instr_path = DATA_DIR / INSTRUCTIONS_SUBDIR / EMBEDDING_INSTRUCTION_FILE
+    if instr_path.exists():
+        instruction_files[f"{INSTRUCTIONS_SUBDIR}/{EMBEDDING_INSTRUCTION_FILE}"] = (instr_path, _load_and_split_instruction_docs)
+
+    llm_instr_path = DATA_DIR / INSTRUCTIONS_SUBDIR / LLM_INSTRUCTION_FILE
+    if llm_instr_path.exists():
+        instruction_files[f"{INSTRUCTIONS_SUBDIR}/{LLM_INSTRUCTION_FILE}"] = (llm_instr_path, _load_and_split_llm_instruction_docs)
+    return instruction_files
+
+
+def _document_loader(loader: ParallelCandidateLoader, candidate_files: dict, instruction_files: dict):
+    def load_documents(keys: list):
+        # Records for one load batch are parsed and chunked in the loader's worker processes
+        candidate_keys = [key for key in keys if key in candidate_files]
+        loaded = dict(zip(candidate_keys, loader.load_records([candidate_files[key] for key in candidate_keys], to_chunks)))
+        
+        for key in keys:
+            if key in loaded:
+                result = loaded.pop(key)
+                yield (result.value, None) if result.ok else (None, result.error)
+                continue
+            path, load_instructions = instruction_files[key]
+            try:
+                yield chunk_ids_for_documents(load_instructions(path), owner_id=key), None
+            except Exception as e:
+                yield None, str(e)
+    return load_documents
+
+
 def _load_and_split_instruction_docs(instr_path: Path) -> list:
     cfg = get_config()
     http_client = HttpEmbeddingsClient(base_url=cfg.get_embeddings_base_url())
@@ -209,11 +426,15 @@ def build_index_from_records(records: list):
     docs = to_documents(records)
     
     provider = VectorProviderFactory.create_provider()
-    result = provider.index_documents(docs)
+    # Through the pipeline rather than provider.index_documents, so repeated chunk texts are embedded once
+    stats = IndexPipeline(provider, load_embeddings()).run(chunk_ids_for_documents(docs))
+    provider.flush()
     
     return {
         "candidates": len(records), 
         "chunks": len(docs), 
         "provider": provider.get_provider_name(),
-        **result
+        "points": provider.count(),
+        "texts_embedded": stats.texts_embedded,
+        "dedup_ratio": round(stats.dedup_ratio, 4)
     }
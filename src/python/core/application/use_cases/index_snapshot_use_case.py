@@ -0,0 +1,127 @@
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from ...domain.enums.vector_provider_type import VectorProviderType
+from ...infrastructure.shared.config_loader import get_config
+from ...infrastructure.shared.index_manifest import IndexManifest
+from ...infrastructure.shared.index_snapshot import IndexSnapshot, IndexSnapshotWriter, embedding_fingerprint
+from ...infrastructure.shared.vector_provider_factory import VectorProviderFactory
+from ...infrastructure.vectorstores.aliased_vector_store import AliasedVectorStore
+from ..services.blue_green_rebuild import BlueGreenRebuild, configured_verify_timeout, verify_point_count
+
+CONFIG_INDEX_SNAPSHOT = "index_snapshot"
+CONFIG_PATH = "path"
+CONFIG_BATCH_SIZE = "batch_size"
+DEFAULT_SNAPSHOT_SUBDIR = "snapshots/candidates"
+DEFAULT_BATCH_SIZE = 8192
+STAGING_SUFFIX = "_import_"
+
+
+def export_index(path: Optional[Path] = None) -> Dict[str, Any]:
+    path = Path(path) if path else _default_path()
+    provider = VectorProviderFactory.create_provider()
+    provider_name = provider.get_provider_name()
+    collection = provider.collection_name
+
+    writer = IndexSnapshotWriter(path)
+    try:
+        for ids, vectors, documents, metadata in provider.export_points(_batch_size()):
+            writer.add(ids, vectors, documents, metadata)
+        manifests = {manifest.namespace: manifest.entries() for manifest in IndexManifest.for_collection(provider_name, collection)}
+        info = writer.commit(provider_name, collection, manifests)
+    except BaseException:
+        writer.abort()
+        raise
+
+    print(f"[SNAPSHOT] Exported {info['count']} points from {provider_name}/{collection} to {path}")
+    return info
+
+
+def import_index(path: Optional[Path] = None, force: bool = False) -> Dict[str, Any]:
+    # Vectors come from the snapshot as-is: the embedding model is never called
+    path = Path(path) if path else _default_path()
+    snapshot = IndexSnapshot(path)
+    if not force:
+        snapshot.check_fingerprint(embedding_fingerprint())
+
+    provider = VectorProviderFactory.create_provider()
+    batch_size = _batch_size()
+
+    def load(store) -> Dict[str, Any]:
+        _load_points(snapshot, store, batch_size)
+        _write_manifests(snapshot, store)
+        return {"chunks_indexed": snapshot.count, "points": store.count()}
+
+    if isinstance(provider, AliasedVectorStore):
+        result = BlueGreenRebuild(provider).run(load)
+    else:
+        result = _import_in_place(snapshot, provider, batch_size)
+
+    print(f"[SNAPSHOT] Imported {snapshot.count} points from {path} ({result['points']} in the index)")
+    return {**snapshot.info, **result}
+
+
+def _import_in_place(snapshot: IndexSnapshot, live, batch_size: int) -> Dict[str, Any]:
+    """Without aliases there is no switch to flip, so the live collection is never dropped.
+
+    The snapshot is first loaded into a throwaway staging collection and its
+    point count checked, so a bad snapshot or a failing store leaves the live
+    index and its manifests untouched. Only then are the points upserted into
+    the live collection and the ones the snapshot lacks deleted; readers see
+    the old points, then a superset, then the snapshot.
+    """
+    staging = VectorProviderFactory.create_provider(
+        VectorProviderType.from_string(live.get_provider_name()),
+        collection=f"{live.collection_name}{STAGING_SUFFIX}{uuid.uuid4().hex[:8]}"
+    )
+    print(f"[SNAPSHOT] Staging the import in {staging.collection_name}")
+    try:
+        _load_points(snapshot, staging, batch_size)
+        verify_point_count(staging, snapshot.count, configured_verify_timeout())
+    finally:
+        staging.drop_collection()
+
+    stale_ids = _point_ids(live, batch_size)
+    stale_ids.difference_update(_load_points(snapshot, live, batch_size))
+    deleted = live.delete_documents(sorted(stale_ids)) if stale_ids else 0
+    live.flush()
+    _write_manifests(snapshot, live)
+    return {"chunks_indexed": snapshot.count, "points": live.count(), "deleted": deleted}
+
+
+def _load_points(snapshot: IndexSnapshot, store, batch_size: int) -> Set[str]:
+    loaded: Set[str] = set()
+    for ids, vectors, documents, metadata in snapshot.batches(batch_size):
+        store.add_documents(documents, vectors.tolist(), metadata, ids)
+        loaded.update(ids)
+    store.flush()
+    return loaded
+
+
+def _write_manifests(snapshot: IndexSnapshot, store) -> None:
+    # Namespaces the snapshot does not carry would describe points that are gone
+    IndexManifest.remove_for_collection(store.get_provider_name(), store.collection_name)
+    for namespace, entries in snapshot.manifests().items():
+        manifest = IndexManifest.for_provider(store.get_provider_name(), namespace, store.collection_name)
+        manifest.reset()
+        for key, entry in entries.items():
+            manifest.record(key, entry["hash"], entry["chunk_ids"])
+        manifest.save()
+
+
+def _point_ids(store, batch_size: int) -> Set[str]:
+    ids: Set[str] = set()
+    for batch_ids, _, _, _ in store.export_points(batch_size):
+        ids.update(batch_ids)
+    return ids
+
+
+def _default_path() -> Path:
+    cfg = get_config()
+    configured = (cfg.raw.get(CONFIG_INDEX_SNAPSHOT, {}) or {}).get(CONFIG_PATH, DEFAULT_SNAPSHOT_SUBDIR)
+    return cfg.get_data_root() / configured
+
+
+def _batch_size() -> int:
+    return int((get_config().raw.get(CONFIG_INDEX_SNAPSHOT, {}) or {}).get(CONFIG_BATCH_SIZE, DEFAULT_BATCH_SIZE))
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Optional, Tuple
 from ..enums.seniority_level import SeniorityLevel
 from ..enums.query_intent import QueryIntent
 
@@ -8,6 +8,6 @@ from ..enums.query_intent import QueryIntent
 class ParsedQuery:
     query_text: str
     query_intent: QueryIntent
-    required_technologies: List[str]
+    required_technologies: Tuple[str, ...]
     min_seniority_level: Optional[SeniorityLevel]
     min_years_experience: Optional[int]
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ChatMode(Enum):
+    AUTO = "auto"
+    LLM = "llm"
+    FAST = "fast"
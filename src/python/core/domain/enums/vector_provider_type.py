@@ -2,11 +2,15 @@ from enum import Enum
 
 PROVIDER_NATIVE = "NATIVE"
 PROVIDER_QDRANT = "QDRANT"
+PROVIDER_FAISS = "FAISS"
+PROVIDER_NUMPY = "NUMPY"
 DEFAULT_PROVIDER = PROVIDER_QDRANT
 
 class VectorProviderType(Enum):
     NATIVE = PROVIDER_NATIVE
     QDRANT = PROVIDER_QDRANT
+    FAISS = PROVIDER_FAISS
+    NUMPY = PROVIDER_NUMPY
 
     @classmethod
     def from_string(cls, value: str) -> 'VectorProviderType':
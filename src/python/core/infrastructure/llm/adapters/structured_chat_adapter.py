@@ -2,14 +2,15 @@
 
 import json
 import logging
-from typing import TypeVar, Generic, Type
+from typing import Any, AsyncIterator, Dict, Optional, TypeVar, Generic, Type, Union
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
 from pydantic import BaseModel
 
-from core.application.protocols.structured_llm_protocol import ChatContext
+from core.application.protocols.structured_llm_protocol import ChatContext, StreamReset
 from core.infrastructure.llm.exceptions.llm_output_validation_error import LlmOutputValidationError
 from core.infrastructure.llm.extraction.llm_output_extractor import extract_json
+from core.infrastructure.llm.cache.llm_response_cache import LlmResponseCache, llm_cache_key
 
 
 T = TypeVar('T', bound=BaseModel)
@@ -25,15 +26,19 @@ class StructuredChatAdapter(Generic[T]):
     
     RETRY_USER_PROMPT = "Your previous response was not valid JSON. Respond ONLY with the valid JSON object. No markdown, no explanation."
     MAX_ATTEMPTS = 2
+    DETERMINISTIC_TEMPERATURE = 0
     
-    def __init__(self, chat_model: BaseChatModel, output_type: Type[T]):
+    def __init__(self, chat_model: BaseChatModel, output_type: Type[T], cache: Optional[LlmResponseCache] = None):
         """
         Args:
             chat_model: LangChain BaseChatModel (e.g., ChatOllama, ChatOpenAI)
             output_type: Pydantic model class to deserialize into
+            cache: Optional store of parsed outputs keyed by the exact prompt and model config.
+                Only used when the model runs at temperature 0, where repeats are deterministic.
         """
         self.chat_model = chat_model
         self.output_type = output_type
+        self.cache = cache
     
     async def generate_structured(self, chat_context: ChatContext) -> T:
         """
@@ -49,9 +54,63 @@ class StructuredChatAdapter(Generic[T]):
             LlmOutputValidationError: If parsing fails after all retries
         """
         messages = self._build_messages(chat_context)
-        last_raw_output = None
+        cache_key = self._cache_key(messages)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
         
-        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+        return await self._generate(messages, cache_key)
+    
+    async def astream_structured(self, chat_context: ChatContext) -> AsyncIterator[Union[str, StreamReset, T]]:
+        """
+        Stream the first attempt's raw text as it is generated, then the parsed output.
+        
+        Args:
+            chat_context: Prompt context
+            
+        Yields:
+            Text deltas (str) while the model generates, and finally the
+            deserialized Pydantic model of type T. A cache hit yields only
+            the model. If the streamed text does not parse, a StreamReset
+            tells the consumer to discard it before the corrective retry,
+            which is not streamed.
+            
+        Raises:
+            LlmOutputValidationError: If parsing fails after all retries
+        """
+        messages = self._build_messages(chat_context)
+        cache_key = self._cache_key(messages)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            yield cached
+            return
+        
+        parts = []
+        async for chunk in self.chat_model.astream(messages):
+            if isinstance(chunk.content, str) and chunk.content:
+                parts.append(chunk.content)
+                yield chunk.content
+        
+        raw_output = "".join(parts)
+        result = self._try_parse_output(raw_output, 1)
+        if result is None:
+            yield StreamReset(attempt=2)
+            messages.append(AIMessage(content=raw_output))
+            messages.append(HumanMessage(content=self.RETRY_USER_PROMPT))
+            result = await self._generate(messages, cache_key, first_attempt=2, last_raw_output=raw_output)
+        elif cache_key is not None:
+            self.cache.put(cache_key, result.model_dump(mode="json"))
+        yield result
+    
+    async def _generate(
+        self,
+        messages: list,
+        cache_key: Optional[str],
+        first_attempt: int = 1,
+        last_raw_output: Optional[str] = None
+    ) -> T:
+        """Invoke the model until its output parses, appending a corrective prompt after each failure."""
+        for attempt in range(first_attempt, self.MAX_ATTEMPTS + 1):
             response = await self.chat_model.ainvoke(messages)
             last_raw_output = response.content
             
@@ -62,6 +121,8 @@ class StructuredChatAdapter(Generic[T]):
             
             result = self._try_parse_output(last_raw_output, attempt)
             if result is not None:
+                if cache_key is not None:
+                    self.cache.put(cache_key, result.model_dump(mode="json"))
                 return result
             
             messages.append(AIMessage(content=last_raw_output))
@@ -72,6 +133,27 @@ class StructuredChatAdapter(Generic[T]):
             last_raw_output
         )
     
+    def _cached(self, cache_key: Optional[str]) -> Optional[T]:
+        if cache_key is None:
+            return None
+        cached = self.cache.get(cache_key)
+        return self.output_type(**cached) if cached is not None else None
+    
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Hit/miss counters of the response cache, or None without one."""
+        return self.cache.stats() if self.cache is not None else None
+    
+    def _cache_key(self, messages: list) -> Optional[str]:
+        """Hash of the full message list and model config; None when responses must not be cached."""
+        if self.cache is None or getattr(self.chat_model, "temperature", None) != self.DETERMINISTIC_TEMPERATURE:
+            return None
+        model_config = {
+            "class": type(self.chat_model).__name__,
+            "temperature": self.chat_model.temperature,
+            **self.chat_model._identifying_params
+        }
+        return llm_cache_key(messages, model_config, self.output_type)
+    
     def _try_parse_output(self, raw_output: str, attempt: int) -> T | None:
         """Attempt to parse raw output into typed model."""
         try:
@@ -0,0 +1,225 @@
+"""Caches for parsed structured LLM responses, keyed by the exact prompt and model config."""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+from core.infrastructure.shared.config_loader import get_config
+
+CONFIG_LLM_CACHE = "llm_cache"
+CONFIG_ENABLED = "enabled"
+CONFIG_MEMORY_ENTRIES = "memory_entries"
+CONFIG_DISK = "disk"
+CONFIG_PATH = "path"
+CONFIG_MAX_MB = "max_mb"
+
+DEFAULT_ENABLED = False
+DEFAULT_MEMORY_ENTRIES = 1000
+DEFAULT_DISK_ENABLED = False
+DEFAULT_DISK_PATH = "cache/llm"
+DEFAULT_MAX_MB = 256
+BYTES_PER_MB = 1024 * 1024
+ENTRY_SUFFIX = ".json"
+TMP_SUFFIX = ".tmp"
+FILE_ENCODING = "utf-8"
+SHARD_LENGTH = 2
+# Eviction stops below the limit so the next rescan is some writes away
+LOW_WATER_FRACTION = 0.9
+
+
+class LlmResponseCache(Protocol):
+    def get(self, key: str) -> Optional[Dict[str, Any]]: ...
+
+    def put(self, key: str, value: Dict[str, Any]) -> None: ...
+
+    def stats(self) -> Dict[str, Any]: ...
+
+
+def llm_cache_key(messages: List[Any], model_config: Dict[str, Any], output_type: type) -> str:
+    """SHA-256 over every message (role and content), the model's identifying config and the output schema."""
+    payload = {
+        "messages": [[message.type, message.content] for message in messages],
+        "model": model_config,
+        "output": _output_schema(output_type),
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode(FILE_ENCODING)
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _output_schema(output_type: type) -> str:
+    # Generating a pydantic JSON schema costs ~0.3 ms, more than the rest of a cache hit
+    return json.dumps([output_type.__name__, output_type.model_json_schema()], sort_keys=True)
+
+
+class MemoryLlmCache:
+    """LRU of response dicts, bounded by entry count."""
+
+    def __init__(self, max_entries: int = DEFAULT_MEMORY_ENTRIES):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "max_entries": self._max_entries, "hits": self._hits, "misses": self._misses}
+
+
+class DiskLlmCache:
+    """One JSON file per key under directory/<first 2 hex chars>/, bounded by total bytes.
+
+    Files are written atomically (tmp + rename), so concurrent API processes
+    can share the directory. The limit covers the whole directory: each
+    process rescans it once its own writes have used half of the headroom
+    left at its last scan, so entries written by other processes count too.
+    When the total passes max_bytes the least recently used files (by mtime;
+    a hit touches its file) are deleted down to LOW_WATER_FRACTION of it.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._rescan_at_bytes = 0
+        self._scan()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with path.open("r", encoding=FILE_ENCODING) as fh:
+                value = json.load(fh)
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self._misses += 1
+            return None
+        with self._lock:
+            self._hits += 1
+            if key in self._sizes:
+                self._sizes.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        path = self._path(key)
+        data = json.dumps(value, ensure_ascii=False).encode(FILE_ENCODING)
+        if len(data) > self._max_bytes:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f"{ENTRY_SUFFIX}.{os.getpid()}.{threading.get_ident()}{TMP_SUFFIX}")
+        with tmp_path.open("wb") as fh:
+            fh.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._total_bytes += len(data) - self._sizes.pop(key, 0)
+            self._sizes[key] = len(data)
+            if self._total_bytes >= self._rescan_at_bytes:
+                self._scan()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._sizes),
+                "bytes": self._total_bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def _path(self, key: str) -> Path:
+        return self._directory / key[:SHARD_LENGTH] / f"{key}{ENTRY_SUFFIX}"
+
+    def _scan(self) -> None:
+        self._sizes.clear()
+        self._total_bytes = 0
+        files: List[Tuple[float, str, int]] = []
+        if self._directory.exists():
+            for path in self._directory.glob(f"*/*{ENTRY_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(files):
+            self._sizes[key] = size
+            self._total_bytes += size
+
+        if self._total_bytes > self._max_bytes:
+            low_water = int(self._max_bytes * LOW_WATER_FRACTION)
+            while self._total_bytes > low_water and self._sizes:
+                old_key, size = self._sizes.popitem(last=False)
+                self._total_bytes -= size
+                self._path(old_key).unlink(missing_ok=True)
+        self._rescan_at_bytes = self._total_bytes + max(0, self._max_bytes - self._total_bytes) // 2
+
+
+class TieredLlmCache:
+    """Memory in front of disk; disk hits are promoted to memory."""
+
+    def __init__(self, memory: MemoryLlmCache, disk: Optional[DiskLlmCache] = None):
+        self._memory = memory
+        self._disk = disk
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        value = self._memory.get(key)
+        if value is None and self._disk is not None:
+            value = self._disk.get(key)
+            if value is not None:
+                self._memory.put(key, value)
+        return value
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        self._memory.put(key, value)
+        if self._disk is not None:
+            self._disk.put(key, value)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"memory": self._memory.stats(), "disk": self._disk.stats() if self._disk is not None else None}
+
+
+def create_llm_response_cache() -> Optional[LlmResponseCache]:
+    """Builds the cache described by the llm_cache config section, or None when it is disabled."""
+    cfg = get_config()
+    cache_config = cfg.raw.get(CONFIG_LLM_CACHE, {}) or {}
+    if not cache_config.get(CONFIG_ENABLED, DEFAULT_ENABLED):
+        return None
+
+    memory = MemoryLlmCache(int(cache_config.get(CONFIG_MEMORY_ENTRIES, DEFAULT_MEMORY_ENTRIES)))
+    disk_config = cache_config.get(CONFIG_DISK, {}) or {}
+    disk = None
+    if disk_config.get(CONFIG_ENABLED, DEFAULT_DISK_ENABLED):
+        disk = DiskLlmCache(
+            cfg.get_data_root() / disk_config.get(CONFIG_PATH, DEFAULT_DISK_PATH),
+            int(float(disk_config.get(CONFIG_MAX_MB, DEFAULT_MAX_MB)) * BYTES_PER_MB)
+        )
+    return TieredLlmCache(memory, disk)
@@ -0,0 +1,78 @@
+import hashlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+CANDIDATE_ID_KEY = "candidate_id"
+TYPE_KEY = "type"
+SKILL_NAME_KEY = "skill_name"
+DEFAULT_OWNER = "doc"
+DEFAULT_SECTION = "document"
+SECTION_SEPARATOR = "/"
+ID_SEPARATOR = ":"
+TEXT_ENCODING = "utf-8"
+HASH_PREFIX_LENGTH = 16
+
+
+def make_chunk_id(owner_id: str, section: str, ordinal: int, text: str) -> str:
+    digest = hashlib.sha256(text.encode(TEXT_ENCODING)).hexdigest()[:HASH_PREFIX_LENGTH]
+    return ID_SEPARATOR.join((str(owner_id), section, str(ordinal), digest))
+
+
+def assign_chunk_ids(owner_id: str, sections: Iterable[Tuple[str, List[Document]]]) -> List[Tuple[Document, str]]:
+    """Pairs every chunk with an ID derived from owner, section, ordinal and text.
+
+    Ordinals count per section, so editing one section leaves the IDs of the
+    others untouched. A text repeated within a section is kept once, at its
+    first position, and does not advance the ordinal.
+    """
+    ordinals: Dict[str, int] = defaultdict(int)
+    seen: Dict[str, set] = defaultdict(set)
+    chunks = []
+    for section, documents in sections:
+        for document in documents:
+            if document.page_content in seen[section]:
+                continue
+            seen[section].add(document.page_content)
+            chunks.append((document, make_chunk_id(owner_id, section, ordinals[section], document.page_content)))
+            ordinals[section] += 1
+    return chunks
+
+
+def content_ids(documents: List[str], metadata: Optional[List[dict]] = None) -> List[str]:
+    """One content-derived ID per document, for callers that pass raw texts without IDs.
+
+    Unlike chunk_ids_for_documents nothing is dropped, so the result lines up
+    with the caller's embeddings; re-adding the same documents yields the same IDs.
+    """
+    ordinals: Dict[Tuple[str, str], int] = defaultdict(int)
+    ids = []
+    for i, text in enumerate(documents):
+        meta = (metadata[i] if metadata and i < len(metadata) else None) or {}
+        owner = meta.get(CANDIDATE_ID_KEY) or DEFAULT_OWNER
+        section = _section_of(meta)
+        ids.append(make_chunk_id(owner, section, ordinals[(owner, section)], text))
+        ordinals[(owner, section)] += 1
+    return ids
+
+
+def chunk_ids_for_documents(documents: List[Document], owner_id: Optional[str] = None) -> List[Tuple[Document, str]]:
+    # Owner and section come from the metadata when the caller has no finer structure to offer
+    grouped: Dict[str, List[Tuple[str, Document]]] = defaultdict(list)
+    for document in documents:
+        metadata = document.metadata or {}
+        owner = metadata.get(CANDIDATE_ID_KEY) or owner_id or DEFAULT_OWNER
+        grouped[owner].append((_section_of(metadata), document))
+
+    chunks = []
+    for owner, sections in grouped.items():
+        chunks.extend(assign_chunk_ids(owner, ((section, [document]) for section, document in sections)))
+    return chunks
+
+
+def _section_of(metadata: dict) -> str:
+    section = metadata.get(TYPE_KEY) or DEFAULT_SECTION
+    if metadata.get(SKILL_NAME_KEY):
+        section = f"{section}{SECTION_SEPARATOR}{metadata[SKILL_NAME_KEY]}"
+    return section
@@ -0,0 +1,148 @@
+import json
+import os
+import re
+from pathlib import Path
+from typing import List, Optional
+
+from .config_loader import get_config
+
+VERSION_SEPARATOR = "_v"
+VECTORS_SUBDIR = "vectors"
+ALIASES_SUBDIR = "aliases"
+ALIAS_SUFFIX = ".alias.json"
+TMP_SUFFIX = ".tmp"
+FILE_ENCODING = "utf-8"
+
+POINTER_ALIAS_KEY = "alias"
+POINTER_CURRENT_KEY = "current"
+POINTER_VERSIONS_KEY = "versions"
+
+
+class _VersionNaming:
+    """Version naming shared by the CollectionAliases implementations: {alias}_v{n}."""
+
+    def __init__(self, alias: str):
+        self.alias = alias
+        self._version_pattern = re.compile(rf"^{re.escape(alias)}{VERSION_SEPARATOR}(\d+)$")
+
+    def resolve(self) -> str:
+        return self.current() or self.alias
+
+    def _version_number(self, collection: str) -> Optional[int]:
+        match = self._version_pattern.match(collection)
+        return int(match.group(1)) if match else None
+
+    def _sorted_versions(self, names: List[str]) -> List[str]:
+        versioned = [name for name in names if self._version_number(name) is not None]
+        return sorted(versioned, key=self._version_number)
+
+    def _next_name(self, names: List[str]) -> str:
+        numbers = [self._version_number(name) for name in names]
+        highest = max((number for number in numbers if number is not None), default=0)
+        return f"{self.alias}{VERSION_SEPARATOR}{highest + 1}"
+
+
+class FileCollectionAliases(_VersionNaming):
+    """Pointer file for providers that keep collections on local disk (FAISS, NumPy, Chroma)."""
+
+    def __init__(self, path: Path, alias: str):
+        super().__init__(alias)
+        self._path = Path(path)
+
+    @classmethod
+    def for_provider(cls, provider_name: str, alias: str) -> "FileCollectionAliases":
+        directory = get_config().get_data_root() / VECTORS_SUBDIR / ALIASES_SUBDIR
+        return cls(directory / f"{provider_name.lower()}_{alias}{ALIAS_SUFFIX}", alias)
+
+    def current(self) -> Optional[str]:
+        return self._read().get(POINTER_CURRENT_KEY)
+
+    def versions(self) -> List[str]:
+        return self._sorted_versions(self._read().get(POINTER_VERSIONS_KEY, []))
+
+    def allocate(self) -> str:
+        # Recorded before the build starts, so a crashed build's files are still found by garbage collection
+        state = self._read()
+        versions = state.get(POINTER_VERSIONS_KEY, [])
+        name = self._next_name(versions)
+        state[POINTER_VERSIONS_KEY] = versions + [name]
+        self._write(state)
+        return name
+
+    def switch(self, collection: str) -> None:
+        state = self._read()
+        state[POINTER_CURRENT_KEY] = collection
+        if collection not in state.get(POINTER_VERSIONS_KEY, []):
+            state[POINTER_VERSIONS_KEY] = state.get(POINTER_VERSIONS_KEY, []) + [collection]
+        self._write(state)
+
+    def forget(self, collection: str) -> None:
+        state = self._read()
+        state[POINTER_VERSIONS_KEY] = [name for name in state.get(POINTER_VERSIONS_KEY, []) if name != collection]
+        self._write(state)
+
+    def version_token(self) -> Optional[int]:
+        try:
+            return self._path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def _read(self) -> dict:
+        if not self._path.exists():
+            return {POINTER_ALIAS_KEY: self.alias}
+        with self._path.open("r", encoding=FILE_ENCODING) as fh:
+            return json.load(fh)
+
+    def _write(self, state: dict) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(self._path.suffix + TMP_SUFFIX)
+        with tmp_path.open("w", encoding=FILE_ENCODING) as fh:
+            json.dump(state, fh, indent=1)
+        os.replace(tmp_path, self._path)
+
+
+class QdrantCollectionAliases(_VersionNaming):
+    """Native Qdrant aliases: the server resolves the alias on every request.
+
+    A pre-alias deployment has a real collection under the alias name, which
+    other services (the .NET API) may be reading. It has to be deleted before
+    the alias can take its name, so that only happens with migrate=True.
+    """
+
+    def __init__(self, qdrant, alias: str, migrate: bool = False):
+        super().__init__(alias)
+        self._qdrant = qdrant
+        self._migrate = migrate
+
+    def current(self) -> Optional[str]:
+        return self._qdrant.get_aliases().get(self.alias)
+
+    def versions(self) -> List[str]:
+        return self._sorted_versions(self._qdrant.list_collections())
+
+    def allocate(self) -> str:
+        # Checked here too, so a refused migration fails before the rebuild rather than after it
+        collections = self._qdrant.list_collections()
+        self._check_migration(collections)
+        return self._next_name(collections)
+
+    def switch(self, collection: str) -> None:
+        collections = self._qdrant.list_collections()
+        self._check_migration(collections)
+        if self.alias in collections:
+            print(f"[ALIAS] Replacing collection '{self.alias}' with an alias to '{collection}'")
+            self._qdrant.delete_collection(self.alias)
+        self._qdrant.switch_alias(self.alias, collection)
+
+    def forget(self, collection: str) -> None:
+        pass
+
+    def version_token(self) -> Optional[int]:
+        return None
+
+    def _check_migration(self, collections: List[str]) -> None:
+        if self.alias in collections and not self._migrate:
+            raise RuntimeError(
+                f"Qdrant collection '{self.alias}' is a real collection, not an alias. Switching would delete it; "
+                f"set vector_storage.blue_green.migrate_collection to true to allow that"
+            )
@@ -0,0 +1,272 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .config_loader import get_config
+
+CONFIG_VECTOR_STORAGE = "vector_storage"
+CONFIG_COLLECTION_NAME = "collection_name"
+DEFAULT_COLLECTION = "candidates"
+DEFAULT_NAMESPACE = "documents"
+
+VECTORS_SUBDIR = "vectors"
+MANIFEST_SUBDIR = "manifests"
+MANIFEST_SUFFIX = ".manifest.json"
+JOURNAL_SUFFIX = ".journal"
+TMP_SUFFIX = ".tmp"
+FILE_ENCODING = "utf-8"
+READ_BLOCK_SIZE = 1 << 20
+MANIFEST_VERSION = 1
+# The journal is folded into the snapshot once it holds more entries than this or than there are sources
+COMPACT_MIN_ENTRIES = 1024
+
+MANIFEST_VERSION_KEY = "version"
+MANIFEST_PROVIDER_KEY = "provider"
+MANIFEST_NAMESPACE_KEY = "namespace"
+MANIFEST_SOURCES_KEY = "sources"
+MANIFEST_GENERATION_KEY = "generation"
+ENTRY_HASH_KEY = "hash"
+ENTRY_CHUNK_IDS_KEY = "chunk_ids"
+JOURNAL_OP_KEY = "op"
+JOURNAL_KEY_KEY = "key"
+OP_RECORD = "record"
+OP_FORGET = "forget"
+
+
+def _manifest_dir() -> Path:
+    return get_config().get_data_root() / VECTORS_SUBDIR / MANIFEST_SUBDIR
+
+
+def _manifest_filename(provider_name: str, collection: str, namespace: str) -> str:
+    return f"{provider_name.lower()}_{collection}_{namespace}{MANIFEST_SUFFIX}"
+
+
+def _journal_path(path: Path) -> Path:
+    return path.with_suffix(path.suffix + JOURNAL_SUFFIX)
+
+
+def _collection_manifests(provider_name: str, collection: str) -> List[Tuple[Path, str]]:
+    # The glob alone would also match e.g. candidates_v2_* for candidates, so the namespace is checked too
+    found = []
+    for path in sorted(_manifest_dir().glob(f"{provider_name.lower()}_{collection}_*{MANIFEST_SUFFIX}")):
+        with path.open("r", encoding=FILE_ENCODING) as fh:
+            namespace = json.load(fh).get(MANIFEST_NAMESPACE_KEY, DEFAULT_NAMESPACE)
+        if path.name == _manifest_filename(provider_name, collection, namespace):
+            found.append((path, namespace))
+    return found
+
+
+@dataclass
+class ManifestPlan:
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+
+class IndexManifest:
+    """Source hash and chunk IDs per indexed source, for incremental builds.
+
+    save() appends the changes since the last save to a journal next to the
+    JSON snapshot, so a checkpoint costs O(batch) rather than a rewrite of
+    every source. The journal is compacted into the snapshot once it
+    outgrows it. Journal and snapshot share a generation number, so a journal
+    left behind by an interrupted compaction is never replayed twice.
+    """
+
+    def __init__(self, path: Path, provider_name: str = "", namespace: str = DEFAULT_NAMESPACE):
+        self._path = Path(path)
+        self._journal_path = _journal_path(self._path)
+        self._provider_name = provider_name
+        self._namespace = namespace
+        self._sources: Dict[str, Dict[str, Any]] = {}
+        self._generation = 0
+        self._journal_entries = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._compact = False
+        self._load()
+
+    @classmethod
+    def for_provider(
+        cls,
+        provider_name: str,
+        namespace: str = DEFAULT_NAMESPACE,
+        collection: Optional[str] = None
+    ) -> "IndexManifest":
+        # Pipelines that chunk the same files differently keep separate manifests and chunk IDs.
+        # collection is the physical one, so every blue/green version tracks its own content.
+        cfg = get_config()
+        collection = collection or cfg.raw.get(CONFIG_VECTOR_STORAGE, {}).get(CONFIG_COLLECTION_NAME, DEFAULT_COLLECTION)
+        return cls(_manifest_dir() / _manifest_filename(provider_name, collection, namespace), provider_name, namespace)
+
+    @classmethod
+    def remove_for_collection(cls, provider_name: str, collection: str) -> None:
+        for path, _ in _collection_manifests(provider_name, collection):
+            path.unlink(missing_ok=True)
+            _journal_path(path).unlink(missing_ok=True)
+
+    @classmethod
+    def for_collection(cls, provider_name: str, collection: str) -> List["IndexManifest"]:
+        return [cls(path, provider_name, namespace) for path, namespace in _collection_manifests(provider_name, collection)]
+
+    @staticmethod
+    def hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with Path(path).open("rb") as fh:
+            for block in iter(lambda: fh.read(READ_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def qualify(self, chunk_id: str) -> str:
+        # Pipelines that chunk the same sources differently must not overwrite each other's points
+        return f"{self._namespace}:{chunk_id}"
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def namespace(self) -> str:
+        return self._namespace
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        return {key: dict(entry) for key, entry in self._sources.items()}
+
+    def sources(self) -> List[str]:
+        return list(self._sources)
+
+    def is_empty(self) -> bool:
+        return not self._sources
+
+    def plan(self, source_hashes: Dict[str, str]) -> ManifestPlan:
+        plan = ManifestPlan()
+        for key, content_hash in source_hashes.items():
+            entry = self._sources.get(key)
+            if entry and entry.get(ENTRY_HASH_KEY) == content_hash:
+                plan.unchanged.append(key)
+            else:
+                plan.changed.append(key)
+        plan.removed = [key for key in self._sources if key not in source_hashes]
+        return plan
+
+    def chunk_ids(self, keys: Iterable[str]) -> List[str]:
+        ids = []
+        for key in keys:
+            ids.extend(self._sources.get(key, {}).get(ENTRY_CHUNK_IDS_KEY, []))
+        return ids
+
+    def record(self, key: str, content_hash: str, chunk_ids: List[str]) -> None:
+        entry = {ENTRY_HASH_KEY: content_hash, ENTRY_CHUNK_IDS_KEY: list(chunk_ids)}
+        self._sources[key] = entry
+        self._pending.append({JOURNAL_OP_KEY: OP_RECORD, JOURNAL_KEY_KEY: key, **entry})
+
+    def forget(self, key: str) -> None:
+        if self._sources.pop(key, None) is not None:
+            self._pending.append({JOURNAL_OP_KEY: OP_FORGET, JOURNAL_KEY_KEY: key})
+
+    def reset(self) -> None:
+        # An empty snapshot is cheaper than journaling every removal
+        self._sources = {}
+        self._pending = []
+        self._compact = True
+
+    def save(self) -> None:
+        entries = self._journal_entries + len(self._pending)
+        if self._compact or not self._path.exists() or entries > max(COMPACT_MIN_ENTRIES, len(self._sources)):
+            self._write_snapshot()
+        elif self._pending:
+            self._append_journal()
+
+    def _write_snapshot(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        generation = self._generation + 1
+        data = {
+            MANIFEST_VERSION_KEY: MANIFEST_VERSION,
+            MANIFEST_PROVIDER_KEY: self._provider_name,
+            MANIFEST_NAMESPACE_KEY: self._namespace,
+            MANIFEST_GENERATION_KEY: generation,
+            MANIFEST_SOURCES_KEY: self._sources,
+        }
+        tmp_path = self._path.with_suffix(self._path.suffix + TMP_SUFFIX)
+        with tmp_path.open("w", encoding=FILE_ENCODING) as fh:
+            json.dump(data, fh, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self._path)
+        # The old journal belongs to the previous generation, so a crash before this unlink is harmless
+        self._journal_path.unlink(missing_ok=True)
+
+        self._generation = generation
+        self._journal_entries = 0
+        self._pending = []
+        self._compact = False
+
+    def _append_journal(self) -> None:
+        lines = [json.dumps(op, ensure_ascii=False) + "\n" for op in self._pending]
+        if not self._journal_path.exists():
+            lines.insert(0, json.dumps({MANIFEST_GENERATION_KEY: self._generation}) + "\n")
+        with self._journal_path.open("a", encoding=FILE_ENCODING) as fh:
+            fh.writelines(lines)
+            fh.flush()
+            os.fsync(fh.fileno())
+        self._journal_entries += len(self._pending)
+        self._pending = []
+
+    def _load(self) -> None:
+        if not self._path.exists():
+            self._journal_path.unlink(missing_ok=True)
+            return
+
+        with self._path.open("r", encoding=FILE_ENCODING) as fh:
+            data = json.load(fh)
+
+        if data.get(MANIFEST_VERSION_KEY) != MANIFEST_VERSION:
+            print(f"[MANIFEST] Ignoring {self._path}: unsupported version {data.get(MANIFEST_VERSION_KEY)}")
+            self._compact = True
+            return
+
+        self._sources = data.get(MANIFEST_SOURCES_KEY, {})
+        self._generation = data.get(MANIFEST_GENERATION_KEY, 0)
+        self._replay_journal()
+
+    def _replay_journal(self) -> None:
+        if not self._journal_path.exists():
+            return
+
+        good_offset = 0
+        with self._journal_path.open("rb") as fh:
+            header = _parse_line(fh.readline())
+            if header is None or header.get(MANIFEST_GENERATION_KEY) != self._generation:
+                # Left behind by a compaction that was interrupted after the snapshot was replaced
+                fh.close()
+                self._journal_path.unlink(missing_ok=True)
+                return
+
+            good_offset = fh.tell()
+            for line in iter(fh.readline, b""):
+                op = _parse_line(line)
+                if op is None:
+                    break
+                if op[JOURNAL_OP_KEY] == OP_RECORD:
+                    self._sources[op[JOURNAL_KEY_KEY]] = {
+                        ENTRY_HASH_KEY: op[ENTRY_HASH_KEY],
+                        ENTRY_CHUNK_IDS_KEY: op[ENTRY_CHUNK_IDS_KEY],
+                    }
+                else:
+                    self._sources.pop(op[JOURNAL_KEY_KEY], None)
+                self._journal_entries += 1
+                good_offset = fh.tell()
+
+        # A torn last line would otherwise swallow the next append
+        if good_offset < self._journal_path.stat().st_size:
+            with self._journal_path.open("rb+") as fh:
+                fh.truncate(good_offset)
+
+
+def _parse_line(line: bytes) -> Optional[Dict[str, Any]]:
+    if not line.endswith(b"\n"):
+        return None
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
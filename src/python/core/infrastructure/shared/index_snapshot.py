@@ -0,0 +1,200 @@
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from . import json_codec
+from .config_loader import get_config
+
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_FILE = "snapshot.json"
+VECTORS_FILE = "vectors.npy"
+RAW_VECTORS_FILE = "vectors.f32"
+TEXTS_FILE = "texts.bin"
+TEXT_OFFSETS_FILE = "text_offsets.npy"
+RECORDS_FILE = "records.jsonl"
+MANIFESTS_FILE = "manifests.json"
+TMP_SUFFIX = ".tmp"
+OLD_SUFFIX = ".old"
+FILE_ENCODING = "utf-8"
+VECTOR_DTYPE = np.float32
+OFFSET_DTYPE = np.int64
+COPY_ROWS = 65536
+
+CONFIG_EMBEDDINGS_SERVICE = "embeddings_service"
+CONFIG_MODEL_NAME = "model_name"
+CONFIG_NORMALIZE = "normalize"
+DEFAULT_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_NORMALIZE = True
+
+INFO_FORMAT_VERSION = "format_version"
+INFO_CREATED_AT = "created_at"
+INFO_PROVIDER = "provider"
+INFO_COLLECTION = "collection"
+INFO_COUNT = "count"
+INFO_DIMENSION = "dimension"
+INFO_DTYPE = "dtype"
+INFO_FINGERPRINT = "fingerprint"
+RECORD_ID = "id"
+RECORD_METADATA = "metadata"
+
+PointBatch = Tuple[List[str], np.ndarray, List[str], List[Dict[str, Any]]]
+
+
+def embedding_fingerprint() -> Dict[str, Any]:
+    # What the vectors were produced with; a replica configured differently must not serve them
+    embeddings_config = get_config().raw.get(CONFIG_EMBEDDINGS_SERVICE, {}) or {}
+    return {
+        CONFIG_MODEL_NAME: embeddings_config.get(CONFIG_MODEL_NAME, DEFAULT_MODEL_NAME),
+        CONFIG_NORMALIZE: bool(embeddings_config.get(CONFIG_NORMALIZE, DEFAULT_NORMALIZE)),
+    }
+
+
+class IndexSnapshotWriter:
+    """Streams exported points into a snapshot directory.
+
+    Layout: vectors.npy (float32, N x D), texts.bin with text_offsets.npy
+    (N + 1 byte offsets), records.jsonl (id and metadata per row),
+    manifests.json and snapshot.json. Everything is written to a temporary
+    directory and moved into place on commit().
+    """
+
+    def __init__(self, path: Path):
+        self._path = Path(path)
+        self._tmp = self._path.with_name(self._path.name + TMP_SUFFIX)
+        shutil.rmtree(self._tmp, ignore_errors=True)
+        self._tmp.mkdir(parents=True)
+
+        self._vectors = (self._tmp / RAW_VECTORS_FILE).open("wb")
+        self._texts = (self._tmp / TEXTS_FILE).open("wb")
+        self._records = (self._tmp / RECORDS_FILE).open("w", encoding=FILE_ENCODING)
+        self._offsets = [0]
+        self._count = 0
+        self._dimension: Optional[int] = None
+
+    def add(self, ids: List[str], vectors, documents: List[str], metadata: List[Dict[str, Any]]) -> None:
+        matrix = np.ascontiguousarray(np.asarray(vectors, dtype=VECTOR_DTYPE))
+        if len(ids) == 0:
+            return
+        if self._dimension is None:
+            self._dimension = matrix.shape[1]
+        elif matrix.shape[1] != self._dimension:
+            raise ValueError(f"Vector dimension {matrix.shape[1]} does not match {self._dimension}")
+
+        self._vectors.write(matrix.tobytes())
+        for chunk_id, document, meta in zip(ids, documents, metadata):
+            encoded = (document or "").encode(FILE_ENCODING)
+            self._texts.write(encoded)
+            self._offsets.append(self._offsets[-1] + len(encoded))
+            self._records.write(json.dumps({RECORD_ID: chunk_id, RECORD_METADATA: meta or {}}, ensure_ascii=False))
+            self._records.write("\n")
+        self._count += len(ids)
+
+    def commit(self, provider_name: str, collection: str, manifests: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        self._close()
+        self._finish_vectors()
+        np.save(self._tmp / TEXT_OFFSETS_FILE, np.asarray(self._offsets, dtype=OFFSET_DTYPE))
+
+        with (self._tmp / MANIFESTS_FILE).open("w", encoding=FILE_ENCODING) as fh:
+            json.dump(manifests, fh, ensure_ascii=False)
+
+        info = {
+            INFO_FORMAT_VERSION: SNAPSHOT_FORMAT_VERSION,
+            INFO_CREATED_AT: time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            INFO_PROVIDER: provider_name,
+            INFO_COLLECTION: collection,
+            INFO_COUNT: self._count,
+            INFO_DIMENSION: self._dimension or 0,
+            INFO_DTYPE: np.dtype(VECTOR_DTYPE).name,
+            INFO_FINGERPRINT: embedding_fingerprint(),
+        }
+        with (self._tmp / SNAPSHOT_FILE).open("w", encoding=FILE_ENCODING) as fh:
+            json.dump(info, fh, indent=1)
+
+        old = self._path.with_name(self._path.name + OLD_SUFFIX)
+        shutil.rmtree(old, ignore_errors=True)
+        if self._path.exists():
+            os.replace(self._path, old)
+        os.replace(self._tmp, self._path)
+        shutil.rmtree(old, ignore_errors=True)
+        return info
+
+    def abort(self) -> None:
+        self._close()
+        shutil.rmtree(self._tmp, ignore_errors=True)
+
+    def _close(self) -> None:
+        for fh in (self._vectors, self._texts, self._records):
+            if not fh.closed:
+                fh.close()
+
+    def _finish_vectors(self) -> None:
+        # The row count is only known at the end, so the raw rows are copied under an .npy header in blocks
+        raw_path = self._tmp / RAW_VECTORS_FILE
+        shape = (self._count, self._dimension or 0)
+        target = np.lib.format.open_memmap(self._tmp / VECTORS_FILE, mode="w+", dtype=VECTOR_DTYPE, shape=shape)
+        if self._count:
+            source = np.memmap(raw_path, dtype=VECTOR_DTYPE, mode="r", shape=shape)
+            for start in range(0, self._count, COPY_ROWS):
+                target[start:start + COPY_ROWS] = source[start:start + COPY_ROWS]
+            del source
+        target.flush()
+        del target
+        raw_path.unlink()
+
+
+class IndexSnapshot:
+    """Read side of a snapshot; vectors, texts and offsets are memory-mapped."""
+
+    def __init__(self, path: Path):
+        self._path = Path(path)
+        snapshot_file = self._path / SNAPSHOT_FILE
+        if not snapshot_file.exists():
+            raise FileNotFoundError(f"No index snapshot at {self._path}")
+
+        with snapshot_file.open("r", encoding=FILE_ENCODING) as fh:
+            self.info = json.load(fh)
+        if self.info.get(INFO_FORMAT_VERSION) != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format {self.info.get(INFO_FORMAT_VERSION)} in {self._path}")
+
+    @property
+    def count(self) -> int:
+        return int(self.info[INFO_COUNT])
+
+    def check_fingerprint(self, expected: Dict[str, Any]) -> None:
+        actual = self.info.get(INFO_FINGERPRINT, {})
+        mismatched = [key for key, value in expected.items() if actual.get(key) != value]
+        if mismatched:
+            details = ", ".join(f"{key}: snapshot={actual.get(key)!r} configured={expected[key]!r}" for key in mismatched)
+            raise ValueError(f"Snapshot was built with a different embedding model ({details})")
+
+    def manifests(self) -> Dict[str, Dict[str, Any]]:
+        with (self._path / MANIFESTS_FILE).open("r", encoding=FILE_ENCODING) as fh:
+            return json.load(fh)
+
+    def batches(self, batch_size: int) -> Iterator[PointBatch]:
+        if self.count == 0:
+            return
+
+        vectors = np.load(self._path / VECTORS_FILE, mmap_mode="r")
+        offsets = np.load(self._path / TEXT_OFFSETS_FILE, mmap_mode="r")
+        texts = np.memmap(self._path / TEXTS_FILE, dtype=np.uint8, mode="r") if offsets[-1] else None
+
+        with (self._path / RECORDS_FILE).open("rb") as records:
+            for start in range(0, self.count, batch_size):
+                end = min(start + batch_size, self.count)
+                rows = [json_codec.loads(records.readline()) for _ in range(start, end)]
+                documents = [
+                    bytes(texts[offsets[row]:offsets[row + 1]]).decode(FILE_ENCODING) if texts is not None else ""
+                    for row in range(start, end)
+                ]
+                yield (
+                    [row[RECORD_ID] for row in rows],
+                    vectors[start:end],
+                    documents,
+                    [row[RECORD_METADATA] for row in rows],
+                )
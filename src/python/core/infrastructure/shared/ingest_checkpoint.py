@@ -0,0 +1,54 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+from .config_loader import get_config
+
+VECTORS_SUBDIR = "vectors"
+CHECKPOINT_SUBDIR = "checkpoints"
+CHECKPOINT_SUFFIX = ".ingest.json"
+TMP_SUFFIX = ".tmp"
+FILE_ENCODING = "utf-8"
+CHECKPOINT_VERSION = 1
+CHECKPOINT_VERSION_KEY = "version"
+
+
+class IngestCheckpoint:
+    """Where a bulk ingest stopped: the last source file whose batch was fully written.
+
+    Saved after the manifest of each batch, so everything up to last_file is
+    both in the index and in the manifest.
+    """
+
+    def __init__(self, path: Path):
+        self._path = Path(path)
+
+    @classmethod
+    def for_collection(cls, provider_name: str, collection: str) -> "IngestCheckpoint":
+        directory = get_config().get_data_root() / VECTORS_SUBDIR / CHECKPOINT_SUBDIR
+        return cls(directory / f"{provider_name.lower()}_{collection}{CHECKPOINT_SUFFIX}")
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def load(self) -> Dict[str, Any]:
+        if not self._path.exists():
+            return {}
+        with self._path.open("r", encoding=FILE_ENCODING) as fh:
+            state = json.load(fh)
+        if state.get(CHECKPOINT_VERSION_KEY) != CHECKPOINT_VERSION:
+            print(f"[CHECKPOINT] Ignoring {self._path}: unsupported version {state.get(CHECKPOINT_VERSION_KEY)}")
+            return {}
+        return state
+
+    def save(self, state: Dict[str, Any]) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(self._path.suffix + TMP_SUFFIX)
+        with tmp_path.open("w", encoding=FILE_ENCODING) as fh:
+            json.dump({**state, CHECKPOINT_VERSION_KEY: CHECKPOINT_VERSION}, fh, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self._path)
+
+    def clear(self) -> None:
+        self._path.unlink(missing_ok=True)
@@ -0,0 +1,24 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DECODER_ORJSON = "orjson"
+DECODER_STDLIB = "json"
+
+
+def decoder_name() -> str:
+    return DECODER_ORJSON if orjson is not None else DECODER_STDLIB
+
+
+def loads(raw: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (NaN/Infinity, big integers); keep stdlib acceptance and error messages
+            pass
+    return json.loads(raw)
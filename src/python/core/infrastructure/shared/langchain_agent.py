@@ -7,6 +7,8 @@ from ..embeddings.huggingface.embedding_client import load_embeddings
 from ..vector_store import chroma_persistent
 from .prompt_loader import load_prompt
 from .config_loader import get_config
+from .collection_aliases import FileCollectionAliases
+from ...domain.enums.vector_provider_type import VectorProviderType
 
 CONFIG_LLM_PROVIDER = "llm_provider"
 CONFIG_PROVIDER = "provider"
@@ -15,6 +17,9 @@ CONFIG_OLLAMA = "ollama"
 CONFIG_OPENAI = "openai"
 CONFIG_API_KEY = "api_key"
 CONFIG_BASE_URL = "base_url"
+CONFIG_VECTOR_STORAGE = "vector_storage"
+CONFIG_COLLECTION_NAME = "collection_name"
+DEFAULT_COLLECTION = "candidates"
 
 PROVIDER_OLLAMA = "ollama"
 PROVIDER_OPENAI = "openai"
@@ -55,7 +60,10 @@ def _load_llm():
 
 def build_chain():
     embeddings = load_embeddings()
-    vector_store = chroma_persistent(embeddings)
+    # Read the version the blue/green alias points to; None keeps the unversioned default collection
+    alias = get_config().raw.get(CONFIG_VECTOR_STORAGE, {}).get(CONFIG_COLLECTION_NAME, DEFAULT_COLLECTION)
+    collection = FileCollectionAliases.for_provider(VectorProviderType.NATIVE.value, alias).current()
+    vector_store = chroma_persistent(embeddings, collection_name=collection)
     types = DEFAULT_RETRIEVAL_TYPES
     metadata_filter = {"type": {"$in": [t.strip() for t in types.split(",") if t.strip()]}}
     retriever = vector_store.as_retriever(search_kwargs={"k": RETRIEVER_TOP_K, "filter": metadata_filter})
@@ -1,22 +1,6 @@
-from pathlib import Path
-from .config_loader import get_config
+from .prompt_registry import get_prompt_registry
 
-CONFIG_DATA_ROOT = "root"
-CONFIG_DATA_PROMPTS = "prompts"
-PROMPT_ENCODING = "utf-8"
 
 def load_prompt(name: str) -> str:
-    cfg = get_config()
-    data_config = cfg.raw["data"]
-    data_root = Path(data_config["root"])
-    prompts_dir = data_config["prompts"]
-    filepath = data_root / prompts_dir / name
-    
-    if filepath.exists():
-        try:
-            content = filepath.read_text(encoding=PROMPT_ENCODING)
-            return content
-        except Exception as e:
-            raise
-    else:
-        raise FileNotFoundError(f"Prompt file not found: {filepath}")
+    # Served from the preloaded registry; files are re-read only by its background mtime poll
+    return get_prompt_registry().get(name).text
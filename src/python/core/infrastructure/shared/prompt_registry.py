@@ -0,0 +1,150 @@
+import os
+import string
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from .config_loader import get_config
+
+CONFIG_DATA = "data"
+CONFIG_DATA_PROMPTS = "prompts"
+CONFIG_PROMPT_REGISTRY = "prompt_registry"
+CONFIG_POLL_SECONDS = "poll_seconds"
+DEFAULT_PROMPTS_DIR = "prompts"
+DEFAULT_POLL_SECONDS = 2.0
+PROMPT_SUFFIX = ".md"
+PROMPT_ENCODING = "utf-8"
+POLL_THREAD_NAME = "prompt-registry-poll"
+
+_FORMATTER = string.Formatter()
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """A prompt file parsed once into literal text and {field} placeholders.
+
+    render() fills the fields by joining the precomputed segments; templates
+    with format specs or conversions ({x!r}, {x:>10}) fall back to str.format
+    so the result is always what text.format(**values) would give.
+    """
+    name: str
+    text: str
+    mtime_ns: int
+    segments: Tuple[Tuple[str, Optional[str]], ...]
+    fields: FrozenSet[str]
+    simple: bool
+
+    @classmethod
+    def parse(cls, name: str, text: str, mtime_ns: int) -> "PromptTemplate":
+        segments = []
+        simple = True
+        for literal, field, spec, conversion in _FORMATTER.parse(text):
+            if field is not None and (spec or conversion or not field.isidentifier()):
+                simple = False
+            segments.append((literal, field))
+        return cls(
+            name=name,
+            text=text,
+            mtime_ns=mtime_ns,
+            segments=tuple(segments),
+            fields=frozenset(field for _, field in segments if field is not None),
+            simple=simple
+        )
+
+    def render(self, **values) -> str:
+        if not self.simple:
+            return self.text.format(**values)
+        parts = []
+        for literal, field in self.segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]))
+        return "".join(parts)
+
+
+class PromptRegistry:
+    """All prompt templates of a directory, loaded at startup and served from memory.
+
+    A daemon thread polls file mtimes every poll_seconds and swaps in a new
+    name -> template mapping when anything changed, so get() never touches
+    the disk. poll_seconds <= 0 disables reloading.
+    """
+
+    def __init__(self, directory: Path, poll_seconds: float = DEFAULT_POLL_SECONDS):
+        self._directory = Path(directory)
+        self._poll_seconds = poll_seconds
+        self._templates: Dict[str, PromptTemplate] = self._load({})
+        self._stop = threading.Event()
+        self._thread = None
+        if poll_seconds > 0:
+            self._thread = threading.Thread(target=self._poll, name=POLL_THREAD_NAME, daemon=True)
+            self._thread.start()
+
+    def get(self, name: str) -> PromptTemplate:
+        template = self._templates.get(name)
+        if template is None:
+            raise FileNotFoundError(f"Prompt file not found: {self._directory / name}")
+        return template
+
+    def names(self) -> Tuple[str, ...]:
+        return tuple(sorted(self._templates))
+
+    def refresh(self) -> bool:
+        """Reloads changed, new and removed files; True when the mapping changed."""
+        templates = self._load(self._templates)
+        if templates.keys() == self._templates.keys() and all(
+            templates[name] is self._templates[name] for name in templates
+        ):
+            return False
+        self._templates = templates
+        return True
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self._poll_seconds):
+            try:
+                if self.refresh():
+                    print(f"[PROMPTS] Reloaded {self._directory} ({len(self._templates)} templates)")
+            except Exception as e:
+                print(f"[PROMPTS] Reload failed, keeping previous templates: {e}")
+
+    def _load(self, current: Dict[str, PromptTemplate]) -> Dict[str, PromptTemplate]:
+        templates = {}
+        if not self._directory.exists():
+            return templates
+        with os.scandir(self._directory) as entries:
+            for entry in entries:
+                if not entry.is_file() or not entry.name.endswith(PROMPT_SUFFIX):
+                    continue
+                mtime_ns = entry.stat().st_mtime_ns
+                existing = current.get(entry.name)
+                if existing is not None and existing.mtime_ns == mtime_ns:
+                    templates[entry.name] = existing
+                    continue
+                text = Path(entry.path).read_text(encoding=PROMPT_ENCODING)
+                templates[entry.name] = PromptTemplate.parse(entry.name, text, mtime_ns)
+        return templates
+
+
+_PROMPT_REGISTRY: PromptRegistry | None = None
+_PROMPT_REGISTRY_LOCK = threading.Lock()
+
+
+def get_prompt_registry() -> PromptRegistry:
+    global _PROMPT_REGISTRY
+    if _PROMPT_REGISTRY is None:
+        with _PROMPT_REGISTRY_LOCK:
+            if _PROMPT_REGISTRY is None:
+                cfg = get_config()
+                data_config = cfg.raw.get(CONFIG_DATA, {}) or {}
+                registry_config = cfg.raw.get(CONFIG_PROMPT_REGISTRY, {}) or {}
+                _PROMPT_REGISTRY = PromptRegistry(
+                    cfg.get_data_root() / data_config.get(CONFIG_DATA_PROMPTS, DEFAULT_PROMPTS_DIR),
+                    float(registry_config.get(CONFIG_POLL_SECONDS, DEFAULT_POLL_SECONDS))
+                )
+    return _PROMPT_REGISTRY
@@ -1,31 +1,54 @@
-from typing import Dict, Type
+from functools import partial
+from typing import Dict, Optional, Type
 from ..vectorstores.chroma.chroma_vector_store import ChromaVectorStore
 from ..vectorstores.qdrant.qdrant_vector_store import QdrantVectorStore
+from ..vectorstores.faiss.faiss_vector_store import FaissVectorStore
+from ..vectorstores.numpy_store.numpy_vector_store import NumpyVectorStore
+from ..vectorstores.qdrant.qdrant_rest import QdrantREST
+from ..vectorstores.aliased_vector_store import AliasedVectorStore, DEFAULT_KEEP_VERSIONS
 from ...application.protocols.vector_provider_protocol import VectorProvider
 from ...domain.enums.vector_provider_type import VectorProviderType
 from .config_loader import get_config
+from .collection_aliases import FileCollectionAliases, QdrantCollectionAliases
 
 CONFIG_VECTOR_STORAGE = "vector_storage"
 CONFIG_TYPE = "type"
+CONFIG_COLLECTION_NAME = "collection_name"
+CONFIG_BLUE_GREEN = "blue_green"
+CONFIG_ENABLED = "enabled"
+CONFIG_KEEP_VERSIONS = "keep_versions"
+CONFIG_MIGRATE_COLLECTION = "migrate_collection"
+DEFAULT_COLLECTION = "candidates"
 
 PROVIDER_NATIVE = "native"
 PROVIDER_QDRANT = "qdrant"
+PROVIDER_FAISS = "faiss"
+PROVIDER_NUMPY = "numpy"
 
 
 class VectorProviderFactory:
     _providers: Dict[VectorProviderType, Type[VectorProvider]] = {
         VectorProviderType.NATIVE: ChromaVectorStore,
         VectorProviderType.QDRANT: QdrantVectorStore,
+        VectorProviderType.FAISS: FaissVectorStore,
+        VectorProviderType.NUMPY: NumpyVectorStore,
     }
     
     @classmethod
-    def create_provider(cls, provider_type: VectorProviderType = None) -> VectorProvider:
+    def create_provider(
+        cls,
+        provider_type: VectorProviderType = None,
+        collection: Optional[str] = None
+    ) -> VectorProvider:
+        # An explicit collection opens that physical collection; otherwise blue/green serves the alias
         if provider_type is None:
             cfg = get_config()
             conf_value = cfg.get_vector_storage_type()
             mapped = {
                 PROVIDER_NATIVE: "NATIVE",
                 PROVIDER_QDRANT: "QDRANT",
+                PROVIDER_FAISS: "FAISS",
+                PROVIDER_NUMPY: "NUMPY",
             }.get(conf_value.lower(), "NATIVE")
             provider_type = VectorProviderType.from_string(mapped)
         
@@ -34,7 +57,34 @@ class VectorProviderFactory:
             raise ValueError(f"Unknown vector provider: {provider_type.value}. Available: {available}")
         
         provider_class = cls._providers[provider_type]
-        return provider_class()
+        storage_config = get_config().raw.get(CONFIG_VECTOR_STORAGE, {}) or {}
+        blue_green = storage_config.get(CONFIG_BLUE_GREEN, {}) or {}
+        if collection or not blue_green.get(CONFIG_ENABLED, False):
+            return provider_class(collection=collection)
+
+        alias = storage_config.get(CONFIG_COLLECTION_NAME, DEFAULT_COLLECTION)
+        return AliasedVectorStore(
+            partial(cls._open_collection, provider_class),
+            cls._aliases_for(provider_type, alias, bool(blue_green.get(CONFIG_MIGRATE_COLLECTION, False))),
+            blue_green.get(CONFIG_KEEP_VERSIONS, DEFAULT_KEEP_VERSIONS)
+        )
+
+    @staticmethod
+    def _open_collection(provider_class: Type[VectorProvider], collection: Optional[str]) -> VectorProvider:
+        return provider_class(collection=collection)
+
+    @staticmethod
+    def _aliases_for(provider_type: VectorProviderType, alias: str, migrate: bool):
+        if provider_type == VectorProviderType.QDRANT:
+            return QdrantCollectionAliases(QdrantREST(), alias, migrate)
+        return FileCollectionAliases.for_provider(provider_type.value, alias)
+    
+    @classmethod
+    def get_provider_class(cls, provider_type: VectorProviderType) -> Type[VectorProvider]:
+        if provider_type not in cls._providers:
+            available = [p.value for p in cls._providers.keys()]
+            raise ValueError(f"Unknown vector provider: {provider_type.value}. Available: {available}")
+        return cls._providers[provider_type]
     
     @classmethod
     def get_available_providers(cls) -> list[str]:
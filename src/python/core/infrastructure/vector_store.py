@@ -4,6 +4,7 @@ from langchain_chroma import Chroma
 from langchain_core.documents import Document
 from ..application.protocols.vector_store_protocol import VectorStore
 from .shared.config_loader import get_config
+from .shared.chunk_ids import content_ids
 
 CONFIG_DATA_ROOT = "root"
 VECTORS_SUBDIR = "vectors"
@@ -31,20 +32,23 @@ class ChromaVectorStore:
         except:
             self._chroma = None
     
-    def add_documents(self, documents: List[str], embeddings: List[List[float]], metadata: List[Dict[str, Any]]) -> None:
-        docs = []
-        for i, (text, meta) in enumerate(zip(documents, metadata)):
-            docs.append(Document(page_content=text, metadata=meta))
+    def add_documents(self, documents: List[str], embeddings: List[List[float]], metadata: List[Dict[str, Any]]) -> List[str]:
+        from .vectorstores.chroma.chroma_utils import upsert_with_embeddings
+        
+        if len(embeddings) != len(documents):
+            raise ValueError(f"Got {len(embeddings)} embeddings for {len(documents)} documents")
         
         if self._chroma is None:
-            persist_directory = str(BASE_VECTORS_DIR / CHROMA_SUBDIR)
-            self._chroma = Chroma.from_documents(
-                docs, 
-                self.embeddings_client._embeddings, 
-                persist_directory=persist_directory
-            )
-        else:
-            self._chroma.add_documents(docs)
+            self._chroma = chroma_persistent(self.embeddings_client._embeddings)
+        
+        # Content-derived IDs: re-adding the same documents overwrites their rows instead of duplicating them
+        ids = content_ids(documents, metadata)
+        upsert_with_embeddings(self._chroma._collection, ids, embeddings, documents, metadata)
+        return ids
+    
+    def flush(self) -> None:
+        # Chroma persists each write itself
+        pass
     
     def search(self, query_embedding: List[float], limit: int = 5, filter_metadata: Optional[Dict[str, Any]] = None) -> List[Tuple[str, Dict[str, Any], float]]:
         if not self._chroma:
@@ -77,14 +81,16 @@ class ChromaVectorStore:
         if not self._chroma:
             return 0
         
+        from .vectorstores.chroma.chroma_vector_store import is_missing_collection
+        collection = getattr(self._chroma, "_collection", None)
+        if not collection:
+            return 0
         try:
-            collection = getattr(self._chroma, "_collection", None)
-            if collection:
-                return collection.count()
-        except:
-            pass
-        
-        return 0
+            return collection.count()
+        except Exception as e:
+            if is_missing_collection(e):
+                return 0
+            raise
 
 
 def chroma_from_documents(docs: List[Document], embeddings):
@@ -92,8 +98,10 @@ def chroma_from_documents(docs: List[Document], embeddings):
     return Chroma.from_documents(docs, embeddings, persist_directory=persist_directory)
 
 
-def chroma_persistent(embeddings):
-    persist_directory = str(BASE_VECTORS_DIR / CHROMA_SUBDIR)
+def chroma_persistent(embeddings, persist_directory: str | None = None, collection_name: str | None = None):
+    persist_directory = persist_directory or str(BASE_VECTORS_DIR / CHROMA_SUBDIR)
+    if collection_name:
+        return Chroma(collection_name=collection_name, persist_directory=persist_directory, embedding_function=embeddings)
     return Chroma(persist_directory=persist_directory, embedding_function=embeddings)
 
 
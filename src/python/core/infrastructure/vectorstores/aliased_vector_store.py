@@ -0,0 +1,137 @@
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.documents import Document
+
+from ...application.protocols.collection_aliases_protocol import CollectionAliases
+from ..shared.index_manifest import IndexManifest
+
+DEFAULT_LIMIT = 6
+DEFAULT_KEEP_VERSIONS = 2
+
+
+class AliasedVectorStore:
+    """Serves whatever physical collection an alias points to.
+
+    Queries and incremental writes go to the current version. A blue/green
+    rebuild fills a new version from create_version(), then promote() switches
+    the alias and this instance over at once and garbage-collects versions past
+    keep_versions. When another process switches a file-based alias, the next
+    call here notices the changed pointer and reopens the store.
+    """
+
+    def __init__(
+        self,
+        open_collection: Callable[[Optional[str]], Any],
+        aliases: CollectionAliases,
+        keep_versions: int = DEFAULT_KEEP_VERSIONS
+    ):
+        self._open_collection = open_collection
+        self._aliases = aliases
+        self._keep_versions = max(1, keep_versions)
+        self._lock = threading.Lock()
+        self._token = aliases.version_token()
+        self._target = self._open_current()
+
+    @property
+    def collection_name(self) -> str:
+        # The physical collection, so manifests follow the version that holds the data
+        if self._server_resolved():
+            return self._aliases.resolve()
+        return self._store().collection_name
+
+    def get_provider_name(self) -> str:
+        return self._store().get_provider_name()
+
+    def index_documents(self, docs: List[Document]) -> Dict[str, Any]:
+        return self._store().index_documents(docs)
+
+    def add_documents(
+        self,
+        documents: List[str],
+        embeddings: List[List[float]] = None,
+        metadata: List[Dict[str, Any]] = None,
+        ids: List[str] = None
+    ) -> List[str]:
+        return self._store().add_documents(documents, embeddings, metadata, ids)
+
+    def delete_documents(self, ids: List[str]) -> int:
+        return self._store().delete_documents(ids)
+
+    def flush(self) -> None:
+        self._store().flush()
+
+    def drop_collection(self) -> None:
+        self._store().drop_collection()
+
+    def search(
+        self,
+        query_embedding: List[float],
+        limit: int = DEFAULT_LIMIT,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[tuple[str, Dict[str, Any], float]]:
+        return self._store().search(query_embedding, limit, filter_metadata)
+
+    def count(self) -> int:
+        return self._store().count()
+
+    def export_points(self, *args, **kwargs):
+        return self._store().export_points(*args, **kwargs)
+
+    def create_version(self):
+        return self._open_collection(self._aliases.allocate())
+
+    def promote(self, store) -> None:
+        self._aliases.switch(store.collection_name)
+        with self._lock:
+            if not self._server_resolved():
+                self._target = store
+            self._token = self._aliases.version_token()
+        print(f"[ALIAS] {self._aliases.alias} -> {store.collection_name}")
+        self.collect_garbage()
+
+    def discard(self, store) -> None:
+        self._drop(store)
+
+    def collect_garbage(self) -> None:
+        current = self._aliases.current()
+        versions = self._aliases.versions()
+        keep = set(versions[-self._keep_versions:])
+        for name in versions:
+            if name in keep or name == current:
+                continue
+            print(f"[ALIAS] Dropping old version {name}")
+            self._drop(self._open_collection(name))
+
+    def _drop(self, store) -> None:
+        name = store.collection_name
+        store.drop_collection()
+        IndexManifest.remove_for_collection(store.get_provider_name(), name)
+        self._aliases.forget(name)
+
+    def _server_resolved(self) -> bool:
+        return self._token is None
+
+    def _open_current(self):
+        if self._server_resolved():
+            return self._open_collection(self._aliases.alias)
+        # No pointer yet: the provider's unversioned default collection keeps serving
+        return self._open_collection(self._aliases.current())
+
+    def _store(self):
+        if self._server_resolved():
+            return self._target
+
+        token = self._aliases.version_token()
+        if token != self._token:
+            with self._lock:
+                if token != self._token:
+                    current = self._aliases.current()
+                    if current and current != self._target.collection_name:
+                        self._target = self._open_collection(current)
+                    self._token = token
+        return self._target
+
+    def __getattr__(self, name: str):
+        # Provider-specific extras (e.g. Chroma's similarity_search) go to the current store
+        return getattr(self._store(), name)
@@ -1,5 +1,8 @@
+from typing import Any, Dict, List
 from ...embeddings.huggingface.embedding_client import load_embeddings
-from ...vector_store import chroma_from_documents, chroma_from_existing
+from ...vector_store import chroma_from_documents, chroma_from_existing, chroma_persistent
+
+UPSERT_BATCH_SIZE = 1000
 
 
 def index_documents_with_chroma(docs: list) -> dict:
@@ -11,6 +14,47 @@ def index_documents_with_chroma(docs: list) -> dict:
     }
 
 
-def load_existing_chroma():
+def load_existing_chroma(persist_directory: str = None, collection_name: str = None):
     emb = load_embeddings()
+    if persist_directory or collection_name:
+        return chroma_persistent(emb, persist_directory, collection_name)
     return chroma_from_existing(emb)
+
+
+def upsert_with_embeddings(
+    collection,
+    ids: List[str],
+    embeddings: List[List[float]],
+    documents: List[str],
+    metadatas: List[Dict[str, Any]],
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> None:
+    cleaned = [_clean_metadata(meta) for meta in metadatas]
+    for start in range(0, len(ids), batch_size):
+        end = start + batch_size
+        _upsert_batch(collection, ids[start:end], embeddings[start:end], documents[start:end], cleaned[start:end])
+
+
+def _clean_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in (metadata or {}).items() if v is not None}
+
+
+def _upsert_batch(collection, ids: List[str], embeddings: List[List[float]], documents: List[str], metadatas: List[Dict[str, Any]]) -> None:
+    # Chroma rejects empty metadata dicts, so rows without metadata go in a separate call
+    with_meta = [i for i, meta in enumerate(metadatas) if meta]
+    without_meta = [i for i, meta in enumerate(metadatas) if not meta]
+    
+    if with_meta:
+        collection.upsert(
+            ids=[ids[i] for i in with_meta],
+            embeddings=[embeddings[i] for i in with_meta],
+            documents=[documents[i] for i in with_meta],
+            metadatas=[metadatas[i] for i in with_meta]
+        )
+    
+    if without_meta:
+        collection.upsert(
+            ids=[ids[i] for i in without_meta],
+            embeddings=[embeddings[i] for i in without_meta],
+            documents=[documents[i] for i in without_meta]
+        )
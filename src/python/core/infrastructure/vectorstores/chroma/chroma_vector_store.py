@@ -1,21 +1,41 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from langchain_core.documents import Document
 from ....application.protocols.vector_provider_protocol import VectorProvider
 from ....application.protocols.vector_store_protocol import VectorStore
+from ...shared.chunk_ids import content_ids
 
 PROVIDER_NATIVE = "NATIVE"
 DEFAULT_K = 4
 DEFAULT_LIMIT = 6
 DEFAULT_QUERY = "search query"
+EXPORT_BATCH_SIZE = 4096
+# Collection LangChain's Chroma wrapper uses when none is given
+DEFAULT_CHROMA_COLLECTION = "langchain"
+# What chromadb raises for a collection deleted under a live handle, across its versions
+MISSING_COLLECTION_ERRORS = ("NotFoundError", "InvalidCollectionException")
+MISSING_COLLECTION_MESSAGE = "does not exist"
+
+
+def is_missing_collection(error: Exception) -> bool:
+    """True when error says the collection does not exist (older chromadb raises a plain ValueError)."""
+    if type(error).__name__ in MISSING_COLLECTION_ERRORS:
+        return True
+    return isinstance(error, ValueError) and MISSING_COLLECTION_MESSAGE in str(error)
 
 
 class ChromaVectorStore:
-    def __init__(self):
+    def __init__(self, persist_directory: Optional[str] = None, collection: Optional[str] = None):
+        self._persist_directory = persist_directory
+        self._collection = collection
         self._chroma_vectorstore = None
     
     def get_provider_name(self) -> str:
         return PROVIDER_NATIVE
     
+    @property
+    def collection_name(self) -> str:
+        return self._collection or DEFAULT_CHROMA_COLLECTION
+    
     def index_documents(self, docs: List[Document]) -> Dict[str, Any]:
         from .chroma_utils import index_documents_with_chroma
         result = index_documents_with_chroma(docs)
@@ -28,19 +48,38 @@ class ChromaVectorStore:
             **result
         }
     
-    def add_documents(self, documents: List[str], embeddings: List[List[float]] = None, metadata: List[Dict[str, Any]] = None) -> List[str]:
+    def add_documents(
+        self,
+        documents: List[str],
+        embeddings: List[List[float]] = None,
+        metadata: List[Dict[str, Any]] = None,
+        ids: List[str] = None
+    ) -> List[str]:
         if not self._chroma_vectorstore:
             self._ensure_vectorstore()
         
-        from langchain_core.documents import Document
-        langchain_docs = []
+        if embeddings is None:
+            from langchain_core.documents import Document
+            langchain_docs = []
+            
+            for i, doc_text in enumerate(documents):
+                doc_metadata = metadata[i] if metadata and i < len(metadata) else {}
+                langchain_docs.append(Document(page_content=doc_text, metadata=doc_metadata))
+            
+            return self._chroma_vectorstore.add_documents(langchain_docs, ids=ids)
+        
+        if len(embeddings) != len(documents):
+            raise ValueError(f"Got {len(embeddings)} embeddings for {len(documents)} documents")
         
-        for i, doc_text in enumerate(documents):
-            doc_metadata = metadata[i] if metadata and i < len(metadata) else {}
-            langchain_docs.append(Document(page_content=doc_text, metadata=doc_metadata))
+        from .chroma_utils import upsert_with_embeddings
+        ids = list(ids) if ids else content_ids(documents, metadata)
+        metadatas = [
+            metadata[i] if metadata and i < len(metadata) else {}
+            for i in range(len(documents))
+        ]
         
-        result = self._chroma_vectorstore.add_documents(langchain_docs)
-        return result
+        upsert_with_embeddings(self._chroma_vectorstore._collection, ids, embeddings, documents, metadatas)
+        return ids
     
     def similarity_search(
         self, 
@@ -62,6 +101,45 @@ class ChromaVectorStore:
             self._ensure_vectorstore()
         return self._chroma_vectorstore.similarity_search_with_score(query, k=k, filter=filter)
     
+    def delete_documents(self, ids: List[str]) -> int:
+        if not ids:
+            return 0
+        
+        if not self._chroma_vectorstore:
+            self._ensure_vectorstore()
+        
+        collection = self._chroma_vectorstore._collection
+        existing = collection.get(ids=list(ids), include=[]).get("ids", [])
+        if existing:
+            collection.delete(ids=existing)
+        return len(existing)
+    
+    def flush(self) -> None:
+        # Chroma persists each write itself
+        pass
+    
+    def drop_collection(self) -> None:
+        if not self._chroma_vectorstore:
+            self._ensure_vectorstore()
+        self._chroma_vectorstore.delete_collection()
+        self._chroma_vectorstore = None
+    
+    def export_points(
+        self,
+        batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator[Tuple[List[str], List[List[float]], List[str], List[Dict[str, Any]]]]:
+        if not self._chroma_vectorstore:
+            self._ensure_vectorstore()
+        
+        collection = self._chroma_vectorstore._collection
+        offset = 0
+        while True:
+            page = collection.get(include=["embeddings", "documents", "metadatas"], limit=batch_size, offset=offset)
+            if not page["ids"]:
+                return
+            yield page["ids"], page["embeddings"], page["documents"], [meta or {} for meta in page["metadatas"]]
+            offset += len(page["ids"])
+    
     def search(
         self,
         query_embedding: List[float],
@@ -72,7 +150,11 @@ class ChromaVectorStore:
             self._ensure_vectorstore()
         
         try:
-            if hasattr(self._chroma_vectorstore, 'similarity_search_by_vector_with_score'):
+            if hasattr(self._chroma_vectorstore, 'similarity_search_by_vector_with_relevance_scores'):
+                results = self._chroma_vectorstore.similarity_search_by_vector_with_relevance_scores(
+                    query_embedding, k=limit, filter=filter_metadata
+                )
+            elif hasattr(self._chroma_vectorstore, 'similarity_search_by_vector_with_score'):
                 results = self._chroma_vectorstore.similarity_search_by_vector_with_score(
                     query_embedding, k=limit, filter=filter_metadata
                 )
@@ -94,13 +176,14 @@ class ChromaVectorStore:
             self._ensure_vectorstore()
         
         try:
-            collection = self._chroma_vectorstore._collection
-            count = collection.count()
-            return count
+            return self._chroma_vectorstore._collection.count()
         except Exception as e:
-            return 0
+            # A missing collection is empty; any other failure must not read as "wiped"
+            if is_missing_collection(e):
+                return 0
+            raise
     
     def _ensure_vectorstore(self):
         from .chroma_utils import load_existing_chroma
         if not self._chroma_vectorstore:
-            self._chroma_vectorstore = load_existing_chroma()
+            self._chroma_vectorstore = load_existing_chroma(self._persist_directory, self._collection)
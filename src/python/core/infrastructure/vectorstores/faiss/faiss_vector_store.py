@@ -0,0 +1,495 @@
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+import faiss
+import numpy as np
+from langchain_core.documents import Document
+
+from ..metadata_columns import MetadataColumns
+from ...shared.config_loader import get_config
+from ...shared.chunk_ids import content_ids
+
+PROVIDER_FAISS = "FAISS"
+DEFAULT_LIMIT = 6
+DEFAULT_COLLECTION = "candidates"
+
+CONFIG_VECTOR_STORAGE = "vector_storage"
+CONFIG_COLLECTION_NAME = "collection_name"
+CONFIG_FAISS = "faiss"
+CONFIG_INDEX_TYPE = "index_type"
+CONFIG_HNSW_M = "hnsw_m"
+CONFIG_EF_CONSTRUCTION = "ef_construction"
+CONFIG_EF_SEARCH = "ef_search"
+CONFIG_NLIST = "nlist"
+CONFIG_PQ_M = "pq_m"
+CONFIG_PQ_NBITS = "pq_nbits"
+CONFIG_NPROBE = "nprobe"
+CONFIG_COMPACT_FRACTION = "compact_deleted_fraction"
+
+INDEX_FLAT = "flat"
+INDEX_HNSW = "hnsw"
+INDEX_IVFPQ = "ivfpq"
+SUPPORTED_INDEX_TYPES = (INDEX_FLAT, INDEX_HNSW, INDEX_IVFPQ)
+
+DEFAULT_INDEX_TYPE = INDEX_FLAT
+DEFAULT_HNSW_M = 32
+DEFAULT_EF_CONSTRUCTION = 128
+DEFAULT_EF_SEARCH = 64
+DEFAULT_NLIST = 1024
+DEFAULT_PQ_M = 16
+DEFAULT_PQ_NBITS = 8
+DEFAULT_NPROBE = 16
+DEFAULT_COMPACT_FRACTION = 0.25
+TRAINING_POINTS_PER_CENTROID = 39
+SELECTOR_CACHE_ENTRIES = 64
+
+EMBED_BATCH_SIZE = 64
+EXPORT_BATCH_SIZE = 4096
+VECTORS_SUBDIR = "vectors"
+FAISS_SUBDIR = "faiss"
+INDEX_SUFFIX = ".index"
+ROWS_SUFFIX = ".rows.jsonl"
+DELETED_SUFFIX = ".deleted"
+COMPACT_SUFFIX = ".compact"
+COMPACTING_SUFFIX = ".compacting"
+TMP_SUFFIX = ".tmp"
+FILE_ENCODING = "utf-8"
+
+ROW_ID = "id"
+ROW_DOCUMENT = "document"
+ROW_METADATA = "metadata"
+
+logger = logging.getLogger(__name__)
+
+
+class FaissVectorStore:
+    """FAISS index plus append-only row and deletion journals.
+
+    Rows are journaled as they are added; the index file itself is written by
+    flush(), once per build, and is the commit point: on load, journaled rows
+    past the index's ntotal are dropped. An ivfpq store serves from a flat index
+    until it holds enough vectors to train IVF-PQ with the configured nlist.
+
+    Deleted rows stay in the index, masked out by a selector, until they pass
+    compact_deleted_fraction of it; flush() then rewrites the index and rows
+    without them. Filters are answered from MetadataColumns and the resulting
+    bitmaps kept in a small LRU.
+    """
+
+    def __init__(
+        self,
+        base_dir: Optional[Path] = None,
+        collection: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None
+    ):
+        cfg = get_config()
+        storage_config = cfg.raw.get(CONFIG_VECTOR_STORAGE, {})
+        # options override the configured faiss settings (benchmarks, tests)
+        faiss_config = {**(storage_config.get(CONFIG_FAISS, {}) or {}), **(options or {})}
+
+        self._collection = collection or storage_config.get(CONFIG_COLLECTION_NAME, DEFAULT_COLLECTION)
+        self._index_type = str(faiss_config.get(CONFIG_INDEX_TYPE, DEFAULT_INDEX_TYPE)).lower()
+        if self._index_type not in SUPPORTED_INDEX_TYPES:
+            raise ValueError(f"Unknown FAISS index type: {self._index_type}. Available: {list(SUPPORTED_INDEX_TYPES)}")
+
+        self._hnsw_m = int(faiss_config.get(CONFIG_HNSW_M, DEFAULT_HNSW_M))
+        self._ef_construction = int(faiss_config.get(CONFIG_EF_CONSTRUCTION, DEFAULT_EF_CONSTRUCTION))
+        self._ef_search = int(faiss_config.get(CONFIG_EF_SEARCH, DEFAULT_EF_SEARCH))
+        self._nlist = int(faiss_config.get(CONFIG_NLIST, DEFAULT_NLIST))
+        self._pq_m = int(faiss_config.get(CONFIG_PQ_M, DEFAULT_PQ_M))
+        self._pq_nbits = int(faiss_config.get(CONFIG_PQ_NBITS, DEFAULT_PQ_NBITS))
+        self._nprobe = int(faiss_config.get(CONFIG_NPROBE, DEFAULT_NPROBE))
+        self._compact_fraction = float(faiss_config.get(CONFIG_COMPACT_FRACTION, DEFAULT_COMPACT_FRACTION))
+
+        base_dir = Path(base_dir) if base_dir else cfg.get_data_root() / VECTORS_SUBDIR / FAISS_SUBDIR
+        base_dir.mkdir(parents=True, exist_ok=True)
+        self._index_path = base_dir / f"{self._collection}{INDEX_SUFFIX}"
+        self._rows_path = base_dir / f"{self._collection}{ROWS_SUFFIX}"
+        self._deleted_path = base_dir / f"{self._collection}{DELETED_SUFFIX}"
+        self._compacting_path = base_dir / f"{self._collection}{COMPACTING_SUFFIX}"
+
+        self._index = None
+        self._mmapped = False
+        self._index_dirty = False
+        self._pending_deleted: List[int] = []
+        self._pq_warned = False
+        self._ids: List[str] = []
+        self._documents: List[str] = []
+        self._metadata: List[Dict[str, Any]] = []
+        self._columns = MetadataColumns()
+        self._row_by_id: Dict[str, int] = {}
+        self._selector_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        # Background index jobs write while chat requests search the same instance
+        self._lock = threading.RLock()
+        self._load()
+
+    def get_provider_name(self) -> str:
+        return PROVIDER_FAISS
+
+    @property
+    def collection_name(self) -> str:
+        return self._collection
+
+    def index_documents(self, docs: List[Document]) -> Dict[str, Any]:
+        from ...embeddings.huggingface.embedding_client import load_embeddings
+
+        emb = load_embeddings()
+        texts = [doc.page_content for doc in docs]
+        embeddings = []
+        for start in range(0, len(texts), EMBED_BATCH_SIZE):
+            embeddings.extend(emb.embed_documents(texts[start:start + EMBED_BATCH_SIZE]))
+
+        self.add_documents(texts, embeddings, [doc.metadata for doc in docs])
+        self.flush()
+        return {
+            "chunks": len(docs),
+            "points": self.count(),
+            "provider": self.get_provider_name()
+        }
+
+    def add_documents(
+        self,
+        documents: List[str],
+        embeddings: List[List[float]] = None,
+        metadata: List[Dict[str, Any]] = None,
+        ids: List[str] = None
+    ) -> List[str]:
+        if embeddings is None:
+            from ...embeddings.huggingface.embedding_client import load_embeddings
+            embeddings = load_embeddings().embed_documents(documents)
+
+        if len(embeddings) != len(documents):
+            raise ValueError(f"Got {len(embeddings)} embeddings for {len(documents)} documents")
+
+        if not documents:
+            return []
+
+        ids = list(ids) if ids else content_ids(documents, metadata)
+        metadatas = [dict(metadata[i]) if metadata and i < len(metadata) else {} for i in range(len(documents))]
+        vectors = self._as_matrix(embeddings)
+
+        with self._lock:
+            index = self._writable_index(vectors)
+
+            previous_rows = [self._row_by_id[chunk_id] for chunk_id in ids if chunk_id in self._row_by_id]
+            self._columns.kill(previous_rows)
+            self._pending_deleted.extend(previous_rows)
+
+            first_row = len(self._ids)
+            index.add(vectors)
+
+            with self._rows_path.open("a", encoding=FILE_ENCODING) as fh:
+                for chunk_id, document, meta in zip(ids, documents, metadatas):
+                    fh.write(json.dumps({ROW_ID: chunk_id, ROW_DOCUMENT: document, ROW_METADATA: meta}, ensure_ascii=False) + "\n")
+
+            for offset, chunk_id in enumerate(ids):
+                self._ids.append(chunk_id)
+                self._documents.append(documents[offset])
+                self._metadata.append(metadatas[offset])
+                self._row_by_id[chunk_id] = first_row + offset
+            self._columns.append(metadatas)
+
+            self._index_dirty = True
+            self._selector_cache.clear()
+            self._train_when_ready()
+        return ids
+
+    def delete_documents(self, ids: List[str]) -> int:
+        with self._lock:
+            rows = [self._row_by_id.pop(chunk_id) for chunk_id in ids if chunk_id in self._row_by_id]
+            if not rows:
+                return 0
+
+            self._columns.kill(rows)
+            self._pending_deleted.extend(rows)
+            self._selector_cache.clear()
+        return len(rows)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._index is not None and self._columns.dead() > self._compact_fraction * self._columns.size:
+                self._compact()
+                return
+
+            if self._index_dirty:
+                index_tmp = self._index_path.with_suffix(self._index_path.suffix + TMP_SUFFIX)
+                faiss.write_index(self._index, str(index_tmp))
+                os.replace(index_tmp, self._index_path)
+                self._index_dirty = False
+
+            # After the index: a crash in between leaves a replaced row alive rather than losing its replacement
+            if self._pending_deleted:
+                with self._deleted_path.open("a", encoding=FILE_ENCODING) as fh:
+                    fh.writelines(f"{row}\n" for row in self._pending_deleted)
+                self._pending_deleted = []
+
+    def drop_collection(self) -> None:
+        with self._lock:
+            self._index = None
+            self._mmapped = False
+            self._index_dirty = False
+            self._ids, self._documents, self._metadata = [], [], []
+            self._columns, self._row_by_id = MetadataColumns(), {}
+            self._pending_deleted = []
+            self._selector_cache.clear()
+            for path in self._all_paths():
+                path.unlink(missing_ok=True)
+
+    def export_points(
+        self,
+        batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator[Tuple[List[str], np.ndarray, List[str], List[Dict[str, Any]]]]:
+        with self._lock:
+            if self._index is None:
+                return
+            rows = np.flatnonzero(self._columns.alive).tolist()
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                yield (
+                    [self._ids[row] for row in batch],
+                    self._reconstruct(batch),
+                    [self._documents[row] for row in batch],
+                    [self._metadata[row] for row in batch],
+                )
+
+    def search(
+        self,
+        query_embedding: List[float],
+        limit: int = DEFAULT_LIMIT,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[tuple[str, Dict[str, Any], float]]:
+        query = self._as_matrix([query_embedding])
+
+        with self._lock:
+            if self._index is None or self._index.ntotal == 0:
+                return []
+
+            bitmap = self._selector_bitmap(filter_metadata)
+            if bitmap is not None and not bitmap.any():
+                return []
+
+            # The selector and its bitmap must outlive the search call, params only holds raw pointers
+            params, _selector = self._search_params(bitmap)
+            scores, rows = self._index.search(query, limit, params=params)
+
+            results = []
+            for score, row in zip(scores[0], rows[0]):
+                if row < 0:
+                    continue
+                results.append((self._documents[row], self._metadata[row], float(score)))
+
+        return results
+
+    def count(self) -> int:
+        with self._lock:
+            return int(np.count_nonzero(self._columns.alive))
+
+    def _as_matrix(self, embeddings) -> np.ndarray:
+        vectors = np.ascontiguousarray(np.asarray(embeddings, dtype=np.float32))
+        faiss.normalize_L2(vectors)
+        return vectors
+
+    def _build_index(self, dimension: int):
+        if self._index_type == INDEX_HNSW:
+            index = faiss.IndexHNSWFlat(dimension, self._hnsw_m, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = self._ef_construction
+            return index
+
+        # ivfpq starts flat too, _train_when_ready swaps it once there is enough to train on
+        return faiss.IndexFlatIP(dimension)
+
+    def _training_threshold(self) -> int:
+        # k-means wants ~39 points per centroid, for the coarse lists and for each PQ codebook alike
+        return max(self._nlist, 2 ** self._pq_nbits) * TRAINING_POINTS_PER_CENTROID
+
+    def _train_when_ready(self) -> None:
+        if self._index_type != INDEX_IVFPQ or isinstance(self._index, faiss.IndexIVF):
+            return
+        if self._index.ntotal < self._training_threshold():
+            return
+
+        dimension = self._index.d
+        if dimension % self._pq_m:
+            if not self._pq_warned:
+                logger.warning(f"pq_m={self._pq_m} does not divide dimension {dimension}, keeping a flat index")
+                self._pq_warned = True
+            return
+
+        # Rows keep their positions: the IVF index assigns the same sequential IDs the flat one did
+        vectors = self._index.reconstruct_n(0, self._index.ntotal)
+        quantizer = faiss.IndexFlatIP(dimension)
+        index = faiss.IndexIVFPQ(quantizer, dimension, self._nlist, self._pq_m, self._pq_nbits, faiss.METRIC_INNER_PRODUCT)
+        index.train(vectors)
+        index.add(vectors)
+        self._index = index
+        logger.info(f"Trained IVF-PQ (nlist={self._nlist}, pq_m={self._pq_m}) on {len(vectors)} vectors for {self._collection}")
+
+    def _writable_index(self, vectors: np.ndarray):
+        if self._index is None:
+            self._index = self._build_index(vectors.shape[1])
+            self._mmapped = False
+        elif self._mmapped:
+            # Memory-mapped indexes are read-only, reload into RAM before appending
+            self._index = faiss.read_index(str(self._index_path))
+            self._mmapped = False
+
+        if self._index.d != vectors.shape[1]:
+            raise ValueError(f"Embedding dimension {vectors.shape[1]} does not match index dimension {self._index.d}")
+
+        return self._index
+
+    def _reconstruct(self, rows: List[int]) -> np.ndarray:
+        if isinstance(self._index, faiss.IndexIVF) and not self._index.direct_map.type:
+            # IVF lists are not addressable by row until a direct map exists (PQ vectors come back decoded, i.e. approximate)
+            if self._mmapped:
+                self._index = faiss.read_index(str(self._index_path))
+                self._mmapped = False
+            self._index.make_direct_map()
+        return self._index.reconstruct_batch(np.asarray(rows, dtype=np.int64))
+
+    def _selector_bitmap(self, filter_metadata: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Allowed rows as a little-endian bitmap (faiss.IDSelectorBitmap), or None when every row is."""
+        if not filter_metadata and not self._columns.dead():
+            return None
+
+        cache_key = json.dumps(filter_metadata, sort_keys=True, default=str)
+        bitmap = self._selector_cache.get(cache_key)
+        if bitmap is not None:
+            self._selector_cache.move_to_end(cache_key)
+            return bitmap
+
+        bitmap = np.packbits(self._columns.mask(filter_metadata, self._metadata), bitorder="little")
+        self._selector_cache[cache_key] = bitmap
+        while len(self._selector_cache) > SELECTOR_CACHE_ENTRIES:
+            self._selector_cache.popitem(last=False)
+        return bitmap
+
+    def _search_params(self, bitmap: Optional[np.ndarray]):
+        selector = faiss.IDSelectorBitmap(self._columns.size, faiss.swig_ptr(bitmap)) if bitmap is not None else None
+
+        if isinstance(self._index, faiss.IndexHNSW):
+            params = faiss.SearchParametersHNSW(efSearch=self._ef_search)
+        elif isinstance(self._index, faiss.IndexIVF):
+            params = faiss.SearchParametersIVF(nprobe=self._nprobe)
+        elif selector is None:
+            return None, None
+        else:
+            params = faiss.SearchParameters()
+
+        if selector is not None:
+            params.sel = selector
+        return params, selector
+
+    def _load(self) -> None:
+        self._finish_compaction()
+        if not self._index_path.exists():
+            # Journals without an index never reached a flush
+            for path in (self._rows_path, self._deleted_path):
+                path.unlink(missing_ok=True)
+            return
+
+        self._index = faiss.read_index(str(self._index_path), faiss.IO_FLAG_MMAP)
+        self._mmapped = True
+        committed = self._index.ntotal
+
+        if self._rows_path.exists():
+            with self._rows_path.open("r", encoding=FILE_ENCODING) as fh:
+                for row, line in enumerate(fh):
+                    if row >= committed:
+                        break
+                    record = json.loads(line)
+                    self._ids.append(record[ROW_ID])
+                    self._documents.append(record[ROW_DOCUMENT])
+                    self._metadata.append(record[ROW_METADATA])
+            self._truncate_rows_file(committed)
+        if len(self._ids) != committed:
+            raise ValueError(f"FAISS rows journal has {len(self._ids)} rows for {committed} vectors in {self._index_path}")
+
+        self._columns.append(self._metadata)
+        if self._deleted_path.exists():
+            with self._deleted_path.open("r", encoding=FILE_ENCODING) as fh:
+                self._columns.kill([int(line) for line in fh if line.strip()])
+        alive = self._columns.alive
+        self._row_by_id = {chunk_id: row for row, chunk_id in enumerate(self._ids) if alive[row]}
+
+    def _compact(self) -> None:
+        """Rewrites index and rows without the deleted rows.
+
+        The new files are written next to the live ones, then the .compacting
+        marker commits the swap; _finish_compaction completes it, here or on
+        the next load after a crash.
+        """
+        keep = np.flatnonzero(self._columns.alive)
+        vectors = self._reconstruct(keep.tolist()) if len(keep) else np.zeros((0, self._index.d), dtype=np.float32)
+        if isinstance(self._index, faiss.IndexIVF):
+            # The trained quantizer and codebooks are reused: only the lists are refilled
+            index = faiss.clone_index(self._index)
+            index.reset()
+        else:
+            index = self._build_index(self._index.d)
+        index.add(vectors)
+
+        ids = [self._ids[row] for row in keep]
+        documents = [self._documents[row] for row in keep]
+        metadata = [self._metadata[row] for row in keep]
+
+        compact_index = self._index_path.with_suffix(self._index_path.suffix + COMPACT_SUFFIX)
+        compact_rows = self._rows_path.with_suffix(self._rows_path.suffix + COMPACT_SUFFIX)
+        faiss.write_index(index, str(compact_index))
+        with compact_rows.open("w", encoding=FILE_ENCODING) as fh:
+            for chunk_id, document, meta in zip(ids, documents, metadata):
+                fh.write(json.dumps({ROW_ID: chunk_id, ROW_DOCUMENT: document, ROW_METADATA: meta}, ensure_ascii=False) + "\n")
+        marker_tmp = self._compacting_path.with_suffix(self._compacting_path.suffix + TMP_SUFFIX)
+        marker_tmp.touch()
+        os.replace(marker_tmp, self._compacting_path)
+
+        # The old index may be memory-mapped from the file about to be replaced, so it is released first
+        removed = self._columns.size - len(keep)
+        self._index, self._mmapped, self._index_dirty = index, False, False
+        self._ids, self._documents, self._metadata = ids, documents, metadata
+        self._columns = MetadataColumns()
+        self._columns.append(metadata)
+        self._row_by_id = {chunk_id: row for row, chunk_id in enumerate(ids)}
+        self._pending_deleted = []
+        self._selector_cache.clear()
+        self._finish_compaction()
+        logger.info(f"Compacted {self._collection}: removed {removed} deleted rows, {len(ids)} remain")
+
+    def _finish_compaction(self) -> None:
+        compact_index = self._index_path.with_suffix(self._index_path.suffix + COMPACT_SUFFIX)
+        compact_rows = self._rows_path.with_suffix(self._rows_path.suffix + COMPACT_SUFFIX)
+        if not self._compacting_path.exists():
+            # A compaction that never reached its marker: the live files still stand
+            compact_index.unlink(missing_ok=True)
+            compact_rows.unlink(missing_ok=True)
+            return
+
+        # Each step is idempotent, so a crash anywhere in here is finished by the next load
+        if compact_index.exists():
+            os.replace(compact_index, self._index_path)
+        if compact_rows.exists():
+            os.replace(compact_rows, self._rows_path)
+        self._deleted_path.unlink(missing_ok=True)
+        self._compacting_path.unlink()
+
+    def _all_paths(self) -> List[Path]:
+        return [
+            self._index_path,
+            self._rows_path,
+            self._deleted_path,
+            self._compacting_path,
+            self._index_path.with_suffix(self._index_path.suffix + COMPACT_SUFFIX),
+            self._rows_path.with_suffix(self._rows_path.suffix + COMPACT_SUFFIX),
+        ]
+
+    def _truncate_rows_file(self, rows: int) -> None:
+        # Rows past the index's ntotal belong to adds that never reached flush()
+        with self._rows_path.open("rb+") as fh:
+            for _ in range(rows):
+                fh.readline()
+            fh.truncate()
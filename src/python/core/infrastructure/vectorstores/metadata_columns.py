@@ -0,0 +1,160 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .metadata_filter import matches_filter, AND_OPERATOR, IN_OPERATOR, GTE_OPERATOR
+from ...domain.configuration.vector_metadata_config import DEFAULT_VECTOR_METADATA_CONFIG
+
+METADATA_CONFIG = DEFAULT_VECTOR_METADATA_CONFIG
+CODED_FIELDS = (
+    METADATA_CONFIG.FIELD_TYPE,
+    METADATA_CONFIG.FIELD_CANDIDATE_ID,
+    METADATA_CONFIG.FIELD_SENIORITY_LEVEL,
+    METADATA_CONFIG.FIELD_SKILL_NAME,
+)
+NUMERIC_FIELD = METADATA_CONFIG.FIELD_YEARS_EXPERIENCE
+
+MISSING_CODE = -1
+UNKNOWN_CODE = -2
+# Values that cannot key a vocabulary (lists, dicts) are matched row by row
+UNCODED_CODE = -3
+INITIAL_CAPACITY = 1024
+
+
+def encode(vocabulary: Dict[Any, int], value: Any) -> int:
+    """Code of value in vocabulary, adding it if new; the vocabulary is keyed by the typed value."""
+    if value is None:
+        return MISSING_CODE
+    try:
+        code = vocabulary.get(value)
+    except TypeError:
+        return UNCODED_CODE
+    if code is None:
+        code = len(vocabulary)
+        vocabulary[value] = code
+    return code
+
+
+def lookup(vocabulary: Dict[Any, int], value: Any) -> int:
+    # Dict lookup follows ==, so 5 finds 5.0 but not "5", like matches_filter
+    if value is None:
+        return MISSING_CODE
+    try:
+        return vocabulary.get(value, UNKNOWN_CODE)
+    except TypeError:
+        return UNKNOWN_CODE
+
+
+def to_float(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return np.nan
+    return float(value)
+
+
+def filter_mask(
+    filter_metadata: Optional[Dict[str, Any]],
+    size: int,
+    codes: Dict[str, np.ndarray],
+    vocabularies: Dict[str, Dict[Any, int]],
+    years: np.ndarray,
+    metadata: Sequence[Dict[str, Any]]
+) -> np.ndarray:
+    """Rows among the first size whose metadata matches filter_metadata, with matches_filter semantics.
+
+    Coded fields and the numeric $gte are answered from the columns; any other
+    condition falls back to matches_filter row by row.
+    """
+    if not filter_metadata:
+        return np.ones(size, dtype=bool)
+
+    if AND_OPERATOR in filter_metadata and isinstance(filter_metadata[AND_OPERATOR], list):
+        mask = np.ones(size, dtype=bool)
+        for condition in filter_metadata[AND_OPERATOR]:
+            mask &= filter_mask(condition, size, codes, vocabularies, years, metadata)
+        return mask
+
+    mask = np.ones(size, dtype=bool)
+    for key, expected in filter_metadata.items():
+        mask &= _condition_mask(key, expected, size, codes, vocabularies, years, metadata)
+    return mask
+
+
+def _condition_mask(
+    key: str,
+    expected: Any,
+    size: int,
+    codes: Dict[str, np.ndarray],
+    vocabularies: Dict[str, Dict[Any, int]],
+    years: np.ndarray,
+    metadata: Sequence[Dict[str, Any]]
+) -> np.ndarray:
+    if key in codes:
+        column = codes[key][:size]
+        vocabulary = vocabularies[key]
+        if isinstance(expected, dict):
+            if IN_OPERATOR not in expected:
+                return np.zeros(size, dtype=bool)
+            mask = np.isin(column, [lookup(vocabulary, value) for value in expected[IN_OPERATOR]])
+        else:
+            mask = column == lookup(vocabulary, expected)
+        for row in np.flatnonzero(column == UNCODED_CODE):
+            mask[row] = matches_filter(metadata[row], {key: expected})
+        return mask
+
+    if key == NUMERIC_FIELD and isinstance(expected, dict) and GTE_OPERATOR in expected:
+        # NaN (missing) compares False, matching the vector databases
+        return years[:size] >= float(expected[GTE_OPERATOR])
+
+    return np.fromiter(
+        (matches_filter(meta, {key: expected}) for meta in metadata[:size]),
+        dtype=bool,
+        count=size
+    )
+
+
+class MetadataColumns:
+    """In-memory alive flags and filter columns for stores that keep rows in RAM, grown by doubling."""
+
+    def __init__(self):
+        self.size = 0
+        self._alive = np.zeros(0, dtype=bool)
+        self._years = np.zeros(0, dtype=np.float32)
+        self._codes: Dict[str, np.ndarray] = {field: np.zeros(0, dtype=np.int32) for field in CODED_FIELDS}
+        self._vocabularies: Dict[str, Dict[Any, int]] = {field: {} for field in CODED_FIELDS}
+
+    @property
+    def alive(self) -> np.ndarray:
+        return self._alive[:self.size]
+
+    def append(self, metadatas: List[Dict[str, Any]]) -> None:
+        start, end = self.size, self.size + len(metadatas)
+        if end > len(self._alive):
+            self._grow(max(INITIAL_CAPACITY, 2 * len(self._alive), end))
+        self._alive[start:end] = True
+        self._years[start:end] = [to_float(meta.get(NUMERIC_FIELD)) for meta in metadatas]
+        for field in CODED_FIELDS:
+            vocabulary = self._vocabularies[field]
+            self._codes[field][start:end] = [encode(vocabulary, meta.get(field)) for meta in metadatas]
+        self.size = end
+
+    def kill(self, rows) -> None:
+        self._alive[np.asarray(rows, dtype=np.int64)] = False
+
+    def dead(self) -> int:
+        return self.size - int(np.count_nonzero(self.alive))
+
+    def mask(self, filter_metadata: Optional[Dict[str, Any]], metadata: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """Alive rows matching filter_metadata."""
+        return self.alive & filter_mask(filter_metadata, self.size, self._codes, self._vocabularies, self._years, metadata)
+
+    def _grow(self, capacity: int) -> None:
+        self._alive = _resized(self._alive, capacity, False)
+        self._years = _resized(self._years, capacity, np.nan)
+        for field in CODED_FIELDS:
+            self._codes[field] = _resized(self._codes[field], capacity, MISSING_CODE)
+
+
+def _resized(column: np.ndarray, capacity: int, fill) -> np.ndarray:
+    grown = np.full(capacity, fill, dtype=column.dtype)
+    grown[:len(column)] = column
+    return grown
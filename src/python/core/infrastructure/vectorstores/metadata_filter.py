@@ -0,0 +1,28 @@
+from typing import Any, Dict, Optional
+
+AND_OPERATOR = "$and"
+IN_OPERATOR = "$in"
+GTE_OPERATOR = "$gte"
+
+
+def matches_filter(metadata: Dict[str, Any], filter_metadata: Optional[Dict[str, Any]]) -> bool:
+    if not filter_metadata:
+        return True
+
+    if AND_OPERATOR in filter_metadata and isinstance(filter_metadata[AND_OPERATOR], list):
+        return all(matches_filter(metadata, condition) for condition in filter_metadata[AND_OPERATOR])
+
+    return all(_matches_condition(metadata, key, value) for key, value in filter_metadata.items())
+
+
+def _matches_condition(metadata: Dict[str, Any], key: str, expected: Any) -> bool:
+    actual = metadata.get(key)
+
+    if isinstance(expected, dict):
+        if IN_OPERATOR in expected:
+            return actual in expected[IN_OPERATOR]
+        if GTE_OPERATOR in expected:
+            return isinstance(actual, (int, float)) and not isinstance(actual, bool) and actual >= expected[GTE_OPERATOR]
+        return False
+
+    return actual == expected
@@ -0,0 +1,364 @@
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+
+from ..metadata_columns import CODED_FIELDS, NUMERIC_FIELD, MISSING_CODE, encode, filter_mask, to_float
+from ...shared.config_loader import get_config
+from ...shared.chunk_ids import content_ids
+
+PROVIDER_NUMPY = "NUMPY"
+DEFAULT_LIMIT = 6
+DEFAULT_COLLECTION = "candidates"
+
+CONFIG_VECTOR_STORAGE = "vector_storage"
+CONFIG_COLLECTION_NAME = "collection_name"
+
+EMBED_BATCH_SIZE = 64
+EXPORT_BATCH_SIZE = 4096
+INITIAL_CAPACITY = 1024
+
+VECTORS_SUBDIR = "vectors"
+NUMPY_SUBDIR = "numpy"
+VECTORS_FILE = "vectors"
+ALIVE_FILE = "alive"
+YEARS_FILE = "years_experience"
+COLUMN_SUFFIX = ".npy"
+ROWS_FILE = "rows.jsonl"
+STATE_FILE = "state.json"
+TMP_SUFFIX = ".tmp"
+FILE_ENCODING = "utf-8"
+
+STATE_SIZE = "size"
+STATE_DIMENSION = "dimension"
+STATE_CAPACITY = "capacity"
+STATE_VOCABULARIES = "vocabularies"
+ROW_ID = "id"
+ROW_DOCUMENT = "document"
+ROW_METADATA = "metadata"
+
+
+class NumpyVectorStore:
+    """Vectors and filterable metadata columns in memory-mapped .npy files.
+
+    Column files are named by capacity: growing writes new files instead of
+    replacing ones that are still mapped (Windows refuses that), and the old
+    generation is deleted once state.json points at the new one. Coded
+    columns key their vocabularies by the metadata value itself, so filters
+    compare typed values exactly as matches_filter does.
+    """
+
+    def __init__(self, base_dir: Optional[Path] = None, collection: Optional[str] = None):
+        cfg = get_config()
+        storage_config = cfg.raw.get(CONFIG_VECTOR_STORAGE, {})
+        collection = collection or storage_config.get(CONFIG_COLLECTION_NAME, DEFAULT_COLLECTION)
+
+        base_dir = Path(base_dir) if base_dir else cfg.get_data_root() / VECTORS_SUBDIR / NUMPY_SUBDIR
+        self._collection = collection
+        self._dir = base_dir / collection
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._reset()
+        self._load()
+
+    def _reset(self) -> None:
+        self._size = 0
+        self._capacity = 0
+        self._dimension: Optional[int] = None
+        self._vectors: Optional[np.ndarray] = None
+        self._alive: Optional[np.ndarray] = None
+        self._years: Optional[np.ndarray] = None
+        self._codes: Dict[str, np.ndarray] = {}
+        self._vocabularies: Dict[str, Dict[Any, int]] = {field: {} for field in CODED_FIELDS}
+        self._ids: List[str] = []
+        self._documents: List[str] = []
+        self._metadata: List[Dict[str, Any]] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._dirty = False
+
+    def get_provider_name(self) -> str:
+        return PROVIDER_NUMPY
+
+    @property
+    def collection_name(self) -> str:
+        return self._collection
+
+    def index_documents(self, docs: List[Document]) -> Dict[str, Any]:
+        from ...embeddings.huggingface.embedding_client import load_embeddings
+
+        emb = load_embeddings()
+        texts = [doc.page_content for doc in docs]
+        embeddings = []
+        for start in range(0, len(texts), EMBED_BATCH_SIZE):
+            embeddings.extend(emb.embed_documents(texts[start:start + EMBED_BATCH_SIZE]))
+
+        self.add_documents(texts, embeddings, [doc.metadata for doc in docs])
+        self.flush()
+        return {
+            "chunks": len(docs),
+            "points": self.count(),
+            "provider": self.get_provider_name()
+        }
+
+    def add_documents(
+        self,
+        documents: List[str],
+        embeddings: List[List[float]] = None,
+        metadata: List[Dict[str, Any]] = None,
+        ids: List[str] = None
+    ) -> List[str]:
+        if embeddings is None:
+            from ...embeddings.huggingface.embedding_client import load_embeddings
+            embeddings = load_embeddings().embed_documents(documents)
+
+        if len(embeddings) != len(documents):
+            raise ValueError(f"Got {len(embeddings)} embeddings for {len(documents)} documents")
+
+        if not documents:
+            return []
+
+        ids = list(ids) if ids else content_ids(documents, metadata)
+        metadatas = [dict(metadata[i]) if metadata and i < len(metadata) else {} for i in range(len(documents))]
+        vectors = _normalize(np.asarray(embeddings, dtype=np.float32))
+
+        with self._lock:
+            if self._dimension is None:
+                self._dimension = vectors.shape[1]
+            elif vectors.shape[1] != self._dimension:
+                raise ValueError(f"Embedding dimension {vectors.shape[1]} does not match store dimension {self._dimension}")
+
+            start = self._size
+            end = start + len(documents)
+            self._ensure_capacity(end)
+
+            for chunk_id in ids:
+                previous_row = self._row_by_id.get(chunk_id)
+                if previous_row is not None:
+                    self._alive[previous_row] = False
+
+            self._vectors[start:end] = vectors
+            self._alive[start:end] = True
+            self._years[start:end] = [to_float(meta.get(NUMERIC_FIELD)) for meta in metadatas]
+            for field in CODED_FIELDS:
+                vocabulary = self._vocabularies[field]
+                self._codes[field][start:end] = [encode(vocabulary, meta.get(field)) for meta in metadatas]
+
+            with (self._dir / ROWS_FILE).open("a", encoding=FILE_ENCODING) as fh:
+                for chunk_id, document, meta in zip(ids, documents, metadatas):
+                    fh.write(json.dumps({ROW_ID: chunk_id, ROW_DOCUMENT: document, ROW_METADATA: meta}, ensure_ascii=False) + "\n")
+
+            for offset, chunk_id in enumerate(ids):
+                self._ids.append(chunk_id)
+                self._documents.append(documents[offset])
+                self._metadata.append(metadatas[offset])
+                self._row_by_id[chunk_id] = start + offset
+
+            self._size = end
+            self._dirty = True
+
+        return ids
+
+    def delete_documents(self, ids: List[str]) -> int:
+        with self._lock:
+            rows = [self._row_by_id.pop(chunk_id) for chunk_id in ids if chunk_id in self._row_by_id]
+            if not rows:
+                return 0
+            self._alive[rows] = False
+            self._dirty = True
+        return len(rows)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._dirty:
+                self._commit()
+                self._dirty = False
+
+    def drop_collection(self) -> None:
+        with self._lock:
+            self._reset()
+            shutil.rmtree(self._dir, ignore_errors=True)
+
+    def export_points(
+        self,
+        batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator[Tuple[List[str], np.ndarray, List[str], List[Dict[str, Any]]]]:
+        with self._lock:
+            rows = np.flatnonzero(self._alive[:self._size]) if self._size else np.empty(0, dtype=np.int64)
+            ids, documents, metadata = list(self._ids), list(self._documents), list(self._metadata)
+            vectors = self._vectors
+
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            yield (
+                [ids[row] for row in batch],
+                np.array(vectors[batch], dtype=np.float32),
+                [documents[row] for row in batch],
+                [metadata[row] for row in batch],
+            )
+
+    def search(
+        self,
+        query_embedding: List[float],
+        limit: int = DEFAULT_LIMIT,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[tuple[str, Dict[str, Any], float]]:
+        with self._lock:
+            size = self._size
+            if size == 0:
+                return []
+            vectors = self._vectors
+            documents, metadata = self._documents, self._metadata
+            mask = self._alive[:size] & filter_mask(
+                filter_metadata, size, self._codes, self._vocabularies, self._years, self._metadata
+            )
+
+        rows = np.flatnonzero(mask)
+        if len(rows) == 0:
+            return []
+
+        query = _normalize(np.asarray([query_embedding], dtype=np.float32))[0]
+        if len(rows) == size:
+            scores = vectors[:size] @ query
+        else:
+            scores = vectors[rows] @ query
+
+        k = min(limit, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        results = []
+        for position in top:
+            row = int(rows[position])
+            results.append((documents[row], metadata[row], float(scores[position])))
+
+        return results
+
+    def count(self) -> int:
+        if self._alive is None:
+            return 0
+        return int(np.count_nonzero(self._alive[:self._size]))
+
+    def _ensure_capacity(self, required: int) -> None:
+        if required <= self._capacity:
+            return
+
+        capacity = max(INITIAL_CAPACITY, self._capacity * 2, required)
+        self._vectors = self._grow(VECTORS_FILE, self._vectors, (capacity, self._dimension), np.float32, 0.0)
+        self._alive = self._grow(ALIVE_FILE, self._alive, (capacity,), np.bool_, False)
+        self._years = self._grow(YEARS_FILE, self._years, (capacity,), np.float32, np.nan)
+        for field in CODED_FIELDS:
+            self._codes[field] = self._grow(_codes_file(field), self._codes.get(field), (capacity,), np.int32, MISSING_CODE)
+        self._capacity = capacity
+
+    def _grow(self, name: str, current: Optional[np.ndarray], shape: tuple, dtype, fill) -> np.ndarray:
+        # A new file per capacity: the current one may still be mapped, here or by a running search
+        path = self._dir / _column_file(name, shape[0])
+        tmp_path = self._dir / f"{path.name}{TMP_SUFFIX}"
+        grown = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=dtype, shape=shape)
+        grown[:] = fill
+        if current is not None:
+            grown[:self._size] = current[:self._size]
+        grown.flush()
+        del grown
+        os.replace(tmp_path, path)
+        return np.load(path, mmap_mode="r+")
+
+    def _commit(self) -> None:
+        # state.json is the commit point: rows and vectors past its size are dropped on load
+        self._vectors.flush()
+        self._alive.flush()
+        self._years.flush()
+        for codes in self._codes.values():
+            codes.flush()
+
+        state = {
+            STATE_SIZE: self._size,
+            STATE_CAPACITY: self._capacity,
+            STATE_DIMENSION: self._dimension,
+            STATE_VOCABULARIES: {field: list(vocabulary) for field, vocabulary in self._vocabularies.items()},
+        }
+        tmp_path = self._dir / f"{STATE_FILE}{TMP_SUFFIX}"
+        with tmp_path.open("w", encoding=FILE_ENCODING) as fh:
+            json.dump(state, fh, ensure_ascii=False)
+        os.replace(tmp_path, self._dir / STATE_FILE)
+        self._remove_stale_columns()
+
+    def _column_names(self) -> List[str]:
+        return [VECTORS_FILE, ALIVE_FILE, YEARS_FILE] + [_codes_file(field) for field in CODED_FIELDS]
+
+    def _remove_stale_columns(self) -> None:
+        current = {_column_file(name, self._capacity) for name in self._column_names()}
+        for path in self._dir.glob(f"*{COLUMN_SUFFIX}"):
+            if path.name in current:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                # Windows keeps a file mapped by a search still in flight; the next commit or load retries
+                pass
+
+    def _load(self) -> None:
+        state_path = self._dir / STATE_FILE
+        if not state_path.exists():
+            return
+
+        with state_path.open("r", encoding=FILE_ENCODING) as fh:
+            state = json.load(fh)
+
+        self._size = int(state[STATE_SIZE])
+        self._capacity = int(state[STATE_CAPACITY])
+        self._dimension = state[STATE_DIMENSION]
+        for field, values in state.get(STATE_VOCABULARIES, {}).items():
+            if field in self._vocabularies:
+                self._vocabularies[field] = {value: code for code, value in enumerate(values)}
+
+        self._vectors = self._open_column(VECTORS_FILE)
+        self._alive = self._open_column(ALIVE_FILE)
+        self._years = self._open_column(YEARS_FILE)
+        for field in CODED_FIELDS:
+            self._codes[field] = self._open_column(_codes_file(field))
+        # Files of a growth that never reached _commit
+        self._remove_stale_columns()
+
+        # Rows past the committed size belong to a write that never reached _commit
+        with (self._dir / ROWS_FILE).open("r", encoding=FILE_ENCODING) as fh:
+            for row, line in enumerate(fh):
+                if row >= self._size:
+                    break
+                record = json.loads(line)
+                self._ids.append(record[ROW_ID])
+                self._documents.append(record[ROW_DOCUMENT])
+                self._metadata.append(record[ROW_METADATA])
+        self._row_by_id = {chunk_id: row for row, chunk_id in enumerate(self._ids) if self._alive[row]}
+        self._truncate_rows_file()
+
+    def _open_column(self, name: str) -> np.ndarray:
+        return np.load(self._dir / _column_file(name, self._capacity), mmap_mode="r+")
+
+    def _truncate_rows_file(self) -> None:
+        rows_path = self._dir / ROWS_FILE
+        with rows_path.open("rb+") as fh:
+            for _ in range(self._size):
+                fh.readline()
+            fh.truncate()
+
+
+def _codes_file(field: str) -> str:
+    return f"{field}.codes"
+
+
+def _column_file(name: str, capacity: int) -> str:
+    return f"{name}.{capacity}{COLUMN_SUFFIX}"
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.ascontiguousarray(vectors / norms, dtype=np.float32)
+
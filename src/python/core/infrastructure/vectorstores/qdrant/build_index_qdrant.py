@@ -1,6 +1,8 @@
 from typing import Dict, Iterable, List, Tuple, Any
 from .qdrant_rest import QdrantREST
 
+UPSERT_BATCH_SIZE = 256
+
 
 def ensure_and_upsert(
     qdrant: QdrantREST,
@@ -8,7 +10,24 @@ def ensure_and_upsert(
     size: int,
     distance: str,
     items: Iterable[Tuple[str, List[float], str, Dict[str, Any]]],
+    batch_size: int = UPSERT_BATCH_SIZE,
 ) -> int:
     qdrant.ensure_collection(collection, size=size, distance=distance)
-    qdrant.upsert_points(collection, items)
+    upsert_items(qdrant, collection, items, batch_size)
     return qdrant.count(collection)
+
+
+def upsert_items(
+    qdrant: QdrantREST,
+    collection: str,
+    items: Iterable[Tuple[str, List[float], str, Dict[str, Any]]],
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> None:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            qdrant.upsert_points(collection, batch)
+            batch = []
+    if batch:
+        qdrant.upsert_points(collection, batch)
@@ -1,5 +1,7 @@
+import hashlib
 import json
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+import uuid
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 import httpx
 from ...shared.config_loader import get_config
 
@@ -12,17 +14,36 @@ DEFAULT_HNSW_M = 16
 COLLECTION_ENDPOINT = "/collections"
 POINTS_ENDPOINT = "/points"
 SEARCH_ENDPOINT = "/search"
+DELETE_ENDPOINT = "/delete"
+SCROLL_ENDPOINT = "/scroll"
+ALIASES_ENDPOINT = "/aliases"
 EXTERNAL_ID_KEY = "external_id"
 VECTOR_KEY = "vector"
 PAYLOAD_KEY = "payload"
 POINTS_KEY = "points"
 RESULT_KEY = "result"
+COLLECTIONS_KEY = "collections"
+ALIASES_KEY = "aliases"
+ACTIONS_KEY = "actions"
+NAME_KEY = "name"
+ALIAS_NAME_KEY = "alias_name"
+COLLECTION_NAME_KEY = "collection_name"
 POINTS_COUNT_KEY = "points_count"
+NEXT_PAGE_OFFSET_KEY = "next_page_offset"
 MAX_COUNT = 2**31 - 1
 SINGLE_CONDITION_COUNT = 1
 MULTIPLE_CONDITIONS_THRESHOLD = 1
 
 
+def to_point_id(pid: str) -> str:
+    try:
+        uuid.UUID(pid)
+        return pid
+    except Exception:
+        h = hashlib.md5(pid.encode("utf-8")).digest()
+        return str(uuid.UUID(bytes=h))
+
+
 class QdrantREST:
     def __init__(self, base_url: Optional[str] = None, client: Optional[httpx.Client] = None):
         cfg = get_config()
@@ -49,30 +70,49 @@ class QdrantREST:
         r = self.http.put(f"{COLLECTION_ENDPOINT}/{name}", json=payload)
         r.raise_for_status()
 
+    def list_collections(self) -> List[str]:
+        r = self.http.get(COLLECTION_ENDPOINT)
+        r.raise_for_status()
+        return [c[NAME_KEY] for c in r.json()[RESULT_KEY].get(COLLECTIONS_KEY, [])]
+
+    def delete_collection(self, name: str) -> None:
+        r = self.http.delete(f"{COLLECTION_ENDPOINT}/{name}")
+        if r.status_code == 404:
+            return
+        if r.status_code >= 400:
+            raise RuntimeError(f"Qdrant delete collection error: {r.status_code} {r.text}")
+
+    def get_aliases(self) -> Dict[str, str]:
+        r = self.http.get(ALIASES_ENDPOINT)
+        r.raise_for_status()
+        return {a[ALIAS_NAME_KEY]: a[COLLECTION_NAME_KEY] for a in r.json()[RESULT_KEY].get(ALIASES_KEY, [])}
+
+    def switch_alias(self, alias: str, collection: str) -> None:
+        # Both actions run in one request, so readers see either the old or the new collection
+        actions = []
+        if alias in self.get_aliases():
+            actions.append({"delete_alias": {ALIAS_NAME_KEY: alias}})
+        actions.append({"create_alias": {COLLECTION_NAME_KEY: collection, ALIAS_NAME_KEY: alias}})
+        r = self.http.post(f"{COLLECTION_ENDPOINT}{ALIASES_ENDPOINT}", json={ACTIONS_KEY: actions})
+        if r.status_code >= 400:
+            raise RuntimeError(f"Qdrant alias error: {r.status_code} {r.text}")
+
     def upsert_points(
         self,
         collection: str,
         points: Iterable[Tuple[str, List[float], str, Dict[str, Any]]],
         determinist_uuid=True,
     ) -> None:
-        def to_uuid_deterministic(s: str) -> str:
-            import hashlib, uuid
-            h = hashlib.md5(s.encode("utf-8")).digest()
-            return str(uuid.UUID(bytes=h))
-
         mapped = []
         for (pid, vec, document, metadata) in points:
             qid = pid
             try:
-                import uuid
                 uuid.UUID(pid)
             except Exception:
-                if determinist_uuid:
-                    qid = to_uuid_deterministic(pid)
-                else:
-                    qid = None
-                    metadata = dict(metadata or {})
-                    metadata[EXTERNAL_ID_KEY] = pid
+                # The original ID rides along in the payload so exports can restore it
+                metadata = dict(metadata or {})
+                metadata[EXTERNAL_ID_KEY] = pid
+                qid = to_point_id(pid) if determinist_uuid else None
 
             payload = {"document": document}
             if metadata:
@@ -86,6 +126,40 @@ class QdrantREST:
         if r.status_code >= 400:
             raise RuntimeError(f"Qdrant upsert error: {r.status_code} {r.text}")
 
+    def existing_ids(self, collection: str, ids: List[str]) -> List[str]:
+        by_point_id = {to_point_id(pid): pid for pid in ids}
+        body = {"ids": list(by_point_id), "with_payload": False, "with_vector": False}
+        r = self.http.post(f"{COLLECTION_ENDPOINT}/{collection}{POINTS_ENDPOINT}", json=body)
+        if r.status_code == 404:
+            return []
+        if r.status_code >= 400:
+            raise RuntimeError(f"Qdrant retrieve error: {r.status_code} {r.text}")
+        return [by_point_id[str(point["id"])] for point in r.json()[RESULT_KEY] if str(point["id"]) in by_point_id]
+
+    def delete_points(self, collection: str, ids: List[str]) -> None:
+        body = {POINTS_KEY: [to_point_id(pid) for pid in ids]}
+        r = self.http.post(f"{COLLECTION_ENDPOINT}/{collection}{POINTS_ENDPOINT}{DELETE_ENDPOINT}", json=body)
+        if r.status_code == 404:
+            return
+        if r.status_code >= 400:
+            raise RuntimeError(f"Qdrant delete error: {r.status_code} {r.text}")
+
+    def scroll(self, collection: str, batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+        offset = None
+        while True:
+            body = {"limit": batch_size, "with_payload": True, "with_vector": True}
+            if offset is not None:
+                body["offset"] = offset
+            r = self.http.post(f"{COLLECTION_ENDPOINT}/{collection}{POINTS_ENDPOINT}{SCROLL_ENDPOINT}", json=body)
+            if r.status_code >= 400:
+                raise RuntimeError(f"Qdrant scroll error: {r.status_code} {r.text}")
+            result = r.json()[RESULT_KEY]
+            if result.get(POINTS_KEY):
+                yield result[POINTS_KEY]
+            offset = result.get(NEXT_PAGE_OFFSET_KEY)
+            if offset is None:
+                return
+
     def _convert_filter_to_qdrant(self, filter_dict: Dict[str, Any]) -> Dict[str, Any]:
         if "$and" in filter_dict and isinstance(filter_dict["$and"], list):
             must_conditions = []
@@ -172,6 +246,9 @@ class QdrantREST:
 
     def count(self, collection: str) -> int:
         r = self.http.get(f"{COLLECTION_ENDPOINT}/{collection}")
+        if r.status_code == 404:
+            # A missing collection is empty; any other failure must not read as "wiped"
+            return 0
         r.raise_for_status()
         info = r.json()[RESULT_KEY]
         return min(info.get(POINTS_COUNT_KEY, 0), MAX_COUNT)
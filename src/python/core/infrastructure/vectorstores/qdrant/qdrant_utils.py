@@ -1,11 +1,11 @@
 from .qdrant_rest import QdrantREST
 from .build_index_qdrant import ensure_and_upsert
+from ...shared.chunk_ids import chunk_ids_for_documents
 
 DEFAULT_COLLECTION = "candidates"
 DEFAULT_SIZE = 384
 DEFAULT_DISTANCE = "Cosine"
-CANDIDATE_ID_KEY = "candidate_id"
-DOC_PREFIX = "doc_"
+EMBED_BATCH_SIZE = 64
 
 
 def index_documents_with_qdrant(
@@ -16,9 +16,12 @@ def index_documents_with_qdrant(
     size: int = DEFAULT_SIZE,
     distance: str = DEFAULT_DISTANCE,
 ) -> int:
+    # One point per chunk: IDs are content-derived, so re-indexing the same documents overwrites instead of duplicating
+    chunks = chunk_ids_for_documents(docs)
     items = []
-    for i, doc in enumerate(docs):
-        vec = emb.embed_query(doc.page_content)
-        pid = doc.metadata.get(CANDIDATE_ID_KEY) or f"{DOC_PREFIX}{i}"
-        items.append((pid, vec, doc.page_content, doc.metadata))
+    for start in range(0, len(chunks), EMBED_BATCH_SIZE):
+        batch = chunks[start:start + EMBED_BATCH_SIZE]
+        vectors = emb.embed_documents([doc.page_content for doc, _ in batch])
+        for (doc, chunk_id), vec in zip(batch, vectors):
+            items.append((chunk_id, vec, doc.page_content, doc.metadata))
     return ensure_and_upsert(qdrant, collection, size, distance, items)
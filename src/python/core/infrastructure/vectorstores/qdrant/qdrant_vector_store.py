@@ -1,39 +1,119 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from langchain_core.documents import Document
 from ....application.protocols.vector_provider_protocol import VectorProvider
+from ...shared.config_loader import get_config
+from ...shared.chunk_ids import content_ids
 
 PROVIDER_QDRANT = "QDRANT"
 DEFAULT_LIMIT = 6
+DEFAULT_COLLECTION = "candidates"
+DEFAULT_DISTANCE = "Cosine"
+EXPORT_BATCH_SIZE = 1024
+DOCUMENT_KEY = "document"
+EXTERNAL_ID_KEY = "external_id"
+
+CONFIG_VECTOR_STORAGE = "vector_storage"
+CONFIG_COLLECTION_NAME = "collection_name"
 
 
 class QdrantVectorStore:
+    def __init__(self, qdrant=None, collection: Optional[str] = None):
+        storage_config = get_config().raw.get(CONFIG_VECTOR_STORAGE, {})
+        self._qdrant = qdrant
+        # May be an alias: Qdrant resolves it server-side for reads and writes
+        self._collection = collection or storage_config.get(CONFIG_COLLECTION_NAME, DEFAULT_COLLECTION)
+        # Checked on the first upsert only; batch writes must not pay a collection lookup each
+        self._collection_ready = False
+    
     def get_provider_name(self) -> str:
         return PROVIDER_QDRANT
     
+    @property
+    def collection_name(self) -> str:
+        return self._collection
+    
     def index_documents(self, docs: List[Document]) -> Dict[str, Any]:
-        from .qdrant_rest import QdrantREST
         from .qdrant_utils import index_documents_with_qdrant
         from ...embeddings.huggingface.embedding_client import load_embeddings
         
-        qdrant = QdrantREST()
         embeddings = load_embeddings()
-        total = index_documents_with_qdrant(docs, embeddings, qdrant)
+        total = index_documents_with_qdrant(docs, embeddings, self._client(), collection=self._collection)
         return {
             "chunks": len(docs),
             "points": total,
             "provider": self.get_provider_name()
         }
     
-    def add_documents(self, documents: List[str], embeddings: List[List[float]] = None, metadata: List[Dict[str, Any]] = None) -> List[str]:
-        from langchain_core.documents import Document
-        langchain_docs = []
+    def add_documents(
+        self,
+        documents: List[str],
+        embeddings: List[List[float]] = None,
+        metadata: List[Dict[str, Any]] = None,
+        ids: List[str] = None
+    ) -> List[str]:
+        if embeddings is None:
+            from langchain_core.documents import Document
+            langchain_docs = []
+            
+            for i, doc_text in enumerate(documents):
+                doc_metadata = metadata[i] if metadata and i < len(metadata) else {}
+                langchain_docs.append(Document(page_content=doc_text, metadata=doc_metadata))
+            
+            self.index_documents(langchain_docs)
+            return [f"doc_{i}" for i in range(len(documents))]
         
-        for i, doc_text in enumerate(documents):
-            doc_metadata = metadata[i] if metadata and i < len(metadata) else {}
-            langchain_docs.append(Document(page_content=doc_text, metadata=doc_metadata))
+        if len(embeddings) != len(documents):
+            raise ValueError(f"Got {len(embeddings)} embeddings for {len(documents)} documents")
         
-        result = self.index_documents(langchain_docs)
-        return [f"doc_{i}" for i in range(len(documents))]
+        if not documents:
+            return []
+        
+        from .build_index_qdrant import upsert_items
+        
+        ids = list(ids) if ids else content_ids(documents, metadata)
+        items = [
+            (ids[i], embeddings[i], documents[i], metadata[i] if metadata and i < len(metadata) else {})
+            for i in range(len(documents))
+        ]
+        
+        if not self._collection_ready:
+            self._client().ensure_collection(self._collection, size=len(embeddings[0]), distance=DEFAULT_DISTANCE)
+            self._collection_ready = True
+        upsert_items(self._client(), self._collection, items)
+        return ids
+    
+    def delete_documents(self, ids: List[str]) -> int:
+        if not ids:
+            return 0
+        
+        # Qdrant's delete does not report how many points it removed
+        existing = self._client().existing_ids(self._collection, list(ids))
+        if existing:
+            self._client().delete_points(self._collection, existing)
+        return len(existing)
+    
+    def flush(self) -> None:
+        # Qdrant acknowledges upserts once they are durable
+        pass
+    
+    def drop_collection(self) -> None:
+        self._client().delete_collection(self._collection)
+        self._collection_ready = False
+    
+    def export_points(
+        self,
+        batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator[Tuple[List[str], List[List[float]], List[str], List[Dict[str, Any]]]]:
+        for points in self._client().scroll(self._collection, batch_size):
+            ids, vectors, documents, metadata = [], [], [], []
+            for point in points:
+                payload = dict(point.get("payload") or {})
+                documents.append(payload.pop(DOCUMENT_KEY, ""))
+                # Points written before external_id was stored only know their hashed UUID
+                ids.append(payload.pop(EXTERNAL_ID_KEY, None) or str(point["id"]))
+                vectors.append(point["vector"])
+                metadata.append(payload)
+            yield ids, vectors, documents, metadata
     
     def search(
         self,
@@ -42,14 +122,11 @@ class QdrantVectorStore:
         filter_metadata: Optional[Dict[str, Any]] = None
     ) -> List[tuple[str, Dict[str, Any], float]]:
         try:
-            from .qdrant_rest import QdrantREST
             import logging
             logger = logging.getLogger(__name__)
             
-            qdrant = QdrantREST()
-            
-            results = qdrant.search(
-                collection="candidates",
+            results = self._client().search(
+                collection=self._collection,
                 query_vector=query_embedding,
                 limit=limit,
                 qfilter=filter_metadata
@@ -58,8 +135,8 @@ class QdrantVectorStore:
             formatted_results = []
             for idx, result in enumerate(results):
                 payload = result.get("payload", {})
-                content = payload.get("document", "")
-                metadata = {k: v for k, v in payload.items() if k != "document"}
+                content = payload.get(DOCUMENT_KEY, "")
+                metadata = {k: v for k, v in payload.items() if k not in (DOCUMENT_KEY, EXTERNAL_ID_KEY)}
                 score = result.get("score", 0.0)
                 
                 # Diagnostic logging for benchmarking
@@ -78,10 +155,11 @@ class QdrantVectorStore:
             return []
     
     def count(self) -> int:
-        try:
+        # Transport errors propagate: an incremental sync reads 0 as "index wiped" and rebuilds
+        return self._client().count(self._collection)
+    
+    def _client(self):
+        if self._qdrant is None:
             from .qdrant_rest import QdrantREST
-            qdrant = QdrantREST()
-            count = qdrant.count("candidates")
-            return count
-        except Exception as e:
-            return 0
+            self._qdrant = QdrantREST()
+        return self._qdrant
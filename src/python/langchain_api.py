@@ -1,19 +1,46 @@
+import argparse
 import sys
 from core.infrastructure.shared.config_loader import get_config
 
 MODE_SERVE = "serve"
+MODE_REBUILD = "rebuild"
+MODE_EXPORT_INDEX = "export-index"
+MODE_IMPORT_INDEX = "import-index"
+MODE_INGEST = "ingest"
+FLAG_FORCE = "--force"
 DEFAULT_PORT = 8000
 DEFAULT_RELOAD = True
 CONFIG_PYTHON_API = "python_api"
 CONFIG_PORT = "port"
 
 
-def _build_index() -> None:
+def _build_index(force: bool = False) -> None:
     from core.application.use_cases.build_vector_index_use_case import build_index
-    info = build_index()
+    info = build_index(force=force)
     print(f"[INDEX] {info}")
 
 
+def _ingest(args: list[str]) -> None:
+    from core.application.use_cases.build_vector_index_use_case import ingest
+    parser = argparse.ArgumentParser(prog=f"langchain_api.py {MODE_INGEST}")
+    parser.add_argument("input_dir", nargs="?", help="directory of candidate JSON files (default: data.input)")
+    parser.add_argument("--workers", type=int, help="loader processes (default: candidate_loading.workers)")
+    parser.add_argument("--batch-size", type=int, help="files per committed batch (default: ingest.batch_size)")
+    parser.add_argument("--fresh", action="store_true", help="ignore the checkpoint and start from the first file")
+    options = parser.parse_args(args)
+    ingest(options.input_dir, batch_size=options.batch_size, workers=options.workers, fresh=options.fresh)
+
+
+def _export_index(path: str | None) -> None:
+    from core.application.use_cases.index_snapshot_use_case import export_index
+    export_index(path)
+
+
+def _import_index(path: str | None, force: bool) -> None:
+    from core.application.use_cases.index_snapshot_use_case import import_index
+    import_index(path, force=force)
+
+
 def _serve() -> None:
     import uvicorn
     cfg = get_config()
@@ -27,10 +54,23 @@ def _serve() -> None:
 def main(argv: list[str] | None = None) -> int:
     argv = list(argv or sys.argv[1:])
     mode = (argv[0].lower() if argv else "")
+    options = [arg for arg in argv[1:] if arg.startswith("--")]
+    path = next((arg for arg in argv[1:] if not arg.startswith("--")), None)
+    if mode == MODE_INGEST:
+        _ingest(argv[1:])
+        return 0
+    if mode == MODE_EXPORT_INDEX:
+        _export_index(path)
+        return 0
+    if mode == MODE_IMPORT_INDEX:
+        # --force skips the embedding model check
+        _import_index(path, force=FLAG_FORCE in options)
+        _serve()
+        return 0
     if mode == MODE_SERVE:
         _serve()
         return 0
-    _build_index()
+    _build_index(force=mode == MODE_REBUILD)
     _serve()
     return 0
 
@@ -0,0 +1,78 @@
+"""
+Validation script for the structured LLM response cache.
+Tests that it is off by default, that keys follow the prompt and model
+config, and that the disk tier's size limit holds when several processes
+share one directory.
+"""
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, 'src/python')
+
+from langchain_core.messages import HumanMessage, SystemMessage
+from pydantic import BaseModel
+
+from core.infrastructure.llm.cache.llm_response_cache import (
+    DiskLlmCache, ENTRY_SUFFIX, create_llm_response_cache, llm_cache_key
+)
+
+all_passed = True
+
+
+def check(name: str, actual, expected) -> None:
+    global all_passed
+    passed = actual == expected
+    all_passed = all_passed and passed
+    print(f"{'PASS' if passed else 'FAIL'} | {name}: {actual!r} (expected: {expected!r})")
+
+
+class Answer(BaseModel):
+    text: str
+
+
+def directory_bytes(directory: Path) -> int:
+    return sum(path.stat().st_size for path in directory.glob(f"*/*{ENTRY_SUFFIX}"))
+
+
+print("=" * 70)
+print("LLM RESPONSE CACHE TEST")
+print("=" * 70)
+
+check("disabled unless configured", create_llm_response_cache(), None)
+
+messages = [SystemMessage(content="system"), HumanMessage(content="question")]
+key = llm_cache_key(messages, {"model": "m", "temperature": 0}, Answer)
+check("same prompt, same key", llm_cache_key(list(messages), {"temperature": 0, "model": "m"}, Answer), key)
+check("other question, other key",
+      llm_cache_key([messages[0], HumanMessage(content="other")], {"model": "m", "temperature": 0}, Answer) == key, False)
+check("other model, other key", llm_cache_key(messages, {"model": "n", "temperature": 0}, Answer) == key, False)
+
+with tempfile.TemporaryDirectory() as tmp:
+    directory = Path(tmp)
+    value = {"text": "x" * 200}
+    entry_bytes = len('{"text": "' + "x" * 200 + '"}')
+    max_bytes = entry_bytes * 10
+
+    # Two instances stand in for two API processes sharing the directory
+    first = DiskLlmCache(directory, max_bytes)
+    second = DiskLlmCache(directory, max_bytes)
+    for i in range(8):
+        first.put(f"{i:064x}", value)
+    for i in range(8, 16):
+        second.put(f"{i:064x}", value)
+    check("second process sees first process's entries", directory_bytes(directory) <= max_bytes, True)
+    check("newest entry kept", second.get(f"{15:064x}"), value)
+
+    for i in range(16, 24):
+        first.put(f"{i:064x}", value)
+    check("limit holds across processes", directory_bytes(directory) <= max_bytes, True)
+
+    restarted = DiskLlmCache(directory, max_bytes)
+    check("restart picks up existing entries", restarted.stats()["entries"], first.stats()["entries"])
+
+print("=" * 70)
+if all_passed:
+    print("ALL TESTS PASSED")
+else:
+    print("SOME TESTS FAILED")
+    sys.exit(1)
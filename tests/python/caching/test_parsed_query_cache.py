@@ -0,0 +1,47 @@
+"""
+Validation script for the parsed-question cache in AskQuestionUseCase.
+Tests that spellings differing only in case and whitespace share one entry,
+while ParsedQuery.query_text keeps the question exactly as asked.
+"""
+import sys
+sys.path.insert(0, 'src/python')
+
+from core.application.use_cases.ask_question_use_case import AskQuestionUseCase
+
+all_passed = True
+
+
+def check(name: str, actual, expected) -> None:
+    global all_passed
+    passed = actual == expected
+    all_passed = all_passed and passed
+    print(f"{'PASS' if passed else 'FAIL'} | {name}: {actual!r} (expected: {expected!r})")
+
+
+print("=" * 70)
+print("PARSED QUERY CACHE TEST")
+print("=" * 70)
+
+use_case = AskQuestionUseCase(None, None, None)
+
+first = use_case._prepare_query("Best  Senior JAVA developer with 5 years")
+second = use_case._prepare_query("best senior java developer   with 5 years")
+stats = use_case.query_cache.stats()
+
+check("case and whitespace variants share an entry", (stats["hits"], stats["misses"]), (1, 1))
+check("normalized key", first.normalized_question, "best senior java developer with 5 years")
+check("first request keeps its raw question", first.parsed_query.query_text, "Best  Senior JAVA developer with 5 years")
+check("cache hit keeps its own raw question", second.parsed_query.query_text, "best senior java developer   with 5 years")
+check("parsed fields are shared", (first.parsed_query.required_technologies, first.parsed_query.min_years_experience),
+      (second.parsed_query.required_technologies, second.parsed_query.min_years_experience))
+check("filters are shared", first.candidate_filters, second.candidate_filters)
+
+again = use_case._prepare_query("Best  Senior JAVA developer with 5 years")
+check("cached entry is not rewritten by a hit", again.parsed_query.query_text, "Best  Senior JAVA developer with 5 years")
+
+print("=" * 70)
+if all_passed:
+    print("ALL TESTS PASSED")
+else:
+    print("SOME TESTS FAILED")
+    sys.exit(1)
@@ -0,0 +1,79 @@
+"""
+Validation script for the /chat semantic response cache.
+Tests bucket keying, the similarity threshold, TTL expiry, LRU bounds, and
+that an index change moves AskQuestionUseCase to a new cache key.
+"""
+import sys
+import time
+sys.path.insert(0, 'src/python')
+
+from core.application.services.response_cache import ResponseCache
+from core.application.use_cases.ask_question_use_case import AskQuestionUseCase
+
+all_passed = True
+
+
+def check(name: str, actual, expected) -> None:
+    global all_passed
+    passed = actual == expected
+    all_passed = all_passed and passed
+    print(f"{'PASS' if passed else 'FAIL'} | {name}: {actual!r} (expected: {expected!r})")
+
+
+def value(hit):
+    return hit[0] if hit is not None else None
+
+
+class FakeStore:
+    collection_name = "candidates_v1"
+
+
+print("=" * 70)
+print("RESPONSE CACHE TEST")
+print("=" * 70)
+
+check("disabled unless configured", ResponseCache().enabled, False)
+
+cache = ResponseCache(max_entries=2, similarity_threshold=0.95, ttl_seconds=60, enabled=True)
+cache.put("java", [1.0, 0.0], "java answer")
+check("near-identical question hits", value(cache.get("java", [0.99, 0.05])), "java answer")
+check("dissimilar question misses", value(cache.get("java", [0.5, 0.5])), None)
+check("same embedding under another key misses", value(cache.get("python", [1.0, 0.0])), None)
+
+cache.put("python", [1.0, 0.0], "python answer")
+cache.get("java", [1.0, 0.0])
+cache.put("go", [1.0, 0.0], "go answer")
+check("least recently used entry is evicted", value(cache.get("python", [1.0, 0.0])), None)
+check("recently used entry survives", value(cache.get("java", [1.0, 0.0])), "java answer")
+
+cache.invalidate()
+check("invalidate drops every entry", value(cache.get("java", [1.0, 0.0])), None)
+
+short = ResponseCache(max_entries=10, similarity_threshold=0.95, ttl_seconds=0.05, enabled=True)
+short.put("java", [1.0, 0.0], "java answer")
+check("live entry hits", value(short.get("java", [1.0, 0.0])), "java answer")
+time.sleep(0.1)
+check("expired entry misses", value(short.get("java", [1.0, 0.0])), None)
+check("expired entry is removed", short.stats()["entries"], 0)
+
+store = FakeStore()
+use_case = AskQuestionUseCase(None, store, None)
+parsed = use_case.query_parser.parse("best senior java developer with 5 years")
+key = use_case._response_cache_key({"type": "candidate"}, parsed)
+check("key is stable for the same filters", use_case._response_cache_key({"type": "candidate"}, parsed), key)
+check("key includes the metadata filter", use_case._response_cache_key({"type": "other"}, parsed) != key, True)
+
+use_case.on_index_changed()
+check("local reindex changes the key", use_case._response_cache_key({"type": "candidate"}, parsed) != key, True)
+
+after_reindex = use_case._response_cache_key({"type": "candidate"}, parsed)
+store.collection_name = "candidates_v2"
+use_case.on_index_changed()
+check("blue/green switch changes the key", use_case._response_cache_key({"type": "candidate"}, parsed) != after_reindex, True)
+
+print("=" * 70)
+if all_passed:
+    print("ALL TESTS PASSED")
+else:
+    print("SOME TESTS FAILED")
+    sys.exit(1)
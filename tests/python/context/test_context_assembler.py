@@ -0,0 +1,86 @@
+"""
+Validation script for the /chat context budget.
+Tests token estimation and truncation, that assembled contexts stay within
+max_tokens, that headers win over documents, that better ranked candidates
+get more of the budget, and chunk-overlap deduplication.
+"""
+import sys
+from types import SimpleNamespace
+sys.path.insert(0, 'src/python')
+
+from core.application.services.context_assembler import ContextAssembler, TokenEstimator, TRUNCATION_SUFFIX
+
+all_passed = True
+
+
+def check(name: str, actual, expected) -> None:
+    global all_passed
+    passed = actual == expected
+    all_passed = all_passed and passed
+    print(f"{'PASS' if passed else 'FAIL'} | {name}: {actual!r} (expected: {expected!r})")
+
+
+def candidate(candidate_id: str, documents):
+    return SimpleNamespace(candidate_id=candidate_id, metadata={}, documents=list(documents))
+
+
+def section(text: str, candidate_id: str) -> str:
+    start = text.index(f"(ID: {candidate_id})")
+    end = text.find("=== CANDIDATE", start)
+    return text[start:end if end >= 0 else len(text)]
+
+
+def words(prefix: str, count: int) -> str:
+    return " ".join(f"{prefix}{i}" for i in range(count))
+
+
+print("=" * 70)
+print("CONTEXT ASSEMBLER TEST")
+print("=" * 70)
+
+estimator = TokenEstimator()
+check("words split into 4-char pieces", estimator.count("Python developer"), 5)
+check("punctuation counts", estimator.count("C#, .NET"), 5)
+sample = words("skill", 40)
+check("truncate keeps a prefix", sample.startswith(estimator.truncate(sample, 10)), True)
+check("truncate respects the limit", estimator.count(estimator.truncate(sample, 10)), 10)
+check("truncate to zero", estimator.truncate(sample, 0), "")
+
+candidates = [candidate(f"c{i}", [words(f"doc{i}a", 60), words(f"doc{i}b", 60)]) for i in range(1, 4)]
+
+unlimited = ContextAssembler(max_tokens=0).assemble(candidates)
+check("unlimited keeps every document", (unlimited.documents, unlimited.truncated, unlimited.budget), (6, False, None))
+
+for budget in (400, 250, 120):
+    context = ContextAssembler(max_tokens=budget, rank_decay=0.7).assemble(candidates)
+    check(f"budget {budget} holds", context.tokens <= budget, True)
+    check(f"budget {budget} keeps every header", context.candidates, 3)
+    check(f"budget {budget} counts match", context.documents + context.documents_dropped, 6)
+
+context = ContextAssembler(max_tokens=400, rank_decay=0.5).assemble(candidates)
+first, third = section(context.text, "c1"), section(context.text, "c3")
+check("top candidate gets the larger share", estimator.count(first) > estimator.count(third), True)
+check("a cut document ends with the suffix", context.truncated and TRUNCATION_SUFFIX in context.text, True)
+
+small = [candidate("c1", [words("short", 5)]), candidate("c2", [words("long", 300)])]
+context = ContextAssembler(max_tokens=300, rank_decay=0.1).assemble(small)
+check("unused budget flows down", context.documents, 2)
+check("flowed budget still holds", context.tokens <= 300, True)
+
+tiny = ContextAssembler(max_tokens=25).assemble(candidates)
+check("headers alone over budget drop lowest ranks", (tiny.candidates, "(ID: c3)" in tiny.text), (1, False))
+check("tiny budget holds", tiny.tokens <= 25, True)
+
+overlap = "shared overlap text between two chunks"
+chunks = [f"first chunk body {overlap}", f"{overlap} second chunk body", "first chunk body"]
+context = ContextAssembler(max_tokens=0).assemble([candidate("c1", chunks)])
+check("contained chunk dropped", context.duplicates_removed, 1)
+check("overlap appears once", context.text.count(overlap), 1)
+check("second chunk body kept", "second chunk body" in context.text, True)
+
+print("=" * 70)
+if all_passed:
+    print("ALL TESTS PASSED")
+else:
+    print("SOME TESTS FAILED")
+    sys.exit(1)
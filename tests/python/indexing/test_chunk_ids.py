@@ -0,0 +1,63 @@
+"""
+Validation script for content-derived chunk IDs.
+Tests that IDs are stable per section, that a text repeated within a section
+is kept once, and that content_ids never drops a document.
+"""
+import sys
+sys.path.insert(0, 'src/python')
+
+from langchain_core.documents import Document
+
+from core.infrastructure.shared.chunk_ids import assign_chunk_ids, content_ids, make_chunk_id
+
+all_passed = True
+
+
+def check(name: str, actual, expected) -> None:
+    global all_passed
+    passed = actual == expected
+    all_passed = all_passed and passed
+    print(f"{'PASS' if passed else 'FAIL'} | {name}: {actual!r} (expected: {expected!r})")
+
+
+def docs(*texts):
+    return [Document(page_content=text) for text in texts]
+
+
+def ids(chunks):
+    return [chunk_id for _, chunk_id in chunks]
+
+
+print("=" * 70)
+print("CHUNK IDS TEST")
+print("=" * 70)
+
+chunks = assign_chunk_ids("c1", [("skills", docs("java", "python", "java")), ("summary", docs("java"))])
+check("only the repeat within a section is dropped", [doc.page_content for doc, _ in chunks], ["java", "python", "java"])
+check("ordinals skip the dropped copy", ids(chunks), [
+    make_chunk_id("c1", "skills", 0, "java"),
+    make_chunk_id("c1", "skills", 1, "python"),
+    make_chunk_id("c1", "summary", 0, "java"),
+])
+
+split = assign_chunk_ids("c1", [("skills", docs("java")), ("summary", docs("java")), ("skills", docs("java", "go"))])
+check("a section split across entries dedupes as one", ids(split), [
+    make_chunk_id("c1", "skills", 0, "java"),
+    make_chunk_id("c1", "summary", 0, "java"),
+    make_chunk_id("c1", "skills", 1, "go"),
+])
+
+edited = assign_chunk_ids("c1", [("skills", docs("java", "rust")), ("summary", docs("java"))])
+check("editing one section keeps the other's IDs", ids(edited)[2], ids(chunks)[2])
+check("same input gives the same IDs", ids(assign_chunk_ids("c1", [("skills", docs("java", "python", "java")), ("summary", docs("java"))])), ids(chunks))
+
+texts = ["java", "java", "go"]
+check("content_ids keeps one ID per document", len(content_ids(texts)), len(texts))
+check("content_ids gives repeated texts distinct IDs", len(set(content_ids(texts))), len(texts))
+
+print("=" * 70)
+if all_passed:
+    print("ALL TESTS PASSED")
+else:
+    print("SOME TESTS FAILED")
+    sys.exit(1)
@@ -0,0 +1,80 @@
+"""
+Validation script for the incremental index manifest.
+Tests that plan() splits sources into changed/removed/unchanged against the
+recorded hashes, and that the recorded state survives a save and reload.
+"""
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, 'src/python')
+
+from core.infrastructure.shared.index_manifest import IndexManifest
+
+all_passed = True
+
+
+def check(name: str, actual, expected) -> None:
+    global all_passed
+    passed = actual == expected
+    all_passed = all_passed and passed
+    print(f"{'PASS' if passed else 'FAIL'} | {name}: {actual} (expected: {expected})")
+
+
+print("=" * 70)
+print("INDEX MANIFEST PLAN TEST")
+print("=" * 70)
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = Path(tmp) / "numpy_candidates_blocks.manifest.json"
+    manifest = IndexManifest(path, "NUMPY", "blocks")
+    check("new manifest is empty", manifest.is_empty(), True)
+
+    plan = manifest.plan({"a.json": "h1", "b.json": "h2"})
+    check("empty manifest: every source changed", sorted(plan.changed), ["a.json", "b.json"])
+    check("empty manifest: nothing removed", plan.removed, [])
+
+    manifest.record("a.json", "h1", [manifest.qualify("a-0"), manifest.qualify("a-1")])
+    manifest.record("b.json", "h2", [manifest.qualify("b-0")])
+    manifest.record("c.json", "h3", [manifest.qualify("c-0")])
+    check("chunk IDs are namespaced", manifest.chunk_ids(["a.json"]), ["blocks:a-0", "blocks:a-1"])
+    manifest.save()
+
+    reloaded = IndexManifest(path, "NUMPY", "blocks")
+    check("reload keeps every source", sorted(reloaded.sources()), ["a.json", "b.json", "c.json"])
+    check("reload keeps chunk IDs", reloaded.chunk_ids(["b.json", "c.json"]), ["blocks:b-0", "blocks:c-0"])
+
+    plan = reloaded.plan({"a.json": "h1", "b.json": "h2-edited", "d.json": "h4"})
+    check("same hash is unchanged", plan.unchanged, ["a.json"])
+    check("edited and new sources are changed", sorted(plan.changed), ["b.json", "d.json"])
+    check("absent sources are removed", plan.removed, ["c.json"])
+    check("stale chunks of changed and removed sources", reloaded.chunk_ids(plan.changed + plan.removed), ["blocks:b-0", "blocks:c-0"])
+
+    reloaded.forget("c.json")
+    reloaded.record("b.json", "h2-edited", [reloaded.qualify("b-0"), reloaded.qualify("b-1")])
+    reloaded.save()
+
+    after = IndexManifest(path, "NUMPY", "blocks")
+    plan = after.plan({"a.json": "h1", "b.json": "h2-edited"})
+    check("after the sync nothing is changed", plan.changed, [])
+    check("after the sync nothing is removed", plan.removed, [])
+    check("re-recorded source has its new chunks", after.chunk_ids(["b.json"]), ["blocks:b-0", "blocks:b-1"])
+
+    journal = path.with_suffix(path.suffix + ".journal")
+    check("checkpoints append to the journal", journal.exists(), True)
+    snapshot = path.read_text(encoding="utf-8")
+    after.record("e.json", "h5", [after.qualify("e-0")])
+    after.save()
+    check("a checkpoint leaves the snapshot alone", path.read_text(encoding="utf-8") == snapshot, True)
+    check("journal replays on load", IndexManifest(path, "NUMPY", "blocks").chunk_ids(["e.json"]), ["blocks:e-0"])
+
+    after.reset()
+    after.save()
+    check("reset persists as empty", IndexManifest(path, "NUMPY", "blocks").is_empty(), True)
+    check("reset compacts the journal away", journal.exists(), False)
+
+print("=" * 70)
+if all_passed:
+    print("ALL TESTS PASSED")
+else:
+    print("SOME TESTS FAILED")
+    sys.exit(1)
@@ -0,0 +1,108 @@
+"""
+Validation script for the wiped-index check of IncrementalIndexService.sync.
+Tests that a failing count() propagates instead of resetting the manifest,
+that only a missing Chroma collection reads as empty, and that a store that
+really is empty still triggers the full rebuild.
+"""
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, 'src/python')
+
+from core.application.services.incremental_index_service import IncrementalIndexService
+from core.infrastructure.shared.index_manifest import IndexManifest
+from core.infrastructure.vectorstores.chroma.chroma_vector_store import ChromaVectorStore
+
+all_passed = True
+
+
+def check(name: str, actual, expected) -> None:
+    global all_passed
+    passed = actual == expected
+    all_passed = all_passed and passed
+    print(f"{'PASS' if passed else 'FAIL'} | {name}: {actual} (expected: {expected})")
+
+
+class NotFoundError(Exception):
+    """Stands in for chromadb.errors.NotFoundError, which is matched by name."""
+
+
+class FakeCollection:
+    def __init__(self, error: Exception):
+        self._error = error
+
+    def count(self) -> int:
+        raise self._error
+
+
+def chroma_store(error: Exception) -> ChromaVectorStore:
+    store = ChromaVectorStore()
+    store._chroma_vectorstore = type("FakeChroma", (), {"_collection": FakeCollection(error)})()
+    return store
+
+
+class CountingStore:
+    def __init__(self, count):
+        self._count = count
+        self.deleted = []
+
+    def count(self) -> int:
+        if isinstance(self._count, Exception):
+            raise self._count
+        return self._count
+
+    def add_documents(self, documents, embeddings=None, metadata=None, ids=None):
+        return list(ids or [])
+
+    def delete_documents(self, ids) -> int:
+        self.deleted.extend(ids)
+        return len(ids)
+
+    def flush(self) -> None:
+        pass
+
+
+def no_documents(keys):
+    return [([], None) for _ in keys]
+
+
+print("=" * 70)
+print("SYNC COUNT FAILURE TEST")
+print("=" * 70)
+
+try:
+    chroma_store(ConnectionError("chroma unavailable")).count()
+    check("transient Chroma error propagates", "returned", "raised")
+except ConnectionError:
+    check("transient Chroma error propagates", "raised", "raised")
+check("deleted collection counts as empty", chroma_store(NotFoundError("gone")).count(), 0)
+check("old chromadb missing collection counts as empty",
+      chroma_store(ValueError("Collection langchain does not exist.")).count(), 0)
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = Path(tmp) / "native_candidates_blocks.manifest.json"
+    manifest = IndexManifest(path, "NATIVE", "blocks")
+    manifest.record("a.json", "h1", [manifest.qualify("a-0")])
+    manifest.save()
+
+    store = CountingStore(ConnectionError("chroma unavailable"))
+    service = IncrementalIndexService(store, None, IndexManifest(path, "NATIVE", "blocks"))
+    try:
+        service.sync({"a.json": "h1"}, no_documents)
+        check("sync with a failing count() raises", "returned", "raised")
+    except ConnectionError:
+        check("sync with a failing count() raises", "raised", "raised")
+    reloaded = IndexManifest(path, "NATIVE", "blocks")
+    check("manifest kept after a failing count()", reloaded.sources(), ["a.json"])
+    check("nothing deleted after a failing count()", store.deleted, [])
+
+    wiped = CountingStore(0)
+    IncrementalIndexService(wiped, None, IndexManifest(path, "NATIVE", "blocks")).sync({}, no_documents)
+    check("empty store still resets the manifest", IndexManifest(path, "NATIVE", "blocks").is_empty(), True)
+
+print("=" * 70)
+if all_passed:
+    print("ALL TESTS PASSED")
+else:
+    print("SOME TESTS FAILED")
+    sys.exit(1)
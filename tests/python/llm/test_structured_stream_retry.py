@@ -0,0 +1,86 @@
+"""
+Validation script for streaming structured LLM answers.
+Tests that unparseable streamed text is followed by a reset before the
+corrective retry, both from StructuredChatAdapter and as an SSE event from
+AskQuestionUseCase.stream, and that a clean stream has no reset.
+"""
+import asyncio
+import sys
+sys.path.insert(0, 'src/python')
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from pydantic import BaseModel
+
+from core.application.dtos.chat_request_dto import ChatRequestDto
+from core.application.dtos.chat_result import ChatResult
+from core.application.protocols.structured_llm_protocol import ChatContext, StreamReset
+from core.application.use_cases.ask_question_use_case import AskQuestionUseCase, _Retrieval
+from core.infrastructure.llm.adapters.structured_chat_adapter import StructuredChatAdapter
+
+all_passed = True
+
+
+def check(name: str, actual, expected) -> None:
+    global all_passed
+    passed = actual == expected
+    all_passed = all_passed and passed
+    print(f"{'PASS' if passed else 'FAIL'} | {name}: {actual!r} (expected: {expected!r})")
+
+
+class Answer(BaseModel):
+    text: str
+
+
+CONTEXT = ChatContext(system_prompt="system", user_message="question")
+GARBAGE = "Sure, here is the answer"
+VALID = '{"text": "ok"}'
+
+
+def adapter(*outputs: str) -> StructuredChatAdapter:
+    return StructuredChatAdapter(GenericFakeChatModel(messages=iter(AIMessage(content=o) for o in outputs)), Answer)
+
+
+async def collect(stream):
+    return [item async for item in stream]
+
+
+print("=" * 70)
+print("STRUCTURED STREAM RETRY TEST")
+print("=" * 70)
+
+items = asyncio.run(collect(adapter(VALID).astream_structured(CONTEXT)))
+check("clean stream has no reset", any(isinstance(item, StreamReset) for item in items), False)
+check("clean stream ends with the parsed answer", items[-1], Answer(text="ok"))
+
+items = asyncio.run(collect(adapter(GARBAGE, VALID).astream_structured(CONTEXT)))
+reset_at = next(i for i, item in enumerate(items) if isinstance(item, StreamReset))
+check("garbage deltas come before the reset", "".join(items[:reset_at]), GARBAGE)
+check("reset names the retry attempt", items[reset_at], StreamReset(attempt=2))
+check("retry answer follows the reset", items[reset_at + 1:], [Answer(text="ok")])
+
+
+class StreamingUseCase(AskQuestionUseCase):
+    """Skips retrieval so only the LLM part of stream() runs."""
+
+    async def _retrieve(self, request):
+        return _Retrieval(response_key=None, query_embedding=[], chat_context=CONTEXT)
+
+    def _complete(self, retrieval, llm_justification):
+        return ChatResult(answer=llm_justification.text, sources=[])
+
+
+use_case = StreamingUseCase(None, None, adapter(GARBAGE, VALID))
+events = asyncio.run(collect(use_case.stream(ChatRequestDto(question="question"))))
+names = [event for event, _ in events]
+check("SSE stream resets before the retried result", names[names.index("reset"):], ["reset", "result"])
+check("reset payload", events[names.index("reset")][1], {"attempt": 2})
+check("tokens precede the reset", set(names[1:names.index("reset")]), {"token"})
+check("final answer is the retry's", events[-1][1]["answer"], "ok")
+
+print("=" * 70)
+if all_passed:
+    print("ALL TESTS PASSED")
+else:
+    print("SOME TESTS FAILED")
+    sys.exit(1)
@@ -0,0 +1,87 @@
+"""
+Validation script for skill normalization rule order.
+Tests that the compiled rule alternation keeps first-match-wins semantics:
+every name maps like trying each rule in order with re.match, and reordering
+overlapping rules changes the winner.
+"""
+import json
+import re
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, 'src/python')
+
+from core.application.services.skill_normalizer import SkillNormalizer
+
+RULES_PATH = Path('data/normalization/skill_rules.json')
+INPUT_DIR = Path('data/input')
+
+EDGE_CASES = [
+    "JavaScript", "Java / JavaScript", "ASP.NET Core", ".NET (6–8) / C#", "C# and Java",
+    "Node", "Node.js", "NodeJS", "  Spring Boot  ", "SPRING", "TypeScript + Angular", "",
+    "Unknown Skill", "SQL Server / MySQL", "Git", "Data Structures & Algorithms (Java)",
+]
+
+all_passed = True
+
+
+def check(name: str, actual, expected) -> None:
+    global all_passed
+    passed = actual == expected
+    all_passed = all_passed and passed
+    print(f"{'PASS' if passed else 'FAIL'} | {name}: {actual!r} (expected: {expected!r})")
+
+
+def first_match(rules, skill: str) -> str:
+    # Reference semantics: try each rule in file order, the first re.match wins
+    if not skill:
+        return skill
+    skill = skill.strip()
+    for rule in rules:
+        if re.match(rule["pattern"], skill, re.IGNORECASE):
+            return rule["canonical"]
+    return skill
+
+
+def write_rules(directory: str, name: str, rules) -> Path:
+    path = Path(directory) / name
+    path.write_text(json.dumps({"rules": rules}), encoding="utf-8")
+    return path
+
+
+print("=" * 70)
+print("SKILL NORMALIZATION ORDER TEST")
+print("=" * 70)
+
+rules = json.loads(RULES_PATH.read_text(encoding="utf-8"))["rules"]
+skills = set(EDGE_CASES)
+for path in sorted(INPUT_DIR.glob("*.json")):
+    record = json.loads(path.read_text(encoding="utf-8"))
+    skills.update(entry.get("SkillName", "") for entry in record.get("SkillMatrix", []))
+
+SkillNormalizer.load_rules(RULES_PATH)
+mismatches = [skill for skill in sorted(skills) if SkillNormalizer.normalize(skill) != first_match(rules, skill)]
+check(f"{len(skills)} names map like the ordered rule scan", mismatches, [])
+
+java_first = [
+    {"pattern": ".*\\bJava.*", "canonical": "Java"},
+    {"pattern": ".*\\bJavaScript\\b.*", "canonical": "JavaScript"},
+]
+with tempfile.TemporaryDirectory() as tmp:
+    SkillNormalizer.load_rules(write_rules(tmp, "java_first.json", java_first))
+    check("earlier broad rule wins", SkillNormalizer.normalize("JavaScript (ES6+)"), "Java")
+
+    # Reloading must also drop the memoized result
+    SkillNormalizer.load_rules(write_rules(tmp, "javascript_first.json", list(reversed(java_first))))
+    check("reordered rules change the winner", SkillNormalizer.normalize("JavaScript (ES6+)"), "JavaScript")
+    check("later rule still applies when the first misses", SkillNormalizer.normalize("Java 8"), "Java")
+    check("no rule keeps the trimmed name", SkillNormalizer.normalize("  Cobol  "), "Cobol")
+
+SkillNormalizer.load_rules(RULES_PATH)
+
+print("=" * 70)
+if all_passed:
+    print("ALL TESTS PASSED")
+else:
+    print("SOME TESTS FAILED")
+    sys.exit(1)
@@ -0,0 +1,108 @@
+"""
+Reference implementation of the former per-rule query parser, shared by the
+query parsing engine test and the query parsing benchmark as their baseline.
+"""
+import random
+import re
+
+from core.domain.entities.parsed_query import ParsedQuery
+from core.domain.enums.query_intent import QueryIntent
+from core.domain.configuration.query_parsing_config import DEFAULT_QUERY_PARSING_CONFIG
+
+
+OPENERS = [
+    "Find the best", "List all", "Show me", "Compare the", "Explain why the", "Who is the most qualified",
+    "Get all", "Which", "I need a", "Looking for an ideal", "What makes a good", "Top",
+]
+SENIORITY = ["", "senior", "junior", "mid-level", "lead", "staff engineer", "principal", "intern", "sr", "tech lead"]
+ROLES = ["developer", "engineer", "architect", "candidate", "backend dev", "frontend engineer", "devops engineer"]
+CONNECTORS = ["with", "who knows", "experienced in", "skilled at", "for"]
+EXPERIENCE = ["", "5 years", "3+ yrs", "at least 7 years of experience", "10 years exp", "minimum 2 years", "12yrs"]
+FILLER = [
+    "", "for a fintech team", "in Europe", "available immediately", "remote only", "vs the others",
+    "for a startup building payments", "who has shipped production systems",
+]
+TECHNOLOGY_EXTRAS = ["C++", "Rust", "Kafka", "Spark", "GraphQL", "Terraform", "Nodejs", "node.js", "C#"]
+
+
+class LegacyParser:
+    """The pre-engine QueryParser: one regex per synonym, substring scans, experience patterns in turn."""
+
+    def __init__(self, config):
+        self._config = config
+        self._token_map = {}
+        for level, tokens in config.seniority_tokens.items():
+            for token in tokens:
+                self._token_map[token.lower()] = level
+        self._patterns = [
+            r'(\d+)\+?\s*(?:years?|yrs?)',
+            r'at least (\d+)\s*(?:years?|yrs?)',
+            r'minimum (\d+)\s*(?:years?|yrs?)',
+            r'min (\d+)\s*(?:years?|yrs?)',
+            r'(\d+)\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)',
+        ]
+        self._intents = {
+            "find_best": QueryIntent.FIND_BEST,
+            "list_all": QueryIntent.LIST_ALL,
+            "compare": QueryIntent.COMPARE,
+            "explain": QueryIntent.EXPLAIN,
+        }
+
+    def parse(self, query_text: str) -> ParsedQuery:
+        return ParsedQuery(
+            query_text=query_text,
+            query_intent=self._intent(query_text),
+            required_technologies=tuple(self._technologies(query_text)),
+            min_seniority_level=self._seniority(query_text),
+            min_years_experience=self._years(query_text)
+        )
+
+    def _intent(self, query_text):
+        query_lower = query_text.lower()
+        for intent_key, keywords in self._config.intent_keywords.items():
+            for keyword in keywords:
+                if keyword.lower() in query_lower:
+                    return self._intents.get(intent_key, QueryIntent.GENERAL)
+        return QueryIntent.GENERAL
+
+    def _technologies(self, query_text):
+        query_lower = query_text.lower()
+        matched_tokens = set()
+        for token, normalized in self._config.technology_synonyms.items():
+            pattern = r'\b' + re.escape(token.lower()) + r'\b'
+            if re.search(pattern, query_lower):
+                matched_tokens.add(normalized)
+        return sorted(list(matched_tokens))
+
+    def _seniority(self, query_text):
+        query_lower = query_text.lower()
+        for token, level in self._token_map.items():
+            if token in query_lower:
+                return level
+        return None
+
+    def _years(self, query_text):
+        query_lower = query_text.lower()
+        for pattern in self._patterns:
+            match = re.search(pattern, query_lower)
+            if match:
+                return int(match.group(1))
+        return None
+
+
+def synthetic_queries(count: int, seed: int) -> list[str]:
+    """Random recruiter questions mixing openers, seniority, roles, technologies and experience."""
+    rng = random.Random(seed)
+    technologies = list(DEFAULT_QUERY_PARSING_CONFIG.technology_synonyms) + TECHNOLOGY_EXTRAS
+    queries = []
+    for _ in range(count):
+        picked = rng.sample(technologies, rng.randint(0, 3))
+        if rng.random() < 0.3:
+            picked = [token.upper() if rng.random() < 0.5 else token.title() for token in picked]
+        parts = [
+            rng.choice(OPENERS), rng.choice(SENIORITY), rng.choice(ROLES),
+            rng.choice(CONNECTORS), " and ".join(picked) or "any stack",
+            rng.choice(EXPERIENCE), rng.choice(FILLER),
+        ]
+        queries.append(" ".join(part for part in parts if part) + rng.choice(["", "?", "."]))
+    return queries
@@ -0,0 +1,71 @@
+"""
+Validation script for the single-pass query parsing engine.
+Tests that QueryParser parses exactly like the former per-rule scans, kept as
+the reference implementation in legacy_query_parser.
+"""
+import sys
+sys.path.insert(0, 'src/python')
+sys.path.insert(0, 'tests/python/parsing')
+
+from core.application.services.query_parser import QueryParser
+from core.domain.configuration.query_parsing_config import QueryParsingConfig, DEFAULT_QUERY_PARSING_CONFIG
+from legacy_query_parser import LegacyParser, synthetic_queries
+
+SYNTHETIC_QUERIES = 3000
+
+# Overlapping tokens, case, punctuation and rule-order corner cases
+EDGE_CASES = [
+    "",
+    "Who is the best Java developer?",
+    "JavaScript or Java? list all of them",
+    "find all sr. C++ and C# engineers with 10+ yrs",
+    "Show me a staff engineer who knows node.js and Node",
+    "compare the top tech lead vs the team lead",
+    "why is the principal architect the strongest?",
+    "mid-level golang dev, at least 3 years of experience, 12yrs preferred",
+    "entry-level intern with React/Redux and TypeScript",
+    "explain the difference between .NET and dotnet",
+    "ALL SENIOR PYTHON DEVS WITH 5 YEARS",
+    "k8s, kubernetes, docker-compose and AWS",
+    "ideal candidate: 7yrs exp in Spring Boot, 2 years Kafka",
+]
+
+CUSTOM_CONFIG = QueryParsingConfig(
+    technology_synonyms={"c": "C", "c++": "C++", "c#": "C#", "go": "Go", "golang": "Go", "node": "Node", "node.js": "Node"},
+    intent_keywords={"find_best": ["best"], "list_all": ["list", "all", "list all"], "compare": ["vs", "versus"]},
+)
+CUSTOM_QUERIES = [
+    "list all C and C++ devs",
+    "go vs golang vs c#",
+    "best node.js or node developer versus all",
+    "c-level c++/c# and go-to people",
+]
+
+all_passed = True
+
+
+def check_equal(label: str, config, queries) -> None:
+    global all_passed
+    engine, legacy = QueryParser(config), LegacyParser(config)
+    mismatches = [(q, legacy.parse(q), engine.parse(q)) for q in queries if legacy.parse(q) != engine.parse(q)]
+    passed = not mismatches
+    all_passed = all_passed and passed
+    print(f"{'PASS' if passed else 'FAIL'} | {label}: {len(queries) - len(mismatches)}/{len(queries)} identical")
+    for query, expected, actual in mismatches[:5]:
+        print(f"       {query!r}\n         legacy: {expected}\n         engine: {actual}")
+
+
+print("=" * 70)
+print("QUERY PARSING ENGINE VS LEGACY TEST")
+print("=" * 70)
+
+check_equal("edge cases", DEFAULT_QUERY_PARSING_CONFIG, EDGE_CASES)
+check_equal("synthetic recruiter queries", DEFAULT_QUERY_PARSING_CONFIG, synthetic_queries(SYNTHETIC_QUERIES, seed=7))
+check_equal("overlapping tokens in a custom config", CUSTOM_CONFIG, CUSTOM_QUERIES)
+
+print("=" * 70)
+if all_passed:
+    print("ALL TESTS PASSED")
+else:
+    print("SOME TESTS FAILED")
+    sys.exit(1)
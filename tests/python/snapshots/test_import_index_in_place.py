@@ -0,0 +1,158 @@
+"""
+Validation script for import-index without blue/green.
+Tests that the snapshot replaces the live collection's points and manifests,
+and that a snapshot that fails to load or to verify in the staging collection
+leaves the live collection and its manifests untouched.
+"""
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+sys.path.insert(0, 'src/python')
+
+import numpy as np
+
+from core.application.use_cases import index_snapshot_use_case
+from core.application.use_cases.index_snapshot_use_case import _import_in_place
+from core.domain.enums.vector_provider_type import VectorProviderType
+from core.infrastructure.shared.index_manifest import IndexManifest
+from core.infrastructure.shared.index_snapshot import IndexSnapshot, IndexSnapshotWriter
+from core.infrastructure.shared.vector_provider_factory import VectorProviderFactory
+
+PROVIDER = "NUMPY"
+NAMESPACE = "blocks"
+all_passed = True
+
+
+def check(name: str, actual, expected) -> None:
+    global all_passed
+    passed = actual == expected
+    all_passed = all_passed and passed
+    print(f"{'PASS' if passed else 'FAIL'} | {name}: {actual} (expected: {expected})")
+
+
+class FakeStore:
+    """In-memory provider; collections live in a class-level registry like collections in a real backend."""
+    collections = {}
+    fail_staging_add = False
+    lose_staging_point = False
+
+    def __init__(self, collection=None):
+        self.collection_name = collection
+        self.collections.setdefault(collection, {})
+
+    def get_provider_name(self):
+        return PROVIDER
+
+    def _points(self):
+        return self.collections.setdefault(self.collection_name, {})
+
+    def _is_staging(self):
+        return index_snapshot_use_case.STAGING_SUFFIX in self.collection_name
+
+    def add_documents(self, documents, embeddings=None, metadata=None, ids=None):
+        if self._is_staging() and self.fail_staging_add:
+            raise OSError("disk full")
+        points = self._points()
+        for point_id, document in zip(ids, documents):
+            points[point_id] = document
+        if self._is_staging() and self.lose_staging_point:
+            points.pop(ids[0])
+        return list(ids)
+
+    def delete_documents(self, ids):
+        points = self._points()
+        existing = [point_id for point_id in ids if point_id in points]
+        for point_id in existing:
+            del points[point_id]
+        return len(existing)
+
+    def flush(self):
+        pass
+
+    def count(self):
+        return len(self._points())
+
+    def drop_collection(self):
+        self.collections.pop(self.collection_name, None)
+
+    def export_points(self, batch_size=1000):
+        points = self._points()
+        ids = sorted(points)
+        yield ids, np.zeros((len(ids), 2), dtype=np.float32), [points[i] for i in ids], [{} for _ in ids]
+
+
+def write_snapshot(path: Path, ids):
+    writer = IndexSnapshotWriter(path)
+    writer.add(ids, np.ones((len(ids), 2), dtype=np.float32), [f"text {i}" for i in ids], [{} for _ in ids])
+    writer.commit(PROVIDER, "candidates", {NAMESPACE: {"a.json": {"hash": "new", "chunk_ids": list(ids)}}})
+    return IndexSnapshot(path)
+
+
+def live_store(collection):
+    live = FakeStore(collection)
+    live.collections[collection] = {"blocks:old": "old", "blocks:keep": "keep"}
+    manifest = IndexManifest.for_provider(PROVIDER, NAMESPACE, collection)
+    manifest.record("a.json", "old", ["blocks:old", "blocks:keep"])
+    manifest.save()
+    return live
+
+
+def manifest_hash(collection):
+    return IndexManifest.for_provider(PROVIDER, NAMESPACE, collection).entries()["a.json"]["hash"]
+
+
+def staging_left(collection):
+    return [name for name in FakeStore.collections if name.startswith(collection + index_snapshot_use_case.STAGING_SUFFIX)]
+
+
+print("=" * 70)
+print("IMPORT INDEX IN PLACE TEST")
+print("=" * 70)
+
+original_provider = VectorProviderFactory.get_provider_class(VectorProviderType.NUMPY)
+VectorProviderFactory.register_provider(VectorProviderType.NUMPY, FakeStore)
+index_snapshot_use_case.configured_verify_timeout = lambda: 0.0
+collection = f"import_test_{uuid.uuid4().hex[:8]}"
+try:
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = write_snapshot(Path(tmp) / "snapshot", ["blocks:keep", "blocks:new"])
+
+        live = live_store(collection)
+        FakeStore.fail_staging_add = True
+        try:
+            _import_in_place(snapshot, live, 1)
+            check("failing staging load raises", "returned", "raised")
+        except OSError:
+            check("failing staging load raises", "raised", "raised")
+        FakeStore.fail_staging_add = False
+        check("live points untouched after a failed load", sorted(live._points()), ["blocks:keep", "blocks:old"])
+        check("live manifest untouched after a failed load", manifest_hash(collection), "old")
+        check("staging dropped after a failed load", staging_left(collection), [])
+
+        FakeStore.lose_staging_point = True
+        try:
+            _import_in_place(snapshot, live, 1)
+            check("short staging count raises", "returned", "raised")
+        except RuntimeError:
+            check("short staging count raises", "raised", "raised")
+        FakeStore.lose_staging_point = False
+        check("live points untouched after a failed check", sorted(live._points()), ["blocks:keep", "blocks:old"])
+        check("staging dropped after a failed check", staging_left(collection), [])
+
+        result = _import_in_place(snapshot, live, 1)
+        check("live holds exactly the snapshot", sorted(live._points()), ["blocks:keep", "blocks:new"])
+        check("points the snapshot lacks are deleted", result["deleted"], 1)
+        check("result counts the live points", result["points"], 2)
+        check("live manifest replaced", manifest_hash(collection), "new")
+        check("staging dropped after the import", staging_left(collection), [])
+finally:
+    IndexManifest.remove_for_collection(PROVIDER, collection)
+    VectorProviderFactory.register_provider(VectorProviderType.NUMPY, original_provider)
+
+print("=" * 70)
+if all_passed:
+    print("ALL TESTS PASSED")
+else:
+    print("SOME TESTS FAILED")
+    sys.exit(1)
@@ -0,0 +1,136 @@
+"""
+Validation script for blue/green collection aliases.
+Tests alias switch and rollback against a fake Qdrant client, the refusal to
+delete a real collection without migrate, and that a failed rebuild leaves
+the alias where it was.
+"""
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, 'src/python')
+
+from core.application.services.blue_green_rebuild import BlueGreenRebuild
+from core.infrastructure.shared.collection_aliases import FileCollectionAliases, QdrantCollectionAliases
+from core.infrastructure.vectorstores.aliased_vector_store import AliasedVectorStore
+
+ALIAS = "candidates"
+all_passed = True
+
+
+def check(name: str, actual, expected) -> None:
+    global all_passed
+    passed = actual == expected
+    all_passed = all_passed and passed
+    print(f"{'PASS' if passed else 'FAIL'} | {name}: {actual} (expected: {expected})")
+
+
+class FakeQdrant:
+    def __init__(self, collections):
+        self.collections = list(collections)
+        self.aliases = {}
+
+    def list_collections(self):
+        return list(self.collections)
+
+    def get_aliases(self):
+        return dict(self.aliases)
+
+    def delete_collection(self, name):
+        if name in self.collections:
+            self.collections.remove(name)
+
+    def switch_alias(self, alias, collection):
+        self.aliases[alias] = collection
+
+
+class FakeStore:
+    def __init__(self, name):
+        self.collection_name = name
+        self.points = 0
+        self.dropped = False
+
+    def get_provider_name(self):
+        return "FAKE"
+
+    def count(self):
+        return self.points
+
+    def drop_collection(self):
+        self.dropped = True
+
+
+def refused(action) -> bool:
+    try:
+        action()
+    except RuntimeError:
+        return True
+    return False
+
+
+print("=" * 70)
+print("COLLECTION ALIASES TEST")
+print("=" * 70)
+
+# A real collection under the alias name is what the .NET API reads
+qdrant = FakeQdrant([ALIAS])
+aliases = QdrantCollectionAliases(qdrant, ALIAS)
+check("allocate refuses without migrate", refused(aliases.allocate), True)
+check("switch refuses without migrate", refused(lambda: aliases.switch(f"{ALIAS}_v1")), True)
+check("real collection is kept", qdrant.collections, [ALIAS])
+
+aliases = QdrantCollectionAliases(qdrant, ALIAS, migrate=True)
+first = aliases.allocate()
+qdrant.collections.append(first)
+aliases.switch(first)
+check("migrate replaces the real collection", qdrant.collections, [first])
+check("alias points to the first version", aliases.current(), f"{ALIAS}_v1")
+
+second = aliases.allocate()
+qdrant.collections.append(second)
+aliases.switch(second)
+check("alias points to the second version", aliases.resolve(), f"{ALIAS}_v2")
+check("versions in order", aliases.versions(), [f"{ALIAS}_v1", f"{ALIAS}_v2"])
+
+aliases.switch(first)
+check("rollback switches back", aliases.current(), f"{ALIAS}_v1")
+
+with tempfile.TemporaryDirectory() as tmp:
+    stores = {}
+
+    def open_collection(name):
+        name = name or ALIAS
+        return stores.setdefault(name, FakeStore(name))
+
+    file_aliases = FileCollectionAliases(Path(tmp) / "fake_candidates.alias.json", ALIAS)
+    store = AliasedVectorStore(open_collection, file_aliases, keep_versions=1)
+    rebuild = BlueGreenRebuild(store)
+
+    def index(staging, points=3):
+        staging.points = points
+        return {"chunks_indexed": 3}
+
+    rebuild.run(index)
+    check("verified rebuild is promoted", store.collection_name, f"{ALIAS}_v1")
+
+    def failing(staging):
+        staging.points = 1
+        raise RuntimeError("embedding service down")
+
+    check("failed rebuild raises", refused(lambda: rebuild.run(failing)), True)
+    check("failed rebuild keeps the alias", store.collection_name, f"{ALIAS}_v1")
+    check("failed version is dropped", stores[f"{ALIAS}_v2"].dropped, True)
+    check("failed version is forgotten", file_aliases.versions(), [f"{ALIAS}_v1"])
+
+    # The dropped version's name is free again
+    stores.pop(f"{ALIAS}_v2")
+    rebuild.run(index)
+    check("next rebuild is promoted", store.collection_name, f"{ALIAS}_v2")
+    check("versions past keep_versions are collected", stores[f"{ALIAS}_v1"].dropped, True)
+    check("collected versions are forgotten", file_aliases.versions(), [f"{ALIAS}_v2"])
+
+print("=" * 70)
+if all_passed:
+    print("ALL TESTS PASSED")
+else:
+    print("SOME TESTS FAILED")
+    sys.exit(1)
@@ -0,0 +1,118 @@
+"""
+Validation script for FAISS store filtering and compaction.
+Tests that filtered searches agree with matches_filter, that the selector
+cache stays bounded, and that flush() compacts deleted rows away once they
+pass compact_deleted_fraction, including after a crash mid-compaction.
+"""
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, 'src/python')
+
+import faiss
+import numpy as np
+
+from core.infrastructure.vectorstores.faiss.faiss_vector_store import (
+    COMPACT_SUFFIX, COMPACTING_SUFFIX, SELECTOR_CACHE_ENTRIES, FaissVectorStore
+)
+from core.infrastructure.vectorstores.metadata_filter import matches_filter
+
+DIMENSION = 16
+OPTIONS = {"index_type": "flat", "compact_deleted_fraction": 0.25}
+IVFPQ_OPTIONS = {"index_type": "ivfpq", "nlist": 4, "pq_m": 4, "pq_nbits": 4, "nprobe": 4, "compact_deleted_fraction": 0.25}
+
+rng = np.random.default_rng(11)
+all_passed = True
+
+
+def check(name: str, actual, expected) -> None:
+    global all_passed
+    passed = actual == expected
+    all_passed = all_passed and passed
+    print(f"{'PASS' if passed else 'FAIL'} | {name}: {actual} (expected: {expected})")
+
+
+def add(store: FaissVectorStore, start: int, count: int) -> None:
+    vectors = rng.standard_normal((count, DIMENSION)).astype(np.float32)
+    metadata = [{"skill_name": ["java", "python", 5, "5"][i % 4], "years_experience": i % 10} for i in range(start, start + count)]
+    store.add_documents([f"doc {i}" for i in range(start, start + count)], vectors.tolist(), metadata, [f"chunk-{i}" for i in range(start, start + count)])
+
+
+def found(store: FaissVectorStore, filter_metadata=None):
+    query = rng.standard_normal(DIMENSION).tolist()
+    return sorted(document for document, _, _ in store.search(query, limit=1000, filter_metadata=filter_metadata))
+
+
+def line_count(path: Path) -> int:
+    with path.open("r", encoding="utf-8") as fh:
+        return sum(1 for _ in fh)
+
+
+print("=" * 70)
+print("FAISS FILTERS AND COMPACTION TEST")
+print("=" * 70)
+
+with tempfile.TemporaryDirectory() as base_dir:
+    store = FaissVectorStore(base_dir=base_dir, collection="filters", options=OPTIONS)
+    add(store, 0, 200)
+    rows = [(f"doc {i}", {"skill_name": ["java", "python", 5, "5"][i % 4], "years_experience": i % 10}) for i in range(200)]
+    for filter_metadata in ({"skill_name": 5}, {"skill_name": "5"}, {"skill_name": {"$in": ["java", 5]}},
+                            {"$and": [{"skill_name": "python"}, {"years_experience": {"$gte": 7}}]}):
+        expected = sorted(document for document, meta in rows if matches_filter(meta, filter_metadata))
+        actual = found(store, filter_metadata)
+        check(f"matches_filter parity {filter_metadata}", (len(actual), actual == expected), (len(expected), True))
+
+    for years in range(SELECTOR_CACHE_ENTRIES * 2):
+        store.search(rng.standard_normal(DIMENSION).tolist(), limit=1, filter_metadata={"years_experience": {"$gte": years}})
+    check("selector cache stays bounded", len(store._selector_cache), SELECTOR_CACHE_ENTRIES)
+
+    store.flush()
+    store.delete_documents([f"chunk-{i}" for i in range(0, 40)])
+    store.flush()
+    check("below the fraction deleted rows stay in the index", store._index.ntotal, 200)
+    check("deleted rows are not returned", "doc 0" in found(store), False)
+
+    store.delete_documents([f"chunk-{i}" for i in range(40, 60)])
+    store.flush()
+    index_path = Path(base_dir) / "filters.index"
+    check("past the fraction the index is compacted", store._index.ntotal, 140)
+    check("rows journal compacted", line_count(Path(base_dir) / "filters.rows.jsonl"), 140)
+    check("deletion journal cleared", (Path(base_dir) / "filters.deleted").exists(), False)
+    check("searches map rows after compaction", found(store, {"skill_name": "java"}) == sorted(f"doc {i}" for i in range(60, 200) if i % 4 == 0), True)
+    add(store, 200, 10)
+    store.delete_documents(["chunk-100"])
+    store.flush()
+
+    reloaded = FaissVectorStore(base_dir=base_dir, collection="filters", options=OPTIONS)
+    check("reload after compaction", (reloaded.count(), "doc 205" in found(reloaded), "doc 100" in found(reloaded)), (149, True, False))
+    del reloaded
+
+    # A compaction that crashed after its marker is finished on load; one without the marker is discarded
+    stale_rows = Path(base_dir) / f"filters.rows.jsonl{COMPACT_SUFFIX}"
+    stale_rows.write_text("garbage\n", encoding="utf-8")
+    check("unmarked compaction discarded", (FaissVectorStore(base_dir=base_dir, collection="filters", options=OPTIONS).count(), stale_rows.exists()), (149, False))
+
+    crashed = FaissVectorStore(base_dir=base_dir, collection="filters", options=OPTIONS)
+    crashed.delete_documents([f"chunk-{i}" for i in range(60, 120)])
+    crashed._finish_compaction = lambda: None
+    crashed.flush()
+    check("marker written before the swap", (Path(base_dir) / f"filters{COMPACTING_SUFFIX}").exists(), True)
+    del crashed
+    recovered = FaissVectorStore(base_dir=base_dir, collection="filters", options=OPTIONS)
+    check("load finishes a marked compaction", (recovered._index.ntotal, recovered.count()), (90, 90))
+    check("marker removed", (Path(base_dir) / f"filters{COMPACTING_SUFFIX}").exists(), False)
+
+    ivf = FaissVectorStore(base_dir=base_dir, collection="ivf", options=IVFPQ_OPTIONS)
+    add(ivf, 0, 16 * 39 + 100)
+    ivf.flush()
+    ivf.delete_documents([f"chunk-{i}" for i in range(300)])
+    ivf.flush()
+    check("IVF-PQ compaction keeps the trained index", (isinstance(ivf._index, faiss.IndexIVFPQ), ivf._index.ntotal), (True, 16 * 39 + 100 - 300))
+    check("IVF-PQ search after compaction", "doc 0" in found(ivf), False)
+
+print("=" * 70)
+if all_passed:
+    print("ALL TESTS PASSED")
+else:
+    print("SOME TESTS FAILED")
+    sys.exit(1)
@@ -0,0 +1,77 @@
+"""
+Validation script for the FAISS store's IVF-PQ training threshold.
+The store serves from a flat index until it holds enough vectors to train
+IVF-PQ with the configured nlist, and only flush() makes writes durable.
+"""
+import sys
+import tempfile
+sys.path.insert(0, 'src/python')
+
+import faiss
+import numpy as np
+
+from core.infrastructure.vectorstores.faiss.faiss_vector_store import FaissVectorStore
+
+DIMENSION = 16
+BATCH_SIZE = 100
+OPTIONS = {"index_type": "ivfpq", "nlist": 4, "pq_m": 4, "pq_nbits": 4, "nprobe": 4}
+# max(nlist, 2 ** pq_nbits) * 39 points per centroid
+THRESHOLD = 16 * 39
+
+rng = np.random.default_rng(7)
+all_passed = True
+
+
+def check(name: str, passed: bool, detail: str = "") -> None:
+    global all_passed
+    all_passed = all_passed and passed
+    print(f"{'PASS' if passed else 'FAIL'} | {name}{f' ({detail})' if detail else ''}")
+
+
+def add(store: FaissVectorStore, start: int, count: int) -> None:
+    vectors = rng.standard_normal((count, DIMENSION)).astype(np.float32)
+    ids = [f"chunk-{i}" for i in range(start, start + count)]
+    store.add_documents([f"doc {i}" for i in range(start, start + count)], vectors.tolist(), [{"n": i} for i in range(start, start + count)], ids)
+
+
+print("=" * 70)
+print("FAISS IVF-PQ TRAINING TEST")
+print("=" * 70)
+
+with tempfile.TemporaryDirectory() as base_dir:
+    store = FaissVectorStore(base_dir=base_dir, collection="train", options=OPTIONS)
+
+    added = 0
+    while added + BATCH_SIZE < THRESHOLD:
+        add(store, added, BATCH_SIZE)
+        added += BATCH_SIZE
+    check("flat below the threshold", not isinstance(store._index, faiss.IndexIVF), f"{added} vectors")
+
+    add(store, added, BATCH_SIZE)
+    added += BATCH_SIZE
+    trained = isinstance(store._index, faiss.IndexIVF)
+    check("IVF-PQ once the threshold is reached", trained, f"{added} vectors")
+    check("trained with the configured nlist", trained and store._index.nlist == OPTIONS["nlist"],
+          f"nlist={store._index.nlist if trained else None}")
+    check("every vector moved into the trained index", store._index.ntotal == added and store.count() == added)
+    check("search still answers", len(store.search(rng.standard_normal(DIMENSION).tolist(), limit=5)) == 5)
+
+    store.flush()
+    add(store, added, BATCH_SIZE)
+
+    reopened = FaissVectorStore(base_dir=base_dir, collection="train", options=OPTIONS)
+    check("reopened store keeps IVF-PQ", isinstance(reopened._index, faiss.IndexIVF))
+    check("adds after the last flush are not committed", reopened.count() == added, f"count={reopened.count()}")
+    hits = reopened.search(rng.standard_normal(DIMENSION).tolist(), limit=3, filter_metadata={"n": 5})
+    check("rows journal lines up with the index", [meta["n"] for _, meta, _ in hits] == [5])
+
+    mismatched = FaissVectorStore(base_dir=base_dir, collection="mismatch", options={**OPTIONS, "pq_m": 5})
+    add(mismatched, 0, THRESHOLD)
+    check("pq_m not dividing the dimension keeps a flat index", not isinstance(mismatched._index, faiss.IndexIVF))
+
+print("=" * 70)
+if all_passed:
+    print("ALL TESTS PASSED")
+else:
+    print("SOME TESTS FAILED")
+    sys.exit(1)
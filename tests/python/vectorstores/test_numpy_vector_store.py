@@ -0,0 +1,99 @@
+"""
+Validation script for the NumPy vector store.
+Tests that column filters agree with matches_filter on typed values, that
+growing never replaces a file that is still memory-mapped, and that stale
+column files are removed once state.json moves on.
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, 'src/python')
+
+from core.infrastructure.vectorstores import metadata_filter
+from core.infrastructure.vectorstores.numpy_store import numpy_vector_store
+from core.infrastructure.vectorstores.numpy_store.numpy_vector_store import INITIAL_CAPACITY, NumpyVectorStore
+
+all_passed = True
+
+
+def check(name: str, actual, expected) -> None:
+    global all_passed
+    passed = actual == expected
+    all_passed = all_passed and passed
+    print(f"{'PASS' if passed else 'FAIL'} | {name}: {actual} (expected: {expected})")
+
+
+def matched(store, filter_metadata):
+    return sorted(document for document, _, _ in store.search([1.0, 0.0], limit=100, filter_metadata=filter_metadata))
+
+
+def expected(rows, filter_metadata):
+    return sorted(document for document, meta in rows if metadata_filter.matches_filter(meta, filter_metadata))
+
+
+replaced_mapped = []
+original_replace = os.replace
+
+
+def recording_replace(src, dst):
+    if Path(dst).suffix == ".npy" and Path(dst).exists():
+        replaced_mapped.append(Path(dst).name)
+    original_replace(src, dst)
+
+
+numpy_vector_store.os.replace = recording_replace
+
+print("=" * 70)
+print("NUMPY VECTOR STORE TEST")
+print("=" * 70)
+
+with tempfile.TemporaryDirectory() as tmp:
+    store = NumpyVectorStore(base_dir=Path(tmp), collection="typed")
+    rows = [
+        ("int five", {"seniority_level": 5, "skill_name": "java"}),
+        ("string five", {"seniority_level": "5", "skill_name": "Java"}),
+        ("float five", {"seniority_level": 5.0, "skill_name": "java"}),
+        ("true", {"seniority_level": True}),
+        ("missing", {"skill_name": "python"}),
+        ("list", {"seniority_level": ["5", 5]}),
+    ]
+    store.add_documents([r[0] for r in rows], [[1.0, 0.0]] * len(rows), [r[1] for r in rows])
+
+    filters = [
+        {"seniority_level": 5},
+        {"seniority_level": "5"},
+        {"seniority_level": 1},
+        {"seniority_level": None},
+        {"seniority_level": ["5", 5]},
+        {"seniority_level": {"$in": ["5", None]}},
+        {"skill_name": "java"},
+        {"$and": [{"skill_name": "java"}, {"seniority_level": 5}]},
+    ]
+    for filter_metadata in filters:
+        check(f"matches_filter parity {filter_metadata}", matched(store, filter_metadata), expected(rows, filter_metadata))
+
+    store.flush()
+    reloaded = NumpyVectorStore(base_dir=Path(tmp), collection="typed")
+    check("typed vocabulary survives a reload", matched(reloaded, {"seniority_level": "5"}), ["string five"])
+    del reloaded
+
+    count = INITIAL_CAPACITY + 10
+    store.add_documents([f"doc {i}" for i in range(count)], [[0.0, 1.0]] * count, [{"type": "block"}] * count)
+    check("growing never replaces a mapped column file", replaced_mapped, [])
+    columns_before = sorted(path.name for path in (Path(tmp) / "typed").glob("vectors.*.npy"))
+    check("both generations exist until the commit", len(columns_before), 2)
+    store.flush()
+    columns_after = sorted(path.name for path in (Path(tmp) / "typed").glob("vectors.*.npy"))
+    check("old generation removed after the commit", columns_after, [f"vectors.{INITIAL_CAPACITY * 2}.npy"])
+
+    grown = NumpyVectorStore(base_dir=Path(tmp), collection="typed")
+    check("grown store reloads every point", grown.count(), len(rows) + count)
+    check("grown store still filters", len(matched(grown, {"type": "block"})), 100)
+
+print("=" * 70)
+if all_passed:
+    print("ALL TESTS PASSED")
+else:
+    print("SOME TESTS FAILED")
+    sys.exit(1)
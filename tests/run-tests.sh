@@ -20,6 +20,21 @@ python_tests=(
     "tests/python/parity/test_fullname_parity.py"
     "tests/python/parity/test_parity.py"
     "tests/python/normalization/test_normalization.py"
+    "tests/python/indexing/test_index_manifest_plan.py"
+    "tests/python/indexing/test_sync_count_failure.py"
+    "tests/python/indexing/test_chunk_ids.py"
+    "tests/python/vectorstores/test_faiss_ivfpq_training.py"
+    "tests/python/vectorstores/test_numpy_vector_store.py"
+    "tests/python/vectorstores/test_faiss_filters_and_compaction.py"
+    "tests/python/vectorstores/test_collection_aliases.py"
+    "tests/python/parsing/test_query_parsing_engine.py"
+    "tests/python/normalization/test_normalization_order.py"
+    "tests/python/caching/test_response_cache.py"
+    "tests/python/caching/test_llm_response_cache.py"
+    "tests/python/caching/test_parsed_query_cache.py"
+    "tests/python/context/test_context_assembler.py"
+    "tests/python/llm/test_structured_stream_retry.py"
+    "tests/python/snapshots/test_import_index_in_place.py"
 )
 
 for test in "${python_tests[@]}"; do